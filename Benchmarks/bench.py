@@ -0,0 +1,315 @@
+# End-to-end benchmarks against the local fake VRChat API
+#
+#   python Benchmarks/bench.py --output results.json
+#   python Benchmarks/bench.py --baseline Benchmarks/baseline.json
+#   python Benchmarks/bench.py --save-baseline Benchmarks/baseline.json
+#
+# Benchmarks/baseline.json is a committed full run, refresh it with
+# --save-baseline when a change is expected. Every metric is the median of
+# --repeat runs. --quick runs are for smoke testing and too noisy to compare.
+#
+# Metrics ending in _per_s are better when higher; _s, _ms and request counts
+# are better when lower. Other values are informational and not compared,
+# like latencies of event runs the client couldn't keep up with.
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sys
+import time
+
+# Run from a checkout without installing vrcpy or setting PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vrcpy  # noqa: E402
+from vrcpy.fakeserver import FakeServer  # noqa: E402
+
+# Median of 3 full runs on an unchanged tree varied by up to 37% for wall
+# times, throughput and p50 latencies, and 160% for p99 latencies
+THRESHOLD = 0.5
+TAIL_THRESHOLD = 2.0
+
+
+def percentile(values, p):
+    if not values:
+        return None
+
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def total_requests(server):
+    return sum(server.requests.values())
+
+
+async def bench_login(friends, favorites):
+    server = FakeServer(friends=friends, favorites=favorites)
+    await server.start()
+
+    client = vrcpy.Client()
+    server.attach(client)
+
+    start = time.perf_counter()
+    await client.login("bench", "bench")
+    elapsed = time.perf_counter() - start
+
+    requests = total_requests(server)
+    cached = sum(len(client.friends[state]) for state in client.friends)
+
+    await client.logout()
+    await server.close()
+
+    return {
+        "wall_s": elapsed,
+        "requests": requests,
+        "friends_cached": cached
+    }
+
+
+async def bench_events(rate, duration, friends):
+    server = FakeServer(friends=friends, favorites=0)
+    await server.start()
+
+    client = vrcpy.Client()
+    server.attach(client)
+    await client.login("bench", "bench")
+
+    latencies = []
+    done = []
+
+    @client.event
+    async def on_friend_location(before, after):
+        now = time.perf_counter()
+        latencies.append(now - after.raw["benchSentAt"])
+        done.append(now)
+
+    ws_task = asyncio.ensure_future(client.start())
+    while not server.sockets:
+        await asyncio.sleep(0.01)
+
+    users = list(server.users.values())
+    count = int(rate * duration)
+    tick = 0.01
+    per_tick = max(1, int(rate * tick))
+
+    start = time.perf_counter()
+    sent = 0
+    while sent < count:
+        for _ in range(min(per_tick, count - sent)):
+            user = dict(users[sent % len(users)])
+            user["benchSentAt"] = time.perf_counter()
+
+            await server.push_event("friend-location", {
+                "userId": user["id"],
+                "user": user,
+                "location": user["location"],
+                "instance": user["instanceId"],
+                "world": None
+            })
+            sent += 1
+
+        # Pace to the target rate
+        ahead = start + sent / rate - time.perf_counter()
+        if ahead > 0:
+            await asyncio.sleep(ahead)
+
+    deadline = time.perf_counter() + max(5, duration)
+    while len(done) < count and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+
+    elapsed = (done[-1] if done else time.perf_counter()) - start
+
+    client.logout_intent = True
+    await client.logout()
+    ws_task.cancel()
+    await server.close()
+
+    throughput = len(done) / elapsed if elapsed > 0 else None
+
+    return {
+        "sent": count,
+        "handled": len(done),
+        # Events queue up when the client can't keep up, latency then
+        # measures the backlog and isn't compared
+        "saturated": not throughput or throughput < rate * 0.95,
+        "throughput_per_s": throughput,
+        "latency_p50_ms": (percentile(latencies, 50) or 0) * 1000,
+        "latency_p99_ms": (percentile(latencies, 99) or 0) * 1000
+    }
+
+
+async def bench_objects(iterations):
+    server = FakeServer(friends=100, worlds=100, avatars=100, favorites=0)
+    client = vrcpy.Client()
+
+    users = list(server.users.values())
+    worlds = []
+    for world in server.worlds.values():
+        # No instances, so World doesn't start caching them
+        world = dict(world)
+        world["instances"] = []
+        worlds.append(world)
+    avatars = list(server.avatars.values())
+
+    results = {}
+    for name, cls, payloads in (("user", vrcpy.User, users),
+                                ("world", vrcpy.World, worlds),
+                                ("avatar", vrcpy.Avatar, avatars)):
+        start = time.perf_counter()
+        for i in range(iterations):
+            cls(client, payloads[i % len(payloads)], client.loop)
+        elapsed = time.perf_counter() - start
+
+        # Let scheduled __cinit__ tasks finish outside the timed section
+        await asyncio.sleep(0)
+
+        results[name] = {"objects_per_s": iterations / elapsed}
+
+    return results
+
+
+async def run(quick):
+    sizes = [100, 1000] if quick else [100, 1000, 5000]
+    rates = [10, 100, 1000] if quick else [10, 100, 1000, 10000]
+    duration = 1 if quick else 2
+
+    results = {}
+    for friends in sizes:
+        logging.info("Login with %s friends" % friends)
+        results["login_%s_friends" % friends] = await bench_login(friends, 500)
+
+    for rate in rates:
+        logging.info("Events at %s/s" % rate)
+        results["events_%s_per_s" % rate] = await bench_events(
+            rate, duration, 1000)
+
+    logging.info("Object construction")
+    objects = await bench_objects(2000 if quick else 20000)
+    for name, result in objects.items():
+        results["construct_%s" % name] = result
+
+    return results
+
+
+def median_results(runs):
+    """Per-metric median of several ``run`` results"""
+
+    results = {}
+    for name in runs[0]:
+        results[name] = {}
+        for metric, value in runs[0][name].items():
+            values = [r[name][metric] for r in runs]
+            if isinstance(value, (int, float)) and None not in values:
+                value = sorted(values)[len(values) // 2]
+
+            results[name][metric] = value
+
+    return results
+
+
+def compare(results, baseline, threshold, tail_threshold):
+    regressions = []
+
+    print("%-28s %-20s %14s %14s %9s" % (
+        "benchmark", "metric", "baseline", "current", "change"))
+
+    for name in results:
+        saturated = results[name].get("saturated") \
+            or baseline.get(name, {}).get("saturated")
+
+        for metric, value in results[name].items():
+            if not metric.endswith(("_s", "_ms")) and metric != "requests":
+                continue
+
+            if saturated and metric.endswith("_ms"):
+                continue
+
+            old = baseline.get(name, {}).get(metric)
+            if not isinstance(value, (int, float)) or not old:
+                continue
+
+            # Request counts don't vary between runs, any increase counts
+            limit = threshold
+            if metric == "requests":
+                limit = 0
+            elif metric.endswith("_p99_ms"):
+                limit = tail_threshold
+
+            change = (value - old) / old
+            worse = -change if metric.endswith("_per_s") else change
+            flag = ""
+            if worse > limit:
+                flag = " REGRESSION"
+                regressions.append((name, metric))
+
+            print("%-28s %-20s %14.4f %14.4f %+8.1f%%%s" % (
+                name, metric, old, value, change * 100, flag))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="vrcpy benchmarks")
+    parser.add_argument("--output", help="File to write results JSON to")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument("--save-baseline", help="Also write results here")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="Relative change counted as a regression")
+    parser.add_argument("--tail-threshold", type=float,
+                        default=TAIL_THRESHOLD,
+                        help="Relative change of p99 latencies counted as a regression")
+    parser.add_argument("--quick", action="store_true",
+                        help="Smaller sizes and rates")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs to take the median of each metric over")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+    loop = asyncio.get_event_loop()
+    results = median_results([
+        loop.run_until_complete(run(args.quick))
+        for _ in range(max(args.repeat, 1))])
+
+    output = {
+        "meta": {
+            "vrcpy": vrcpy.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "quick": args.quick,
+            "repeat": args.repeat
+        },
+        "results": results
+    }
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(output, f, indent=2)
+
+    if args.output is None:
+        print(json.dumps(output, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        if baseline["meta"].get("quick") != args.quick:
+            print("warning: baseline quick=%s, this run quick=%s" % (
+                baseline["meta"].get("quick"), args.quick))
+
+        baseline = baseline["results"]
+        regressions = compare(
+            results, baseline, args.threshold, args.tail_threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import sys
 import asyncio
 import vrcpy
 
@@ -29,7 +30,9 @@ class CurrentUser(vrcpy.user.CurrentUser):
     def _assign(self, obj):
         pass
 
-client = vrcpy.Client()
+# Pass a recording to run offline: python obj-test.py session.jsonl.gz
+client = vrcpy.Client(replayer=vrcpy.replay.Replayer(
+    sys.argv[1], latency="none") if len(sys.argv) > 1 else None)
 loop = asyncio.get_event_loop()
 
 def test(vrc_py, vrc_sdk):
@@ -87,7 +90,7 @@ async def tests():
     u_obj = await client.request.get("/users/usr_54306e0b-5855-44e2-ac7f-8913a8882a90")
     cu_obj = await client.request.get("/auth/user")
 
-    test(a, a_obj["data"][0)
+    test(a, a_obj["data"][0])
     test(w, w_obj["data"])
     test(lu, lu_obj["data"][0])
     test(u, u_obj["data"])
@@ -0,0 +1,96 @@
+import pytest
+
+import vrcpy.cache
+from vrcpy.cache import ResponseCache
+from vrcpy.request import request_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(vrcpy.cache, "time", clock)
+    return clock
+
+
+def response(status=200, data=None):
+    return {"status": status, "response": None, "data": data,
+            "not_modified": False}
+
+
+def test_fresh_then_stale_then_expired(clock):
+    cache = ResponseCache(ttls={"/users/{id}": 60}, stale_ttl=30)
+    key = request_key("/users/usr_1")
+    resp = response(data={"id": "usr_1"})
+
+    cache.set(key, resp)
+    assert cache.get(key) == (resp, True)
+
+    clock.now += 60
+    assert cache.get(key) == (resp, True)
+
+    # Served stale while it's revalidated
+    clock.now += 1
+    assert cache.get(key) == (resp, False)
+
+    clock.now += 30
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_negative_caching(clock):
+    cache = ResponseCache(ttls={"/users/{id}": 60}, negative_ttl=5,
+                          stale_ttl=0)
+    key = request_key("/users/usr_missing")
+
+    cache.set(key, response(404))
+    assert cache.get(key)[1]
+
+    clock.now += 6
+    assert cache.get(key) is None
+
+    cache = ResponseCache(ttls={"/users/{id}": 60}, negative_ttl=None)
+    cache.set(key, response(404))
+    assert cache.get(key) is None
+
+
+def test_only_cacheable_responses(clock):
+    cache = ResponseCache(ttls={"/users/{id}": 60})
+
+    cache.set(request_key("/worlds/wrld_1"), response())
+    cache.set(request_key("/users/usr_1"), response(500))
+
+    assert len(cache) == 0
+
+
+def test_params_are_part_of_the_key(clock):
+    cache = ResponseCache(ttls={"/users/{id}": 60})
+    cache.set(request_key("/users/usr_1", {"a": 1, "apiKey": "x"}),
+              response(data=1))
+
+    assert cache.get(request_key("/users/usr_1", {"a": "1"}))[0]["data"] == 1
+    assert cache.get(request_key("/users/usr_1")) is None
+
+
+def test_lru_eviction_and_invalidate(clock):
+    cache = ResponseCache(ttls={"/users/{id}": 60}, max_size=2)
+    keys = [request_key("/users/usr_%s" % i) for i in range(3)]
+
+    cache.set(keys[0], response())
+    cache.set(keys[1], response())
+    cache.get(keys[0])
+    cache.set(keys[2], response())
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+
+    cache.invalidate("/users/usr_0")
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) is not None
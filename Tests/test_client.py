@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+import vrcpy
+from vrcpy.cache import ResponseCache
+from vrcpy.errors import RequestErrors
+from vrcpy.fakeserver import FakeServer
+
+MISSING = "usr_00000000-0000-0000-0000-000000000000"
+
+
+def run(test, **kwargs):
+    async def main():
+        server = FakeServer(friends=5)
+        await server.start()
+
+        client = vrcpy.Client(**kwargs)
+        server.attach(client)
+
+        try:
+            await client.login("username", "password")
+            await test(client, server)
+            await client.logout()
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("cache", [None, ResponseCache])
+def test_fetch_users_not_found_per_id(cache):
+    async def test(client, server):
+        ids = list(server.users)[:2] + [MISSING]
+        result = await client.fetch_users(ids)
+
+        assert [user.id for user in result[:2]] == ids[:2]
+        assert result[2] is None
+        assert list(result.errors) == [MISSING]
+
+        error = result.errors[MISSING]
+        assert isinstance(error, RequestErrors.NotFound)
+        assert error.status == 404
+
+        # A cached 404 raises the same way
+        with pytest.raises(RequestErrors.NotFound):
+            await client.fetch_user(MISSING)
+
+    run(test, cache=cache() if cache else None)
+
+
+def test_cached_404_skips_the_server():
+    async def test(client, server):
+        for _ in range(2):
+            with pytest.raises(RequestErrors.NotFound):
+                await client.fetch_user(MISSING)
+
+        assert server.requests["GET /users/{id}"] == 1
+
+    run(test, cache=ResponseCache())
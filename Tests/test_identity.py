@@ -0,0 +1,98 @@
+import asyncio
+import gc
+
+import pytest
+
+import vrcpy
+from vrcpy.errors import ObjectErrors
+from vrcpy.fakeserver import FakeServer
+
+
+def run(test, **kwargs):
+    async def main():
+        server = FakeServer(friends=5)
+        client = vrcpy.Client(**kwargs)
+        user = next(iter(server.users.values()))
+
+        await test(client, server._limited(user), dict(user))
+        await client.request.close_session()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"compact": True}, {"lazy": True}])
+def test_same_id_same_object(kwargs):
+    async def test(client, limited, full):
+        identities = client.identities
+        first = identities.build("users", vrcpy.LimitedUser, client, limited)
+
+        moved = dict(limited, location="wrld_1:1")
+        second, changes = identities.update(
+            "users", vrcpy.LimitedUser, client, moved)
+
+        assert second is first
+        assert changes == {"location": (limited["location"], "wrld_1:1")}
+        assert first.location == "wrld_1:1"
+        assert identities.get("users", limited["id"]) is first
+
+    run(test, **kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"compact": True}, {"lazy": True}])
+def test_upgrade_in_place(kwargs):
+    async def test(client, limited, full):
+        identities = client.identities
+        user = identities.build("users", vrcpy.LimitedUser, client, limited)
+
+        del full["date_joined"]
+        upgraded, changes = identities.update(
+            "users", vrcpy.User, client, full)
+
+        assert upgraded is user
+        assert isinstance(user, vrcpy.User)
+        assert isinstance(user, client.model_class(vrcpy.User))
+        # Fields new to the class aren't changes, missing ones are None
+        assert "state" not in changes
+        assert user.state == full["state"]
+        assert user.date_joined is None
+
+        # Building it as a limited user again doesn't downgrade it
+        same = identities.build("users", vrcpy.LimitedUser, client, limited)
+        assert same is user
+        assert isinstance(same, vrcpy.User)
+
+    run(test, **kwargs)
+
+
+def test_objects_are_held_weakly():
+    async def test(client, limited, full):
+        identities = client.identities
+        identities.build("users", vrcpy.LimitedUser, client, limited)
+        gc.collect()
+
+        assert identities.get("users", limited["id"]) is None
+        assert len(identities) == 0
+
+    run(test)
+
+
+def test_missing_id():
+    async def test(client, limited, full):
+        del limited["id"]
+
+        with pytest.raises(ObjectErrors.IntegretyError):
+            client.identities.build(
+                "users", vrcpy.LimitedUser, client, limited)
+
+    run(test)
+
+
+def test_eager_objects_raise_for_missing_attributes():
+    async def test(client, limited, full):
+        del full["fallbackAvatar"]
+        user = vrcpy.User(client, full)
+
+        with pytest.raises(AttributeError):
+            user.fallback_avatar
+
+    run(test)
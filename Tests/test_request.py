@@ -0,0 +1,188 @@
+import random
+
+import pytest
+
+import vrcpy.request
+from vrcpy.errors import VRChatErrors
+from vrcpy.request import TokenBucket, RateLimiter, RetryPolicy, \
+    CircuitBreaker
+
+
+class Clock:
+    """Stands in for the time module of vrcpy.request"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(vrcpy.request, "time", clock)
+    return clock
+
+
+def test_token_bucket_refills_at_rate(clock):
+    bucket = TokenBucket(rate=2, per=1.0)
+    bucket.tokens -= 2
+
+    assert bucket.delay() == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert bucket.delay() == 0
+    assert bucket.tokens == pytest.approx(1)
+
+    clock.now += 10
+    bucket.delay()
+    assert bucket.tokens == 2
+
+
+def test_token_bucket_block(clock):
+    bucket = TokenBucket()
+    bucket.block(3)
+
+    assert bucket.delay() == pytest.approx(3)
+
+    # A shorter block doesn't cut an existing one
+    bucket.block(1)
+    assert bucket.delay() == pytest.approx(3)
+
+    clock.now += 3
+    assert bucket.delay() == 0
+
+
+def test_rate_limiter_blocks_only_the_route(clock):
+    limiter = RateLimiter()
+
+    assert limiter.update("/users/usr_1", 429, {"Retry-After": "3"}) == 3
+    assert limiter._buckets("/users/usr_2")[0].delay() == pytest.approx(3)
+    assert limiter.global_bucket.delay() == 0
+    assert max(b.delay() for b in limiter._buckets("/worlds/wrld_1")) == 0
+
+
+def test_rate_limiter_global_limit(clock):
+    limiter = RateLimiter(route_limits={"/users/{id}": (10, 1)})
+
+    limiter.update("/users/usr_1", 429, {
+        "Retry-After": "2", "X-RateLimit-Global": "true"})
+
+    assert limiter.global_bucket.delay() == pytest.approx(2)
+    assert limiter.route_buckets["/users/{id}"].delay() == 0
+
+
+def test_rate_limiter_default_retry_after(clock):
+    limiter = RateLimiter(default_retry_after=5)
+
+    assert limiter.update("/users/usr_1", 200, {}) == 0
+    assert limiter.update("/users/usr_1", 429, {}) == 5
+
+
+def test_retry_delay_bounds():
+    policy = RetryPolicy(backoff=0.5, max_backoff=4)
+    random.seed(0)
+
+    for attempt in range(10):
+        bound = min(4, 0.5 * 2 ** attempt)
+        delays = [policy.delay(attempt) for _ in range(200)]
+
+        assert all(0 <= delay <= bound for delay in delays)
+        # Full jitter spreads over the whole range
+        assert max(delays) > bound * 0.8
+
+
+def test_retry_rules():
+    policy = RetryPolicy(retries=2)
+
+    assert policy.should_retry("GET", "/users/usr_1", 0, status=503)
+    assert policy.should_retry("GET", "/users/usr_1", 1, status=502)
+    assert not policy.should_retry("GET", "/users/usr_1", 2, status=503)
+    assert not policy.should_retry("GET", "/users/usr_1", 0, status=404)
+    assert not policy.should_retry("POST", "/users/usr_1", 0, status=503)
+    assert not policy.should_retry("PUT", "/favorites", 0, status=503)
+
+
+def test_retry_budget():
+    policy = RetryPolicy(retries=5, budget_ratio=0.5, budget_max=2)
+
+    assert policy.should_retry("GET", "/users/usr_1", 0, status=503)
+    assert policy.should_retry("GET", "/users/usr_1", 0, status=503)
+    assert not policy.should_retry("GET", "/users/usr_1", 0, status=503)
+
+    # Each request earns back part of a retry
+    policy.record_request()
+    assert not policy.should_retry("GET", "/users/usr_1", 0, status=503)
+    policy.record_request()
+    assert policy.should_retry("GET", "/users/usr_1", 0, status=503)
+
+    for _ in range(100):
+        policy.record_request()
+    assert policy.budget == 2
+
+
+def test_breaker_opens_and_recovers(clock):
+    breaker = CircuitBreaker(
+        threshold=0.5, min_requests=4, window=30, cooldown=10)
+    changes = []
+    breaker.listeners.append(
+        lambda circuit, old, new: changes.append((circuit, old, new)))
+
+    for failed in (False, True, False):
+        breaker.before("api", "/users/usr_1")
+        breaker.record("api", "/users/usr_1", failed)
+    assert breaker.state("api") == CircuitBreaker.CLOSED
+
+    breaker.before("api", "/users/usr_1")
+    breaker.record("api", "/users/usr_1", True)
+    assert breaker.state("api") == CircuitBreaker.OPEN
+    assert breaker.state("/users/{id}") == CircuitBreaker.OPEN
+    assert ("api", "closed", "open") in changes
+
+    with pytest.raises(VRChatErrors.CircuitOpen):
+        breaker.before("api", "/worlds/wrld_1")
+
+    # Half-open after the cooldown, with one probe at a time
+    clock.now += 10
+    breaker.before("api", "/users/usr_1")
+    assert breaker.state("api") == CircuitBreaker.HALF_OPEN
+    with pytest.raises(VRChatErrors.CircuitOpen):
+        breaker.before("api", "/users/usr_1")
+
+    breaker.record("api", "/users/usr_1", False)
+    assert breaker.state("api") == CircuitBreaker.CLOSED
+    assert breaker.state("/users/{id}") == CircuitBreaker.CLOSED
+
+
+def test_breaker_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(min_requests=1, cooldown=10)
+
+    breaker.before("api", "/auth/user")
+    breaker.record("api", "/auth/user", True)
+    assert breaker.state("api") == CircuitBreaker.OPEN
+
+    clock.now += 10
+    breaker.before("api", "/auth/user")
+    breaker.record("api", "/auth/user", True)
+    assert breaker.state("api") == CircuitBreaker.OPEN
+
+    with pytest.raises(VRChatErrors.CircuitOpen):
+        breaker.before("api", "/auth/user")
+
+
+def test_breaker_forgets_old_failures(clock):
+    breaker = CircuitBreaker(min_requests=4, window=30)
+
+    for _ in range(3):
+        breaker.before("api", "/auth/user")
+        breaker.record("api", "/auth/user", True)
+
+    clock.now += 31
+    breaker.before("api", "/auth/user")
+    breaker.record("api", "/auth/user", True)
+
+    assert breaker.state("api") == CircuitBreaker.CLOSED
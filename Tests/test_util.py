@@ -0,0 +1,102 @@
+import asyncio
+
+from vrcpy.util import full_paginate, BulkFetch
+
+
+class Pages:
+    """Paged listing of ``size`` items, recording requested offsets"""
+
+    def __init__(self, size):
+        self.size = size
+        self.offsets = []
+
+    async def fetch(self, offset=0, n=100):
+        self.offsets.append(offset)
+        await asyncio.sleep(0)
+        return list(range(offset, min(offset + n, self.size)))
+
+
+def paginate(size, **kwargs):
+    pages = Pages(size)
+    items = asyncio.run(full_paginate(pages.fetch, **kwargs))
+
+    assert items == list(range(size))
+    return pages.offsets
+
+
+def test_paginate_one_page_at_a_time():
+    assert paginate(250) == [0, 100, 200]
+    assert paginate(0) == [0]
+
+
+def test_paginate_known_pages_at_once():
+    assert paginate(250, concurrency=4, total=250) == [0, 100, 200]
+    # A full last page needs one more request to see the end
+    assert paginate(300, concurrency=4, total=300) == [0, 100, 200, 300]
+
+
+def test_paginate_concurrency_limit():
+    assert paginate(450, concurrency=2, total=450) == [0, 100, 200, 300, 400]
+
+
+def test_paginate_outdated_total():
+    # Pages past the total are still followed, one at a time
+    assert paginate(450, concurrency=4, total=150) == [0, 100, 200, 300, 400]
+    # And pages the total promised but don't exist aren't all requested
+    assert paginate(50, concurrency=4, total=50) == [0]
+
+
+def collect(*args, **kwargs):
+    async def main():
+        return await BulkFetch(*args, **kwargs)
+
+    return asyncio.run(main())
+
+
+def test_bulk_fetch_errors_per_id():
+    calls = []
+
+    async def fetch(id):
+        calls.append(id)
+        await asyncio.sleep(0)
+
+        if id.startswith("bad"):
+            raise KeyError(id)
+        return id.upper()
+
+    ids = ["a", "bad1", "b", "a", "bad2"]
+    result = collect(fetch, ids, limit=2)
+
+    assert sorted(calls) == ["a", "b", "bad1", "bad2"]
+    assert result.ids == ids
+    assert list(result) == ["A", None, "B", "A", None]
+    assert set(result.errors) == {"bad1", "bad2"}
+    assert isinstance(result.errors["bad1"], KeyError)
+
+
+def test_bulk_fetch_limit():
+    running = []
+    peak = []
+
+    async def fetch(id):
+        running.append(id)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(id)
+        return id
+
+    result = collect(fetch, range(20), limit=3)
+
+    assert list(result) == list(range(20))
+    assert max(peak) == 3
+
+
+def test_bulk_fetch_iterates_as_completed():
+    async def fetch(id):
+        await asyncio.sleep(id / 100)
+        return id
+
+    async def run():
+        return [item async for item in BulkFetch(fetch, [3, 1, 2])]
+
+    assert asyncio.run(run()) == [(1, 1, None), (2, 2, None), (3, 3, None)]
@@ -18,7 +18,8 @@ extras_require = {
     'aquick': [
         'cchardet',
         'aiodns',
-        'brotlipy'
+        'brotlipy',
+        'orjson'
     ]
 }
 
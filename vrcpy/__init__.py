@@ -2,12 +2,18 @@ from vrcpy.user import *
 from vrcpy.file import *
 from vrcpy.world import *
 from vrcpy.client import *
+from vrcpy.pool import *
 from vrcpy.avatar import *
 from vrcpy.favorite import *
 from vrcpy.moderation import *
 from vrcpy.notification import *
 
 import vrcpy.util
+import vrcpy.cache
+import vrcpy.compact
+import vrcpy.lazy
+import vrcpy.identity
+import vrcpy.replay
 import vrcpy.errors
 
 __title__ = "vrcpy"
@@ -45,75 +45,75 @@ class Avatar(BaseObject):
         Release status of avatar
     """
 
+    required = {
+        "name": {
+            "dict_key": "name",
+            "type": str
+        },
+        "description": {
+            "dict_key": "description",
+            "type": str
+        },
+        "id": {
+            "dict_key": "id",
+            "type": str
+        },
+        "author_name": {
+            "dict_key": "authorName",
+            "type": str
+        },
+        "author_id": {
+            "dict_key": "authorId",
+            "type": str
+        },
+        "tags": {
+            "dict_key": "tags",
+            "type": list
+        },
+        "version": {
+            "dict_key": "version",
+            "type": str
+        },
+        "featured": {
+            "dict_key": "featured",
+            "type": str
+        },
+        "created_at": {
+            "dict_key": "created_at",
+            "type": str
+        },
+        "updated_at": {
+            "dict_key": "updated_at",
+            "type": str
+        },
+        "release_status": {
+            "dict_key": "releaseStatus",
+            "type": str
+        },
+        "image_url": {
+            "dict_key": "imageUrl",
+            "type": str
+        },
+        "thumbnail_image_url": {
+            "dict_key": "thumbnailImageUrl",
+            "type": str
+        }
+    }
+
+    optional = {
+        "favorite_group_name": {
+            "dict_key": "favoriteGroup",
+            "type": str
+        },
+        "favorite_id": {
+            "dict_key": "favoriteId",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, loop=loop)
 
-        self.required.update({
-            "name": {
-                "dict_key": "name",
-                "type": str
-            },
-            "description": {
-                "dict_key": "description",
-                "type": str
-            },
-            "id": {
-                "dict_key": "id",
-                "type": str
-            },
-            "author_name": {
-                "dict_key": "authorName",
-                "type": str
-            },
-            "author_id": {
-                "dict_key": "authorId",
-                "type": str
-            },
-            "tags": {
-                "dict_key": "tags",
-                "type": list
-            },
-            "version": {
-                "dict_key": "version",
-                "type": str
-            },
-            "featured": {
-                "dict_key": "featured",
-                "type": str
-            },
-            "created_at": {
-                "dict_key": "created_at",
-                "type": str
-            },
-            "updated_at": {
-                "dict_key": "updated_at",
-                "type": str
-            },
-            "release_status": {
-                "dict_key": "releaseStatus",
-                "type": str
-            },
-            "image_url": {
-                "dict_key": "imageUrl",
-                "type": str
-            },
-            "thumbnail_image_url": {
-                "dict_key": "thumbnailImageUrl",
-                "type": str
-            }
-        })
-
-        self.optional.update({
-            "favorite_group_name": {
-                "dict_key": "favoriteGroup",
-                "type": str
-            },
-            "favorite_id": {
-                "dict_key": "favoriteId",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
     async def favorite(self):
@@ -155,4 +155,4 @@ class Avatar(BaseObject):
         logging.debug("Setting current avatar to " + self.id)
 
         await self.client.request.put(
-            "/avatars/%s/select" % self.id)
+            "/avatars/%s/select" % self.id, mode="none")
@@ -2,103 +2,212 @@ import asyncio
 import logging
 from vrcpy.errors import ObjectErrors
 from enum import EnumMeta
+from abc import ABCMeta
 
+# camelCase key -> snake_case attribute name, shared by every object
+_attr_names = {}
 
-class BaseObject:
-    """Base class that VRChat objects inherit from"""
+
+class Schema:
+    """
+    Field plan compiled from ``required`` and ``optional`` field declarations,
+    ``{"name": {"dict_key": "id", "type": str}}``, used by :meth:`BaseObject._apply`
+
+    Fields are kept as ``(name, dict_key, type)`` tuples, ``type`` is ``None``
+    when values are used as-is
+    """
+
+    def __init__(self, required, optional):
+        self.required = tuple(
+            (name, field["dict_key"], self._converter(field["type"]))
+            for name, field in required.items())
+        self.optional = tuple(
+            (name, field["dict_key"], self._converter(field["type"]))
+            for name, field in optional.items())
+
+        self.keys = frozenset(
+            field[1] for field in self.required + self.optional)
+        self.fields = {
+            name: (key, t, True) for name, key, t in self.required}
+        self.fields.update({
+            name: (key, t, False) for name, key, t in self.optional})
+
+        self.by_key = {}
+        for name, (key, t, _) in self.fields.items():
+            self.by_key.setdefault(key, []).append((name, t))
+
+    @staticmethod
+    def _converter(t):
+        if t is dict or t is list or t is EnumMeta:
+            return None
+
+        return t
+
+    @staticmethod
+    def decode(obj, key, t):
+        """Value of ``key`` in ``obj`` converted to ``t``, ``None`` when missing"""
+
+        if key not in obj:
+            return None
+
+        value = obj[key]
+        if t is not None and type(value) is not t:
+            value = t(value)
+
+        return value
+
+
+class BaseObject(metaclass=ABCMeta):
+    """
+    Base class that VRChat objects inherit from
+
+    Subclasses declare their fields in ``required`` and ``optional`` class
+    attributes, which extend the fields of their base classes. Inherited
+    fields named in ``removed`` are dropped. The merged fields are compiled
+    into a :class:`Schema` once, when the class is created
+
+    BaseObject has no instance ``__dict__`` of its own, subclasses without
+    ``__slots__`` get one, so the compact classes in :mod:`vrcpy.compact`
+    can do without. Those are registered as virtual subclasses of the
+    classes they stand in for
+    """
+
+    __slots__ = ()
+
+    # "name": {"dict_key": "id", "type": str}
+    required = {}
+    optional = {}
+    removed = ()
+
+    _schema = Schema({}, {})
 
     def __init__(self, client, loop=None):
         self.loop = loop or asyncio.get_event_loop()
         self.client = client
 
-        # "name": {"dict_key": "id", "type": str}
-        self.required = {}
-        self.optional = {}
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-    def _get_proper_obj(self, obj, t):
-        if type(obj) is not t:
-            if t is not dict and t is not list and t is not EnumMeta:
-                return t(obj)
-            elif t is EnumMeta:
-                if type(obj) is str:
-                    return t(obj.upper())
-                else:
-                    return t(obj)
+        required = {}
+        optional = {}
+        for base in reversed(cls.__bases__):
+            if issubclass(base, BaseObject):
+                required.update(base.required)
+                optional.update(base.optional)
 
-        return obj
+        for name in cls.__dict__.get("removed", ()):
+            required.pop(name, None)
+            optional.pop(name, None)
 
-    def _assign(self, obj):
-        logging.debug("Created %s object" % self.__class__.__name__)
+        required.update(cls.__dict__.get("required", {}))
+        optional.update(cls.__dict__.get("optional", {}))
 
-        self._object_integrety(obj)
-        self.raw = obj
+        cls.required = required
+        cls.optional = optional
+        cls._schema = Schema(required, optional)
+
+    @staticmethod
+    def _attr_name(key):
+        try:
+            return _attr_names[key]
+        except KeyError:
+            pass
+
+        attr_name = ""
+
+        # Try auto-fix keys
+        for char in key:
+            if char == char.upper() and not char.upper() == char.lower():
+                attr_name += "_" + char.lower()
+                continue
+
+            attr_name += char
+
+        _attr_names[key] = attr_name
+        return attr_name
+
+    def _apply(self, obj, schema):
+        """Sets attributes from ``obj`` following a :class:`Schema`"""
+
+        for name, key, t in schema.required:
+            try:
+                value = obj[key]
+            except KeyError:
+                raise ObjectErrors.IntegretyError(
+                    "{} object missing required key {}".format(
+                        self.__class__.__name__, key))
 
-        applied_keys = []
-
-        for key in self.required:
-            myobj = self._get_proper_obj(
-                obj[self.required[key]["dict_key"]],
-                self.required[key]["type"]
-            )
-
-            setattr(
-                self,
-                key,
-                myobj
-            )
-
-            applied_keys.append(self.required[key]["dict_key"])
-
-        for key in self.optional:
-            if self.optional[key]["dict_key"] in obj:
-                setattr(
-                    self,
-                    key,
-                    self._get_proper_obj(
-                        obj[self.optional[key]["dict_key"]],
-                        self.optional[key]["type"]
-                    )
-                )
+            if t is not None and type(value) is not t:
+                value = t(value)
+
+            setattr(self, name, value)
+
+        for name, key, t in schema.optional:
+            if key in obj:
+                value = obj[key]
+                if t is not None and type(value) is not t:
+                    value = t(value)
             else:
-                setattr(self, key, None)
+                value = None
 
-            applied_keys.append(self.optional[key]["dict_key"])
+            setattr(self, name, value)
 
+        keys = schema.keys
         for key in obj:
-            if key not in applied_keys:
-                attr_name = ""
+            if key not in keys:
+                self._set_extra(key, obj[key])
 
-                # Try auto-fix keys
-                for char in key:
-                    if char == char.upper() and not char.upper() == char.lower():
-                        attr_name += "_" + char.lower()
-                        continue
+    def _set_extra(self, key, value):
+        """Stores a key that isn't in the class schema"""
 
-                    attr_name += char
+        setattr(self, self._attr_name(key), value)
 
-                setattr(
-                    self,
-                    attr_name,
-                    obj[key]
-                )
+    def _assign(self, obj):
+        logging.debug("Created %s object", self.__class__.__name__)
+
+        self.raw = obj
+        self._apply(obj, self._schema)
 
+        self._start_cache()
+
+    def _start_cache(self):
         if hasattr(self, "__cinit__"):
             self.caching_finished = False
             self.cache_task = self.loop.create_task(self.__cinit__())
 
-        # Save yo memory fool
-        del self.required
-        del self.optional
-        del applied_keys
-
-    def _object_integrety(self, obj):
-        for key in self.required:
-            if self.required[key]["dict_key"] not in obj:
-                raise ObjectErrors.IntegretyError(
-                    "{} object missing required key {}".format(
-                        self.__class__.__name__, self.required[key]["dict_key"]
-                    )
-                )
+    def _patch(self, obj):
+        """
+        Applies a full or partial payload to this object in place,
+        returns a :class:`dict` of the attributes that changed as
+        ``{"location": (old, new)}``
+        """
+
+        changes = {}
+        by_key = self._schema.by_key
+        for key, value in obj.items():
+            fields = by_key.get(key)
+            if fields is None:
+                name = self._attr_name(key)
+                old = getattr(self, name, None)
+                self._set_extra(key, value)
+
+                if old != value:
+                    changes[name] = (old, value)
+                continue
+
+            for name, t in fields:
+                new = value if t is None or type(value) is t else t(value)
+                # Read before raw is replaced, so lazy fields decode the old value
+                old = getattr(self, name, None)
+                setattr(self, name, new)
+
+                if old != new:
+                    changes[name] = (old, new)
+
+        if self.raw is not None:
+            self.raw = {**self.raw, **obj}
+
+        return changes
 
     async def wait_for_cache(self):
         """Waits for any caching an object has to do"""
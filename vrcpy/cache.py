@@ -0,0 +1,103 @@
+import time
+import logging
+
+from collections import OrderedDict
+
+from vrcpy.request import route_of
+
+
+class ResponseCache:
+    """
+    Size bounded LRU cache of GET responses, used by :class:`vrcpy.request.Request`
+
+    Only routes with a ttl are cached. Expired entries are still served for
+    ``stale_ttl`` seconds while a background request refreshes them.
+
+    Keyword Arguments
+    ------------------
+    ttls: :class:`dict`
+        Maps route templates (see :func:`vrcpy.request.route_of`) to seconds
+        responses are fresh for.
+        Defaults to ``ResponseCache.default_ttls``
+    max_size: :class:`int`
+        Max number of cached responses.
+        Defaults to ``1024``
+    negative_ttl: :class:`float`
+        Seconds a 404 response is cached for, ``None`` to not cache them.
+        Defaults to ``30``
+    stale_ttl: :class:`float`
+        Seconds an expired response is still served for while it's refreshed.
+        Defaults to ``60``
+    """
+
+    default_ttls = {
+        "/users/{id}": 60,
+        "/worlds/{id}": 300,
+        "/worlds/{id}/{id}": 30,
+        "/avatars/{id}": 300
+    }
+
+    def __init__(self, ttls=None, max_size=1024, negative_ttl=30,
+                 stale_ttl=60):
+        self.ttls = ttls if ttls is not None else dict(self.default_ttls)
+        self.max_size = max_size
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+
+        # key: (resp, expires)
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Returns ``(resp, fresh)`` for a ``(path, params)`` key,
+        or ``None`` if it isn't cached or is too old to serve
+        """
+
+        if key not in self.entries:
+            return None
+
+        resp, expires = self.entries[key]
+        now = time.monotonic()
+
+        if now > expires + self.stale_ttl:
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return resp, now <= expires
+
+    def set(self, key, resp):
+        """Caches a response if its route and status are cacheable"""
+
+        ttl = self.ttls.get(route_of(key[0]))
+        if ttl is None:
+            return
+
+        if resp["status"] == 404:
+            ttl = self.negative_ttl
+        elif resp["status"] not in (200, 304):
+            return
+
+        if ttl is None:
+            return
+
+        self.entries[key] = (resp, time.monotonic() + ttl)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """Drops every cached response for ``path``"""
+
+        for key in [key for key in self.entries if key[0] == path]:
+            logging.debug("Invalidated cached GET " + path)
+            del self.entries[key]
+
+    def clear(self):
+        """Drops every cached response"""
+
+        self.entries.clear()
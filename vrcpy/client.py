@@ -1,9 +1,12 @@
-from vrcpy.request import Request
+from vrcpy.request import Request, CircuitBreaker
 from vrcpy.errors import ClientErrors
 
 from vrcpy.user import User, CurrentUser
 from vrcpy.world import World, Instance
 from vrcpy.avatar import Avatar
+from vrcpy.compact import compact_models
+from vrcpy.lazy import lazy_models, lazy_compact_models
+from vrcpy.identity import IdentityMap
 
 from vrcpy.notification import BaseNotification
 
@@ -12,7 +15,10 @@ import vrcpy.util
 import logging
 import asyncio
 import base64
+import copy
 import json
+import time
+import os
 
 
 class Client:
@@ -27,6 +33,78 @@ class Client:
     verify: :class:`bool`
         If aiohttp should verify ssl certificates when making requests.
         Defaults to ``True``
+    ratelimiter: :class:`vrcpy.request.RateLimiter`
+        Rate limiter used to pace requests and wait out 429 responses.
+        Defaults to ``None`` (a new unconfigured limiter)
+    retry_policy: :class:`vrcpy.request.RetryPolicy`
+        Policy deciding which failed requests are retried and how long to back off.
+        Defaults to ``None`` (retry idempotent requests once)
+    config_cache: :class:`str`
+        Path of a file to cache the ``/config`` response (and api key) in,
+        so restarted clients don't need to fetch it again.
+        Defaults to ``None`` (no cache)
+    config_ttl: :class:`float`
+        Seconds a cached config is used for.
+        Defaults to ``3600``
+    transport: :class:`vrcpy.request.Transport`
+        Connection pool, dns and timeout settings, or a shared session/connector.
+        Defaults to ``None`` (default :class:`vrcpy.request.Transport`)
+    cache: :class:`vrcpy.cache.ResponseCache`
+        Cache serving user, world, avatar and instance fetches.
+        Defaults to ``None`` (no cache)
+    codec: :class:`str`
+        JSON library used for http and websocket payloads,
+        ``"json"``, ``"orjson"``, ``"ujson"`` or ``"auto"`` (see :func:`vrcpy.codec.get_codec`).
+        Defaults to ``None`` (``"auto"``)
+    scheduler: :class:`vrcpy.request.Scheduler`
+        Concurrency limits for interactive, normal and bulk requests.
+        The clients own bulk work (caching friends and favorites) uses ``"bulk"``.
+        Defaults to ``None`` (default :class:`vrcpy.request.Scheduler`)
+    stats_hook: ``Callable``
+        Function called with a dict for every request metrics event,
+        see :class:`vrcpy.stats.RequestStats`. Totals are read with ``Client.request.stats()``.
+        Defaults to ``None``
+    tracer: :class:`vrcpy.tracing.Tracer`
+        Tracer emitting spans for requests, linked to operations like
+        ``"login"``, ``"_pre_loop"`` and websocket events.
+        Defaults to ``None``
+    recorder: :class:`vrcpy.replay.Recorder`
+        Records every http request and response to a file.
+        Defaults to ``None``
+    replayer: :class:`vrcpy.replay.Replayer`
+        Serves http responses from a :class:`vrcpy.replay.Recorder` file
+        instead of the network. The websocket isn't replayed.
+        Defaults to ``None``
+    breaker: :class:`vrcpy.request.CircuitBreaker`
+        Circuit breaker failing requests fast while VRChat is erroring,
+        like ``CircuitBreaker()``. Fires ``on_api_degraded`` and ``on_api_recovered``.
+        Defaults to ``None`` (requests are never failed fast)
+    session_store: :class:`str`
+        Path of a file to keep the logged in session in (auth cookies, api key
+        and the last :class:`vrcpy.CurrentUser`). Later logins with the same
+        username or auth token resume it without the login requests, serving
+        ``Client.me`` from the file and revalidating it in the background.
+        The file holds the auth token, keep it private.
+        Defaults to ``None`` (no store)
+    startup_concurrency: :class:`int`
+        Pages of each friend list, and active friends, fetched at once
+        while caching on login. Pages are only requested in parallel as far
+        as the friend counts on ``Client.me`` say they go.
+        Defaults to ``4``
+    compact: :class:`bool`
+        Build users, avatars and favorites as the memory compact classes
+        from :mod:`vrcpy.compact`, for tracking many objects.
+        Defaults to ``False``
+    keep_raw: :class:`bool`
+        If compact objects keep the response they were built from in ``raw``.
+        Standard objects always keep it.
+        Defaults to ``False``
+    lazy: :class:`bool`
+        Build users, worlds, instances, avatars and favorites as the lazy
+        classes from :mod:`vrcpy.lazy`, which don't decode their fields
+        until each is first read. Compact objects are only lazy when
+        ``keep_raw`` is set.
+        Defaults to ``False``
 
     Attributes
     -----------
@@ -55,13 +133,36 @@ class Client:
         Event loop used to run asyncio tasks
     me: :class:`vrcpy.CurrentUser`
         Logged in user
+    identities: :class:`vrcpy.identity.IdentityMap`
+        Live user, world, instance and avatar objects. Fetches and
+        websocket events update these in place instead of building new ones
+    models: :class:`dict`
+        Classes built in place of standard object classes
+    watchers: :class:`dict`
+        Coroutines added with :meth:`Client.watch`, by attribute name
+    startup_timings: :class:`dict`
+        Seconds each phase of caching on login took, like ``"friends"``,
+        ``"friends.online"``, ``"favorites.list"`` and ``"total"``
     ws: :class:`aiohttp.WebSocketResponse`
         Websocket connection to VRChat
+    ws_url: :class:`str`
+        Url of the VRChat pipeline websocket
     """
 
 
-    def __init__(self, loop=None, verify=True):
-        self.request = Request(loop, verify=verify)
+    def __init__(self, loop=None, verify=True, ratelimiter=None,
+                 retry_policy=None, config_cache=None, config_ttl=3600,
+                 transport=None, cache=None, codec=None, scheduler=None,
+                 stats_hook=None, tracer=None, recorder=None, replayer=None,
+                 breaker=None, session_store=None, startup_concurrency=4,
+                 compact=False, keep_raw=False, lazy=False):
+        self.request = Request(
+            loop, verify=verify, ratelimiter=ratelimiter,
+            retry_policy=retry_policy, config_cache=config_cache,
+            config_ttl=config_ttl, transport=transport, cache=cache,
+            codec=codec, scheduler=scheduler, stats_hook=stats_hook,
+            tracer=tracer, recorder=recorder, replayer=replayer,
+            breaker=breaker)
         self.me = None
 
         self.friends = {
@@ -76,56 +177,106 @@ class Client:
             vrcpy.enum.FavoriteType.AVATAR: []
         }
 
+        self.startup_concurrency = startup_concurrency
+        self.startup_timings = {}
+
+        if lazy and compact and keep_raw:
+            self.models = dict(lazy_compact_models)
+        elif lazy and not compact:
+            self.models = dict(lazy_models)
+        else:
+            self.models = dict(compact_models) if compact else {}
+
+        self.keep_raw = keep_raw
+        self.lazy = lazy
+        self.identities = IdentityMap()
+        self.watchers = {}
+
+        self.session_store = session_store
+        self._mfa_verified = False
+        self._revalidate_task = None
+
         self.ws = None
+        self.ws_url = "wss://pipeline.vrchat.cloud/"
         self.loop = loop or asyncio.get_event_loop()
         self.logout_intent = False
 
         if loop is not None:
             asyncio.set_event_loop(loop)
 
-    async def _pre_loop(self):
-        tasks = []
+        if self.request.breaker is not None:
+            self.request.breaker.listeners.append(self._on_circuit_change)
 
-        # Fetch all friends
-        tasks.append(vrcpy.util.TaskWrapReturn(
-            self.loop,
-            vrcpy.util.full_paginate,
-            self.me.fetch_friends,
-            task_name="online",
-            offline=True
-        ))
-
-        tasks.append(vrcpy.util.TaskWrapReturn(
-            self.loop,
-            vrcpy.util.full_paginate,
-            self.me.fetch_friends,
-            task_name="offline",
-            offline=False
-        ))
-
-        for friend in self.me.active_friends:
-            tasks.append(vrcpy.util.TaskWrapReturn(
-                self.loop, self.fetch_user, friend, task_name="active"))
+    async def _timed(self, phase, coro):
+        start = time.monotonic()
+
+        try:
+            return await coro
+        finally:
+            self.startup_timings[phase] = time.monotonic() - start
+
+    async def _cache_friends(self):
+        limit = self.startup_concurrency
+
+        online, offline, active = await asyncio.gather(
+            self._timed("friends.online", vrcpy.util.full_paginate(
+                self.me.fetch_friends, offline=False, priority="bulk",
+                concurrency=limit, total=len(self.me.online_friends or ()))),
+            self._timed("friends.offline", vrcpy.util.full_paginate(
+                self.me.fetch_friends, offline=True, priority="bulk",
+                concurrency=limit, total=len(self.me.offline_friends or ()))),
+            self._timed("friends.active", self.fetch_users(
+                self.me.active_friends, limit=limit))
+        )
+
+        for id in active.errors:
+            logging.warning("Couldn't cache active friend %s (%s)" % (
+                id, active.errors[id]))
+
+        self.friends["online"] = online
+        self.friends["offline"] = offline
+        self.friends["active"] = [user for user in active if user is not None]
+
+        self.loop.create_task(self.on_friends_ready())
+
+    async def _cache_favorites(self):
+        # One mixed listing, the API has no count to split it into pages by
+        groups, favorites = await asyncio.gather(
+            self._timed("favorites.groups", self.me.fetch_favorite_groups(
+                priority="bulk")),
+            self._timed("favorites.list", self.me.fetch_all_favorites(
+                priority="bulk"))
+        )
+
+        # Favorites belong to the group named by their first tag
+        tagged = {}
+        for favorite in favorites[vrcpy.enum.FavoriteType.WORLD] \
+                + favorites[vrcpy.enum.FavoriteType.FRIEND] \
+                + favorites[vrcpy.enum.FavoriteType.AVATAR]:
+            if favorite.tags:
+                tagged.setdefault(favorite.tags[0], []).append(favorite)
 
-        for task in tasks:
-            await task.task
-            if type(task.returns) is not list:
-                self.friends[task.name].append(task.returns)
-            else:
-                self.friends[task.name] = task.returns
-
-        # Cache favorite groups and favorites
-        groups = await self.me.fetch_favorite_groups()
-        favorites = await self.me.fetch_all_favorites()
         for group in groups:
             self.favorites[group.type].append(group)
+            group.favorites.extend(tagged.get(group.name, []))
+
+        self.loop.create_task(self.on_favorites_ready())
+
+    async def _pre_loop(self):
+        with self.request.operation("_pre_loop"):
+            self.startup_timings = {}
+
+            # Friends and favorites don't depend on each other
+            await self._timed("total", asyncio.gather(
+                self._timed("friends", self._cache_friends()),
+                self._timed("favorites", self._cache_favorites())
+            ))
 
-            for favorite in favorites:
-                for favorite in favorites[favorite]:
-                    if favorite.tags[0] == group.name:
-                        group.favorites.append(favorite)
+            logging.debug("Startup timings: " + ", ".join(
+                "%s %.3fs" % (phase, self.startup_timings[phase])
+                for phase in sorted(self.startup_timings)))
 
-        self.loop.create_task(self.on_ready())
+            self.loop.create_task(self.on_ready())
 
     async def _ws_loop(self):
         while not self.logout_intent:
@@ -133,13 +284,13 @@ class Client:
             auth = auth["token"]
 
             self.ws = await self.request.session.ws_connect(
-                "wss://pipeline.vrchat.cloud/?authToken="+auth)
+                self.ws_url + "?authToken=" + auth)
 
             self.loop.create_task(self.on_connect())
 
             async for message in self.ws:
-                message = message.json()
-                content = json.loads(message["content"])
+                message = self.request.codec.loads(message.data)
+                content = self.request.codec.loads(message["content"])
 
                 logging.debug("Got ws message (%s)" % message["type"])
 
@@ -155,10 +306,17 @@ class Client:
                 }
 
                 if message["type"] in switch:
-                    self.loop.create_task(switch[message["type"]](content))
+                    self.loop.create_task(self._traced(
+                        "ws event " + message["type"],
+                        switch[message["type"]](content)
+                    ))
 
         self.loop.create_task(self.on_disconnect())
 
+    async def _traced(self, name, coro):
+        with self.request.operation(name):
+            await coro
+
     # -- Get
 
     def get_friend(self, id):
@@ -234,6 +392,20 @@ class Client:
         logging.debug("Getting cached favorite avatars")
         return self.favorites[vrcpy.enum.FavoriteType.AVATAR]
 
+    def model_class(self, cls):
+        """
+        Class to build objects of ``cls`` as, returns :class:`type`.
+        This is the compact or lazy class when the client was created with
+        ``compact=True`` or ``lazy=True``
+
+        Arguments
+        ----------
+        cls: :class:`type`
+            Standard object class, like :class:`vrcpy.User`
+        """
+
+        return self.models.get(cls, cls)
+
     # -- Fetch
 
     async def fetch_me(self):
@@ -251,7 +423,7 @@ class Client:
         self.me = me
         return me
 
-    async def fetch_user(self, id):
+    async def fetch_user(self, id, priority=None):
         """
         Fetches a non-cached user, and returns as a :class:`vrcpy.User` object
         
@@ -259,14 +431,21 @@ class Client:
         ----------
         id: :class:`str`
             ID of the use to fetch
+
+        Keyword Arguments
+        ------------------
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`).
+            Defaults to ``None`` (``"normal"``)
         """
 
         logging.debug("Getting user via id " + id)
 
-        user = await self.request.get("/users/" + id)
-        return User(self, user["data"], loop=self.loop)
+        user = await self.request.get("/users/" + id, priority=priority)
+        return self.identities.build(
+            "users", User, self, user["data"], self.loop)
 
-    async def fetch_instance(self, world_id, instance_id):
+    async def fetch_instance(self, world_id, instance_id, priority=None):
         """
         Fetches a world instance, returns :class:`vrcpy.Instance`
 
@@ -276,15 +455,22 @@ class Client:
             ID of the instance world
         instance_id: :class:`str`
             ID of instance
+
+        Keyword Arguments
+        ------------------
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`).
+            Defaults to ``None`` (``"normal"``)
         """
 
         logging.debug("Getting instance %s:%s" % (world_id, instance_id))
 
         instance = await self.request.get(
-            "/worlds/%s/%s" % (world_id, instance_id))
-        return Instance(self, instance["data"], self.loop)
+            "/worlds/%s/%s" % (world_id, instance_id), priority=priority)
+        return self.identities.build(
+            "instances", Instance, self, instance["data"], self.loop)
 
-    async def fetch_world(self, world_id):
+    async def fetch_world(self, world_id, priority=None):
         """
         Fetches a world, returns :class:`vrcpy.World`
         
@@ -292,14 +478,21 @@ class Client:
         ----------
         world_id: :class:`str`
             ID of the world to fetch
+
+        Keyword Arguments
+        ------------------
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`).
+            Defaults to ``None`` (``"normal"``)
         """
 
         logging.debug("Getting world of id " + world_id)
 
-        world = await self.request.get("/worlds/"+world_id)
-        return World(self, world["data"], self.loop)
+        world = await self.request.get("/worlds/"+world_id, priority=priority)
+        return self.identities.build(
+            "worlds", World, self, world["data"], self.loop)
 
-    async def fetch_avatar(self, avatar_id):
+    async def fetch_avatar(self, avatar_id, priority=None):
         """
         Fetches an avatar, returns as :class:`vrcpy.Avatar`
 
@@ -307,12 +500,120 @@ class Client:
         ----------
         avatar_id: :class:`str`
             ID of avatar to fetch
+
+        Keyword Arguments
+        ------------------
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`).
+            Defaults to ``None`` (``"normal"``)
         """
 
         logging.debug("Fetching avatar " + avatar_id)
 
-        avatar = await self.request.get("/avatars/" + avatar_id)
-        return Avatar(self, avatar["data"], self.loop)
+        avatar = await self.request.get(
+            "/avatars/" + avatar_id, priority=priority)
+        return self.identities.build(
+            "avatars", Avatar, self, avatar["data"], self.loop)
+
+    def fetch_users(self, ids, limit=8, priority="bulk"):
+        """
+        Fetches many users, returns :class:`vrcpy.util.BulkFetch`.
+        Await it for :class:`vrcpy.User` objects in order of ``ids``,
+        or ``async for id, user, error in`` it to get them as they arrive.
+        Failed IDs are collected instead of raising
+
+        Arguments
+        ----------
+        ids: ``Iterable``
+            IDs of users to fetch, duplicates are fetched once
+
+        Keyword Arguments
+        ------------------
+        limit: :class:`int`
+            Most requests running at once.
+            Defaults to ``8``
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`).
+            Defaults to ``"bulk"``
+        """
+
+        return vrcpy.util.BulkFetch(
+            lambda id: self.fetch_user(id, priority=priority), ids, limit)
+
+    def fetch_worlds(self, ids, limit=8, priority="bulk"):
+        """
+        Fetches many worlds, returns :class:`vrcpy.util.BulkFetch`,
+        see :meth:`fetch_users`
+
+        Arguments
+        ----------
+        ids: ``Iterable``
+            IDs of worlds to fetch, duplicates are fetched once
+
+        Keyword Arguments
+        ------------------
+        limit: :class:`int`
+            Most requests running at once.
+            Defaults to ``8``
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`).
+            Defaults to ``"bulk"``
+        """
+
+        return vrcpy.util.BulkFetch(
+            lambda id: self.fetch_world(id, priority=priority), ids, limit)
+
+    def fetch_avatars(self, ids, limit=8, priority="bulk"):
+        """
+        Fetches many avatars, returns :class:`vrcpy.util.BulkFetch`,
+        see :meth:`fetch_users`
+
+        Arguments
+        ----------
+        ids: ``Iterable``
+            IDs of avatars to fetch, duplicates are fetched once
+
+        Keyword Arguments
+        ------------------
+        limit: :class:`int`
+            Most requests running at once.
+            Defaults to ``8``
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`).
+            Defaults to ``"bulk"``
+        """
+
+        return vrcpy.util.BulkFetch(
+            lambda id: self.fetch_avatar(id, priority=priority), ids, limit)
+
+    def fetch_instances(self, locations, limit=8, priority="bulk"):
+        """
+        Fetches many instances, returns :class:`vrcpy.util.BulkFetch`,
+        see :meth:`fetch_users`
+
+        Arguments
+        ----------
+        locations: ``Iterable``
+            ``(world_id, instance_id)`` tuples or ``"world_id:instance_id"``
+            location strings, duplicates are fetched once
+
+        Keyword Arguments
+        ------------------
+        limit: :class:`int`
+            Most requests running at once.
+            Defaults to ``8``
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`).
+            Defaults to ``"bulk"``
+        """
+
+        locations = [
+            tuple(location.split(":", 1)) if isinstance(location, str)
+            else tuple(location) for location in locations]
+
+        return vrcpy.util.BulkFetch(
+            lambda location: self.fetch_instance(
+                *location, priority=priority), locations, limit)
 
     async def upgrade_friends(self):
         """
@@ -326,11 +627,12 @@ class Client:
         tasks = []
         for state in self.friends:
             for user in self.friends[state]:
-                if type(user) is not User:
+                if not isinstance(user, User):
                     tasks.append(vrcpy.util.TaskWrapReturn(
                         self.loop,
                         user.fetch_full,
-                        task_name=state
+                        task_name=state,
+                        priority="bulk"
                     ))
 
         self.friends = {"online": [], "active": [], "offline": []}
@@ -404,19 +706,26 @@ class Client:
             One Time Password (OTP, recovery code) or Temporary One Time Password (TOTP, MFA code) to verify auth cookie
         """
 
-        b64 = base64.b64encode((username+":"+password).encode()).decode()
+        with self.request.operation("login"):
+            snapshot = self._read_session()
+            if snapshot is not None and snapshot.get("username") == username:
+                if await self._resume_session(snapshot, username):
+                    return
 
-        try:
-            resp = await self.request.get("/auth/user", headers={"Authorization": "Basic "+b64})
-            self.me = CurrentUser(self, resp["data"], self.loop)
-        except ClientErrors.MfaRequired:
-            if mfa is None:
-                raise ClientErrors.MfaRequired("Account login requires mfa")
-            else:
-                await self.verify_mfa(mfa)
-                await self.fetch_me()
+            b64 = base64.b64encode((username+":"+password).encode()).decode()
 
-        await self._pre_loop()
+            try:
+                resp = await self.request.get("/auth/user", headers={"Authorization": "Basic "+b64})
+                self.me = CurrentUser(self, resp["data"], self.loop)
+            except ClientErrors.MfaRequired:
+                if mfa is None:
+                    raise ClientErrors.MfaRequired("Account login requires mfa")
+                else:
+                    await self.verify_mfa(mfa)
+                    await self.fetch_me()
+
+            self._write_session(username)
+            await self._pre_loop()
 
     async def login_auth_token(self, token: str):
         """
@@ -428,24 +737,151 @@ class Client:
             Pre-existing auth token to login with
         """
 
-        logging.debug("Doing logon with pre-existing auth token")
+        with self.request.operation("login_auth_token"):
+            logging.debug("Doing logon with pre-existing auth token")
+
+            snapshot = self._read_session()
+            if snapshot is not None \
+                    and snapshot["cookies"].get("auth") == token:
+                if await self._resume_session(snapshot):
+                    return
+
+            # Create a session and get api_key
+            await self.fetch_system_time()
+            self.request.session.cookie_jar.update_cookies([["auth", token]])
+
+            try:
+                resp = await self.request.get("/auth")
+            except ClientErrors.MissingCredentials:
+                raise ClientErrors.InvalidAuthToken(
+                    "Passed auth token is not valid")
+
+            if not resp["data"]["ok"]:
+                raise ClientErrors.InvalidAuthToken(
+                    "Passed auth token is not valid")
+
+            await self.fetch_me()
+            self._write_session()
+            await self._pre_loop()
+
+    def _read_session(self):
+        if self.session_store is None \
+                or not os.path.isfile(self.session_store):
+            return None
+
+        try:
+            with open(self.session_store) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if snapshot.get("base") != self.request.base:
+            return None
+
+        return snapshot
+
+    def _write_session(self, username=None):
+        if self.session_store is None or self.me is None:
+            return
+
+        cookies = {}
+        for cookie in self.request.session.cookie_jar:
+            if cookie.key in ("auth", "twoFactorAuth"):
+                cookies[cookie.key] = cookie.value
+
+        if "auth" not in cookies:
+            return
+
+        temp = self.session_store + ".tmp"
+        try:
+            fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "base": self.request.base,
+                    "saved": time.time(),
+                    "username": username,
+                    "cookies": cookies,
+                    "mfa_verified": self._mfa_verified,
+                    "api_key": self.request.api_key,
+                    "me": self.me.raw
+                }, f)
+
+            os.replace(temp, self.session_store)
+        except OSError as e:
+            logging.debug("Couldn't write session store (%s)" % e)
+
+    def _clear_session(self):
+        if self.session_store is not None \
+                and os.path.isfile(self.session_store):
+            os.remove(self.session_store)
+
+    async def _resume_session(self, snapshot, username=None):
+        """
+        Logs in from a stored session, returns ``False`` if it turned out
+        to be expired and a normal login is needed
+        """
+
+        logging.debug("Resuming session from " + self.session_store)
+
+        self.request.api_key = snapshot["api_key"]
+        self.request.ensure_session().cookie_jar.update_cookies(
+            snapshot["cookies"])
+
+        self._mfa_verified = snapshot.get("mfa_verified", False)
+        self.me = CurrentUser(self, snapshot["me"], self.loop)
 
-        # Create a session and get api_key
-        await self.fetch_system_time()
-        self.request.session.cookie_jar.update_cookies([["auth", token]])
+        self._revalidate_task = self.loop.create_task(
+            self._revalidate_session(username))
+
+        try:
+            await self._pre_loop()
+        except Exception:
+            try:
+                valid = await self._revalidate_task
+            except Exception as e:
+                # Keep the error that failed the resume, not this one
+                logging.warning("Couldn't revalidate stored session (%r)" % e)
+                valid = None
+
+            if valid is not False:
+                raise
+
+            logging.debug("Stored session expired, logging in again")
+            self.request.session.cookie_jar.clear()
+            self.me = None
+            return False
+
+        return True
+
+    async def _revalidate_session(self, username=None):
+        """
+        Checks a resumed session against the API, returns ``True`` if it's
+        valid, ``False`` if it was rejected and ``None`` if it couldn't tell
+        """
 
         try:
-            resp = await self.request.get("/auth")
-        except ClientErrors.MissingCredentials:
-            raise ClientErrors.InvalidAuthToken(
-                "Passed auth token is not valid")
+            resp = await self.request.get("/auth/user", cached=False)
+        except ClientErrors.MfaRequired:
+            resp = None
+        except Exception as e:
+            logging.warning("Couldn't revalidate stored session (%r)" % e)
+            return None
+
+        if resp is not None and resp["status"] == 200 and "id" in resp["data"]:
+            self.me = CurrentUser(self, resp["data"], self.loop)
+            self._write_session(username)
+            return True
 
-        if not resp["data"]["ok"]:
-            raise ClientErrors.InvalidAuthToken(
-                "Passed auth token is not valid")
+        if resp is not None and resp["status"] != 401:
+            logging.warning("Couldn't revalidate stored session (status %s)" % (
+                resp["status"]))
+            return None
 
-        await self.fetch_me()
-        await self._pre_loop()
+        logging.warning("Stored session is no longer valid")
+
+        self._clear_session()
+        self.loop.create_task(self.on_session_invalid())
+        return False
 
     async def verify_mfa(self, mfa: str):
         """
@@ -470,6 +906,8 @@ class Client:
         if not resp["data"]["verified"]:
             raise ClientErrors.MfaInvalid(f"{mfa} is not a valid MFA code")
 
+        self._mfa_verified = True
+
     async def logout(self, unauth=True):
         """
         Closes client session and logs out of VRChat
@@ -496,10 +934,15 @@ class Client:
             vrcpy.enum.FavoriteType.AVATAR: []
         }
 
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
+
         if unauth:
             # Sending json with this makes it not 401 for some reason
             # Hey, works for me
-            await self.request.put("/logout", json={})
+            await self.request.put("/logout", json={}, mode="none")
+            self._clear_session()
 
         await self.request.close_session()
 
@@ -576,12 +1019,56 @@ class Client:
         """Called when cache is finished"""
         pass
 
+    async def on_friends_ready(self):
+        """Called when ``Client.friends`` is cached, favorites may still be loading"""
+        pass
+
+    async def on_favorites_ready(self):
+        """Called when ``Client.favorites`` is cached, friends may still be loading"""
+        pass
+
     async def on_disconnect(self):
         """Called at the end of ws event loop"""
         pass
 
+    async def on_session_invalid(self):
+        """
+        Called when a session resumed from ``session_store`` is rejected by
+        VRChat, with a 401 or a request for mfa. Failing to reach VRChat
+        doesn't count
+        """
+        pass
+
+    def _on_circuit_change(self, circuit, old, new):
+        if old == CircuitBreaker.CLOSED:
+            self.loop.create_task(self.on_api_degraded(circuit))
+        elif new == CircuitBreaker.CLOSED:
+            self.loop.create_task(self.on_api_recovered(circuit))
+
+    async def on_api_degraded(self, circuit):
+        """
+        Called when requests to a host or route start failing fast
+
+        Arguments
+        ----------
+        circuit: :class:`str`
+            Host or route template (like ``"/users/{id}"``) of the open circuit
+        """
+        pass
+
+    async def on_api_recovered(self, circuit):
+        """
+        Called when a host or route circuit closes again
+
+        Arguments
+        ----------
+        circuit: :class:`str`
+            Host or route template of the closed circuit
+        """
+        pass
+
     async def _on_friend_online(self, obj):
-        user = User(self, obj["user"], self.loop)
+        user = self.identities.build("users", User, self, obj["user"], self.loop)
         self._remove_friend_from_cache(user.id)
 
         self.friends["online"].append(user)
@@ -614,7 +1101,7 @@ class Client:
         pass
 
     async def _on_friend_active(self, obj):
-        user = User(self, obj["user"], self.loop)
+        user = self.identities.build("users", User, self, obj["user"], self.loop)
         self._remove_friend_from_cache(user.id)
         self.friends["active"].append(user)
 
@@ -629,7 +1116,7 @@ class Client:
         pass
 
     async def _on_friend_add(self, obj):
-        user = User(self, obj["user"], self.loop)
+        user = self.identities.build("users", User, self, obj["user"], self.loop)
         self._remove_friend_from_cache(user.id)
         self.friends[user.state].append(user)
 
@@ -658,12 +1145,7 @@ class Client:
         pass
 
     async def _on_friend_update(self, obj):
-        user = User(self, obj["user"], self.loop)
-        ouser = self.get_friend(user.id)
-        self._remove_friend_from_cache(user.id)
-        self.friends[user.state].append(user)
-
-        await self.on_friend_update(ouser, user)
+        await self._apply_friend_delta(obj["user"], "on_friend_update")
 
     async def on_friend_update(self, before, after):
         """
@@ -688,13 +1170,98 @@ class Client:
                 ":")[0] if ":" in obj["location"] else obj["location"]
         })
 
-        user = User(self, obj["user"], self.loop)
-        ouser = self.get_friend(user.id)
+        await self._apply_friend_delta(obj["user"], "on_friend_location")
 
-        self._remove_friend_from_cache(user.id)
-        self.friends[user.state].append(user)
+    async def _apply_friend_delta(self, obj, event):
+        # Before copies are only made for handlers that take them
+        ouser = None
+        if self._has_handler(event):
+            ouser = self.identities.get("users", obj["id"])
+            if ouser is not None:
+                ouser = copy.copy(ouser)
+
+        user, changes = self.identities.update(
+            "users", User, self, obj, self.loop)
+
+        # Friend lists are only rearranged when the state changed
+        if user not in self.friends[user.state]:
+            self._remove_friend_from_cache(user.id)
+            self.friends[user.state].append(user)
+
+        if changes:
+            await self.on_friend_change(user, changes)
+
+            for field in changes.keys() & self.watchers.keys():
+                old, new = changes[field]
+                for func in self.watchers[field]:
+                    self.loop.create_task(func(user, old, new))
+
+        await getattr(self, event)(ouser, user)
+
+    def _has_handler(self, name):
+        # Anything but the default method, however it was assigned
+        handler = getattr(self, name)
+        return getattr(handler, "__func__", None) is not getattr(Client, name)
+
+    def watch(self, field, func=None):
+        """
+        Subscribes a coroutine to changes of one attribute of cached friends,
+        like ``"location"``, ``"status"`` or ``"avatar_image_url"``.
+        It's called with ``(friend, old, new)`` for every ``friend-update`` and
+        ``friend-location`` event that changed it. Can be used as a decorator::
+
+            @client.watch("location")
+            async def moved(friend, old, new):
+                print(friend.display_name, "went from", old, "to", new)
 
-        await self.on_friend_location(ouser, user)
+        Arguments
+        ----------
+        field: :class:`str`
+            Attribute name to watch
+
+        Keyword Arguments
+        ------------------
+        func: ``Callable``
+            Coroutine function to call.
+            Defaults to ``None`` (returns a decorator)
+        """
+
+        if func is None:
+            return lambda func: self.watch(field, func)
+
+        self.watchers.setdefault(field, []).append(func)
+        return func
+
+    def unwatch(self, field, func):
+        """
+        Removes a coroutine added with :meth:`Client.watch`
+
+        Arguments
+        ----------
+        field: :class:`str`
+            Attribute name it watches
+        func: ``Callable``
+            Coroutine function to remove
+        """
+
+        self.watchers[field].remove(func)
+        if not self.watchers[field]:
+            del self.watchers[field]
+
+    async def on_friend_change(self, friend, changes):
+        """
+        Called once for each ``friend-update`` and ``friend-location`` event
+        that changed a cached friend, before ``on_friend_update`` or
+        ``on_friend_location``
+
+        Arguments
+        ----------
+        friend: :class:`vrcpy.User`
+            Updated friend
+        changes: :class:`dict`
+            Changed attributes as ``{"location": (old, new)}``
+        """
+        pass
 
     async def on_friend_location(self, before, after):
         """
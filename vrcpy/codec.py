@@ -0,0 +1,83 @@
+import json
+import logging
+
+
+class JSONCodec:
+    """
+    JSON codec using the standard library, used to decode responses
+    and websocket messages, and encode request bodies
+    """
+
+    name = "json"
+
+    def loads(self, data):
+        """Decodes a JSON ``str`` or ``bytes``"""
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """Encodes ``obj`` to a JSON ``str``"""
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec using orjson, requires ``orjson`` to be installed"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj).decode()
+
+
+class UjsonCodec(JSONCodec):
+    """JSON codec using ujson, requires ``ujson`` to be installed"""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj)
+
+
+codecs = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec
+}
+
+
+def get_codec(codec=None):
+    """
+    Returns a codec object
+
+    Arguments
+    ----------
+    codec: :class:`str`
+        ``"json"``, ``"orjson"``, ``"ujson"``, or ``"auto"``/``None`` to use orjson
+        if it's installed and the standard library otherwise.
+        Objects with ``loads`` and ``dumps`` methods are returned as is
+    """
+
+    if codec is None or codec == "auto":
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return JSONCodec()
+
+    if not isinstance(codec, str):
+        return codec
+
+    logging.debug("Using %s codec" % codec)
+    return codecs[codec]()
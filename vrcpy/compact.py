@@ -0,0 +1,179 @@
+from vrcpy.baseobject import BaseObject
+from vrcpy.user import LimitedUser, User
+from vrcpy.avatar import Avatar
+from vrcpy.favorite import WorldFavorite, AvatarFavorite, FriendFavorite, \
+    WorldFavoriteGroup, AvatarFavoriteGroup, FriendFavoriteGroup
+
+from types import FunctionType
+
+
+class CompactObject:
+    """
+    Mixin for the memory compact versions of VRChat objects made by
+    :func:`compact_class`
+
+    Known fields are stored in ``__slots__`` and objects have no instance
+    ``__dict__``, keys missing from the class schema go in one ``_extra``
+    mapping and are still read as attributes. Attributes that aren't
+    fields can't be set. ``raw`` is ``None`` unless the client was created
+    with ``keep_raw=True``, compact objects are only built lazily (see
+    :mod:`vrcpy.lazy`) when it is
+
+    Field values, mostly strings, are still held. Built from decoded JSON
+    payloads of the fake server, a compact :class:`vrcpy.LimitedUser` takes
+    about 1.37KB against 2.89KB for a standard one, the saving shrinks as
+    the share of long values grows. With ``keep_raw=True`` the payload is
+    held as well and a compact object takes more memory than a standard
+    one, about 2.91KB
+    """
+
+    # Needed by vrcpy.identity.IdentityMap. Declared here and not on each
+    # class, objects can't switch between classes that each add it
+    __slots__ = ("__weakref__",)
+
+    def __init__(self, client, obj=None, loop=None):
+        BaseObject.__init__(self, client, loop)
+
+        if obj is not None:
+            self._assign(obj)
+            self._setup(obj)
+
+    def __getattr__(self, name):
+        # Only reached when normal lookup fails, unset slots included
+        try:
+            extra = object.__getattribute__(self, "_extra")
+        except AttributeError:
+            extra = None
+
+        if extra is not None and name in extra:
+            return extra[name]
+
+        raise AttributeError("'%s' object has no attribute '%s'" % (
+            self.__class__.__name__, name))
+
+    def _setup(self, obj):
+        """Sets attributes the standard class sets outside its schema"""
+
+        pass
+
+    def _set_extra(self, key, value):
+        if self._extra is None:
+            self._extra = {}
+
+        self._extra[self._attr_name(key)] = value
+
+    def _assign(self, obj):
+        self._extra = None
+        super()._assign(obj)
+
+        if not getattr(self.client, "keep_raw", False):
+            self.raw = None
+
+
+def compact_class(cls, slots=(), setup=None):
+    """
+    Creates a memory compact version of a VRChat object class, returns :class:`type`
+
+    The class has the same fields and methods, copied from ``cls`` and its
+    bases, and is registered as a virtual subclass of ``cls`` so
+    ``isinstance`` checks against ``cls`` still pass. Compact classes with
+    the same slots can be switched between by assigning ``__class__``
+
+    Arguments
+    ----------
+    cls: :class:`type`
+        :class:`vrcpy.baseobject.BaseObject` subclass to compact
+
+    Keyword Arguments
+    ------------------
+    slots: :class:`tuple`
+        Extra attributes the class sets outside its schema, or fields of
+        classes its objects can be switched to.
+        Defaults to ``()``
+    setup: :class:`function`
+        Called with the object and its payload after it's built, to set
+        what ``cls.__init__`` sets outside the schema.
+        Defaults to ``None``
+    """
+
+    names = ["client", "loop", "raw", "_extra", "caching_finished",
+             "cache_task"]
+    names += list(cls.required) + list(cls.optional) + list(slots)
+
+    namespace = {}
+    for base in reversed(cls.__mro__):
+        if base is BaseObject or not issubclass(base, BaseObject):
+            continue
+
+        for name, value in base.__dict__.items():
+            if name in ("__init__", "required", "optional", "removed",
+                        "_schema", "_abc_impl"):
+                continue
+
+            # Methods like __cinit__ are kept, class internals aren't
+            if name.startswith("__") and name.endswith("__") \
+                    and not isinstance(value, FunctionType):
+                continue
+
+            namespace[name] = value
+
+    namespace.update({
+        "__slots__": tuple(dict.fromkeys(names)),
+        "__doc__": "Memory compact :class:`%s`" % cls.__name__,
+        "__module__": __name__,
+        "required": cls.required,
+        "optional": cls.optional
+    })
+
+    if setup is not None:
+        namespace["_setup"] = setup
+
+    compact = type("Compact" + cls.__name__, (CompactObject, BaseObject),
+                   namespace)
+    cls.register(compact)
+
+    return compact
+
+
+def _favorite_setup(self, obj):
+    self.favorite_group = obj["tags"][0]
+
+
+def _favorite_group_setup(self, obj):
+    self.favorites = []
+
+
+# Both user classes get the slots of both, so friends fetched as limited
+# users can be upgraded in place when their full profile comes in
+_user_fields = tuple(LimitedUser.required) + tuple(LimitedUser.optional) \
+    + tuple(User.required) + tuple(User.optional)
+CompactLimitedUser = compact_class(LimitedUser, _user_fields)
+CompactUser = compact_class(User, _user_fields)
+CompactAvatar = compact_class(Avatar)
+
+CompactWorldFavorite = compact_class(
+    WorldFavorite, ("favorite_group",), _favorite_setup)
+CompactAvatarFavorite = compact_class(
+    AvatarFavorite, ("favorite_group",), _favorite_setup)
+CompactFriendFavorite = compact_class(
+    FriendFavorite, ("favorite_group",), _favorite_setup)
+CompactWorldFavoriteGroup = compact_class(
+    WorldFavoriteGroup, ("favorites",), _favorite_group_setup)
+CompactAvatarFavoriteGroup = compact_class(
+    AvatarFavoriteGroup, ("favorites",), _favorite_group_setup)
+CompactFriendFavoriteGroup = compact_class(
+    FriendFavoriteGroup, ("favorites",), _favorite_group_setup)
+
+# Classes :class:`vrcpy.Client` builds in place of the standard ones
+# when created with ``compact=True``
+compact_models = {
+    LimitedUser: CompactLimitedUser,
+    User: CompactUser,
+    Avatar: CompactAvatar,
+    WorldFavorite: CompactWorldFavorite,
+    AvatarFavorite: CompactAvatarFavorite,
+    FriendFavorite: CompactFriendFavorite,
+    WorldFavoriteGroup: CompactWorldFavoriteGroup,
+    AvatarFavoriteGroup: CompactAvatarFavoriteGroup,
+    FriendFavoriteGroup: CompactFriendFavoriteGroup
+}
@@ -21,7 +21,16 @@ class RequestErrors:
         """Exception raised with regular 401 responses"""
         pass
 
-    errors = [NoSession, SessionExists, RequestError, RateLimit, Unauthorized]
+    class NotFound(Exception):
+        """Exception raised with 404 responses"""
+        status = 404
+
+    class NotRecorded(Exception):
+        """Exception raised when replaying a request that isn't in the recording"""
+        pass
+
+    errors = [NoSession, SessionExists, RequestError, RateLimit, Unauthorized,
+              NotFound, NotRecorded]
 
 
 class VRChatErrors:
@@ -31,6 +40,10 @@ class VRChatErrors:
         """Exception raised when 503 recieved"""
         pass
 
+    class CircuitOpen(ServiceUnavailable):
+        """Exception raised without sending a request while its host or route circuit is open"""
+        pass
+
 
 class ClientErrors:
     """Errors for vrcpy/client.py"""
@@ -67,7 +80,7 @@ class ObjectErrors:
     """Errors for vrcpy/objects.py"""
 
     class IntegretyError(Exception):
-        """Exception raised when BaseObject._object_integrety fails"""
+        """Exception raised when an object is missing a required key"""
         pass
 
     class NotFriends(Exception):
@@ -0,0 +1,836 @@
+"""
+Local stand-in for the VRChat API, for load testing and benchmarking vrcpy offline.
+
+Run it with ``python -m vrcpy.fakeserver`` or from code::
+
+    server = vrcpy.fakeserver.FakeServer(friends=1000)
+    await server.start()
+    server.attach(client)
+
+Payloads follow the shapes vrcpy's objects parse. Any credentials are accepted.
+"""
+
+import json
+import time
+import random
+import asyncio
+import hashlib
+import logging
+import argparse
+
+from aiohttp import web
+
+
+def _date(rng):
+    return "20%02d-%02d-%02dT%02d:%02d:00.000Z" % (
+        rng.randint(15, 21), rng.randint(1, 12), rng.randint(1, 28),
+        rng.randint(0, 23), rng.randint(0, 59))
+
+
+def _uuid(rng):
+    return "%08x-%04x-%04x-%04x-%012x" % (
+        rng.getrandbits(32), rng.getrandbits(16), rng.getrandbits(16),
+        rng.getrandbits(16), rng.getrandbits(48))
+
+
+class FakeServer:
+    """
+    aiohttp server implementing the VRChat API endpoints vrcpy uses,
+    plus a pipeline websocket sending friend events
+
+    Keyword Arguments
+    ------------------
+    host: :class:`str`
+        Host to listen on.
+        Defaults to ``"localhost"``
+    port: :class:`int`
+        Port to listen on, ``0`` picks a free port.
+        Defaults to ``0``
+    friends: :class:`int`
+        Number of friends the current user has.
+        Defaults to ``100``
+    online_ratio: :class:`float`
+        Fraction of friends that are online.
+        Defaults to ``0.3``
+    active_ratio: :class:`float`
+        Fraction of friends that are active (on the website).
+        Defaults to ``0.1``
+    worlds: :class:`int`
+        Number of worlds.
+        Defaults to ``50``
+    avatars: :class:`int`
+        Number of avatars.
+        Defaults to ``50``
+    favorites: :class:`int`
+        Number of favorites, split between worlds, friends and avatars.
+        Defaults to ``100``
+    files: :class:`int`
+        Number of files owned by the current user.
+        Defaults to ``10``
+    notifications: :class:`int`
+        Number of notifications.
+        Defaults to ``10``
+    moderations: :class:`int`
+        Number of player moderations.
+        Defaults to ``10``
+    latency: :class:`float`
+        Mean seconds added to every response.
+        Defaults to ``0``
+    latency_distribution: :class:`str`
+        How latency is spread, ``"fixed"``, ``"uniform"`` (0 to 2x mean) or
+        ``"exponential"``.
+        Defaults to ``"fixed"``
+    rate_limit_rate: :class:`float`
+        Fraction of requests answered with a 429.
+        Defaults to ``0``
+    retry_after: :class:`float`
+        ``Retry-After`` seconds sent with injected 429s.
+        Defaults to ``1``
+    error_rate: :class:`float`
+        Fraction of requests answered with a 500/502/503.
+        Defaults to ``0``
+    events_per_second: :class:`float`
+        Random friend events sent per second to each websocket, ``0`` for none.
+        Defaults to ``0``
+    require_mfa: :class:`bool`
+        If ``/auth/user`` asks for 2fa until a code is verified.
+        Defaults to ``False``
+    seed: :class:`int`
+        Seed of the generated dataset and injected faults.
+        Defaults to ``0``
+
+    Attributes
+    -----------
+    requests: :class:`dict`
+        Number of requests received per ``"METHOD /path/{id}"`` route
+    """
+
+    api_key = "JlE5Jldo5Jibnk5O5hTx6XVqsJu4WJ26"
+
+    def __init__(self, host="localhost", port=0, friends=100, online_ratio=0.3,
+                 active_ratio=0.1, worlds=50, avatars=50, favorites=100,
+                 files=10, notifications=10, moderations=10, latency=0,
+                 latency_distribution="fixed", rate_limit_rate=0,
+                 retry_after=1, error_rate=0, events_per_second=0,
+                 require_mfa=False, seed=0):
+        self.host = host
+        self.port = port
+
+        self.latency = latency
+        self.latency_distribution = latency_distribution
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.events_per_second = events_per_second
+        self.require_mfa = require_mfa
+
+        self.rng = random.Random(seed)
+        self.requests = {}
+        self.sockets = []
+        self.mfa_verified = False
+
+        self._runner = None
+        self._event_tasks = []
+
+        self._generate(friends, online_ratio, active_ratio, worlds, avatars,
+                       favorites, files, notifications, moderations)
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self._add_routes()
+
+    # -- Dataset
+
+    def _generate(self, friends, online_ratio, active_ratio, worlds, avatars,
+                  favorites, files, notifications, moderations):
+        rng = self.rng
+
+        self.worlds = {}
+        for i in range(worlds):
+            world = self._world(i)
+            self.worlds[world["id"]] = world
+
+        self.avatars = {}
+        for i in range(avatars):
+            avatar = self._avatar(i)
+            self.avatars[avatar["id"]] = avatar
+
+        self.me = self._user(-1, "online")
+
+        self.users = {}
+        online = int(friends * online_ratio)
+        active = int(friends * active_ratio)
+        for i in range(friends):
+            if i < online:
+                state = "online"
+            elif i < online + active:
+                state = "active"
+            else:
+                state = "offline"
+
+            user = self._user(i, state)
+            self.users[user["id"]] = user
+
+        self.favorite_groups = []
+        for t, name in (("world", "worlds1"), ("friend", "group_0"),
+                        ("avatar", "avatars1")):
+            self.favorite_groups.append({
+                "id": "fvgrp_" + _uuid(rng),
+                "type": t,
+                "name": name,
+                "displayName": name,
+                "ownerId": self.me["id"],
+                "ownerDisplayName": self.me["displayName"],
+                "tags": [],
+                "visibility": "private"
+            })
+
+        friend_ids = list(self.users)
+        targets = {
+            "world": list(self.worlds) or ["wrld_" + _uuid(rng)],
+            "friend": friend_ids or ["usr_" + _uuid(rng)],
+            "avatar": list(self.avatars) or ["avtr_" + _uuid(rng)]
+        }
+
+        self.favorites = []
+        for i in range(favorites):
+            group = self.favorite_groups[i % 3]
+            self.favorites.append({
+                "id": "fvrt_" + _uuid(rng),
+                "type": group["type"],
+                "favoriteId": rng.choice(targets[group["type"]]),
+                "tags": [group["name"]]
+            })
+
+        self.files = [{
+            "id": "file_" + _uuid(rng),
+            "name": "File %s" % i,
+            "extension": ".png",
+            "mimeType": "image/png",
+            "ownerId": self.me["id"],
+            "tags": [],
+            "versions": [{"version": 0, "status": "complete",
+                          "created_at": _date(rng)}]
+        } for i in range(files)]
+
+        self.notifications = [{
+            "id": "not_" + _uuid(rng),
+            "type": "invite",
+            "senderUsername": "user%s" % i,
+            "senderUserId": rng.choice(targets["friend"]),
+            "sendUserId": rng.choice(targets["friend"]),
+            "created_at": _date(rng),
+            "message": "",
+            "seen": False,
+            "details": {"worldId": rng.choice(targets["world"]) + ":1"}
+        } for i in range(notifications)]
+
+        self.moderations = [{
+            "id": "pmod_" + _uuid(rng),
+            "type": rng.choice(["block", "mute", "unmute", "hideAvatar", "showAvatar"]),
+            "created": _date(rng),
+            "sourceUserId": rng.choice(targets["friend"]),
+            "sourceDisplayName": "Source %s" % i,
+            "targetUserId": self.me["id"],
+            "targetDisplayName": self.me["displayName"]
+        } for i in range(moderations)]
+
+        self.me.update({
+            "pastDisplayNames": [],
+            "emailVerified": True,
+            "hasEmail": True,
+            "hasPendingEmail": False,
+            "acceptedTOSVersion": 7,
+            "hasBirthday": True,
+            "friends": friend_ids,
+            "fallbackAvatar": rng.choice(targets["avatar"]),
+            "onlineFriends": [u for u in friend_ids if self.users[u]["state"] == "online"],
+            "activeFriends": [u for u in friend_ids if self.users[u]["state"] == "active"],
+            "offlineFriends": [u for u in friend_ids if self.users[u]["state"] == "offline"],
+            "friendGroupNames": ["group_0", "group_1", "group_2"],
+            "currentAvatar": rng.choice(targets["avatar"]),
+            "currentAvatarAssetUrl": "https://files.example/avatar.vrca",
+            "homeLocation": rng.choice(targets["world"]),
+            "hasLoggedInFromClient": True,
+            "twoFactorAuthEnabled": self.require_mfa,
+            "unsubscribe": False,
+            "statusHistory": [],
+            "statusFirstTime": False,
+            "obfuscatedEmail": "u***@example.com",
+            "isFriend": False
+        })
+
+    def _location(self, state):
+        if state != "online" or not self.worlds:
+            return "offline" if state != "online" else "private"
+
+        world = self.rng.choice(list(self.worlds))
+        return "%s:%05d~public" % (world, self.rng.randint(0, 99999))
+
+    def _user(self, i, state):
+        rng = self.rng
+        location = self._location(state)
+
+        return {
+            "id": "usr_" + _uuid(rng),
+            "username": "user%s" % i,
+            "displayName": "User %s" % i,
+            "bio": "Bio of user %s" % i,
+            "bioLinks": [],
+            "currentAvatarImageUrl": "https://files.example/avatar.png",
+            "currentAvatarThumbnailImageUrl": "https://files.example/avatar_thumb.png",
+            "fallbackAvatar": "avtr_" + _uuid(rng),
+            "userIcon": "",
+            "profilePicOverride": "",
+            "last_platform": rng.choice(["standalonewindows", "android"]),
+            "tags": ["system_trust_basic"],
+            "developerType": "none",
+            "isFriend": True,
+            "friendKey": _uuid(rng),
+            "last_login": _date(rng),
+            "date_joined": _date(rng)[:10],
+            "status": rng.choice(["active", "join me", "ask me", "busy"]),
+            "statusDescription": "",
+            "state": state,
+            "location": location,
+            "worldId": location.split(":")[0],
+            "instanceId": location.split(":")[1] if ":" in location else location,
+            "allowAvatarCopying": False
+        }
+
+    def _world(self, i):
+        rng = self.rng
+        world_id = "wrld_" + _uuid(rng)
+
+        return {
+            "id": world_id,
+            "name": "World %s" % i,
+            "description": "Description of world %s" % i,
+            "authorId": "usr_" + _uuid(rng),
+            "authorName": "Author %s" % i,
+            "tags": ["system_approved"],
+            "created_at": _date(rng),
+            "updated_at": _date(rng),
+            "releaseStatus": "public",
+            "visits": rng.randint(0, 100000),
+            "capacity": 16,
+            "favorites": rng.randint(0, 10000),
+            "popularity": rng.randint(0, 10),
+            "heat": rng.randint(0, 10),
+            "imageUrl": "https://files.example/world.png",
+            "thumbnailImageUrl": "https://files.example/world_thumb.png",
+            "publicationDate": _date(rng),
+            "labsPublicationDate": _date(rng),
+            "unityPackages": "[]",
+            "occupants": rng.randint(0, 64),
+            "publicOccupants": rng.randint(0, 32),
+            "privateOccupants": rng.randint(0, 32),
+            "organization": "vrchat",
+            "version": rng.randint(1, 50),
+            "featured": False,
+            "assetUrl": "https://files.example/world.vrcw",
+            "namespace": "",
+            "previewYoutubeId": "",
+            "instances": [
+                ["%05d~public" % rng.randint(0, 99999), rng.randint(1, 16)]
+                for _ in range(rng.randint(0, 3))
+            ]
+        }
+
+    def _instance(self, world, instance_id):
+        return {
+            "id": world["id"] + ":" + instance_id,
+            "name": instance_id.split("~")[0],
+            "type": "public",
+            "active": True,
+            "n_users": 1,
+            "capacity": world["capacity"],
+            "full": False,
+            "canRequestInvite": False,
+            "location": world["id"] + ":" + instance_id,
+            "instanceId": instance_id,
+            "shortName": instance_id.split("~")[0],
+            "ownerId": world["authorId"],
+            "worldId": world["id"],
+            "tags": [],
+            "platforms": {"standalonewindows": 1, "android": 0},
+            "permanent": False
+        }
+
+    def _avatar(self, i):
+        rng = self.rng
+
+        return {
+            "id": "avtr_" + _uuid(rng),
+            "name": "Avatar %s" % i,
+            "description": "Description of avatar %s" % i,
+            "authorId": "usr_" + _uuid(rng),
+            "authorName": "Author %s" % i,
+            "tags": [],
+            "version": rng.randint(1, 20),
+            "featured": False,
+            "created_at": _date(rng),
+            "updated_at": _date(rng),
+            "releaseStatus": "public",
+            "imageUrl": "https://files.example/avatar.png",
+            "thumbnailImageUrl": "https://files.example/avatar_thumb.png"
+        }
+
+    def _limited(self, user):
+        limited = dict(user)
+        for key in ("date_joined", "bioLinks", "state", "worldId",
+                    "instanceId", "allowAvatarCopying"):
+            del limited[key]
+
+        return limited
+
+    # -- Server plumbing
+
+    @property
+    def url(self):
+        """Base url of the http server"""
+
+        return "http://%s:%s" % (self.host, self.port)
+
+    @property
+    def base(self):
+        """Base url to use as :attr:`vrcpy.request.Request.base`"""
+
+        return self.url + "/api/1"
+
+    @property
+    def ws_url(self):
+        """Url to use as :attr:`vrcpy.Client.ws_url`"""
+
+        return "ws://%s:%s/pipeline/" % (self.host, self.port)
+
+    def attach(self, client):
+        """Points a :class:`vrcpy.Client` at this server"""
+
+        client.request.base = self.base
+        client.ws_url = self.ws_url
+
+    async def start(self):
+        """Starts listening, returns the base url"""
+
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        if self.port == 0:
+            self.port = site._server.sockets[0].getsockname()[1]
+
+        logging.debug("Fake VRChat API listening on " + self.url)
+        return self.base
+
+    async def close(self):
+        """Closes websockets and stops the server"""
+
+        for task in self._event_tasks:
+            task.cancel()
+
+        for ws in list(self.sockets):
+            await ws.close()
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _route(self, request):
+        resource = request.match_info.route.resource
+        route = resource.canonical if resource is not None else request.path
+        return request.method + " " + route.replace("/api/1", "", 1)
+
+    def _delay(self):
+        if self.latency <= 0:
+            return 0
+
+        if self.latency_distribution == "uniform":
+            return self.rng.uniform(0, 2 * self.latency)
+        if self.latency_distribution == "exponential":
+            return self.rng.expovariate(1 / self.latency)
+
+        return self.latency
+
+    @web.middleware
+    async def _middleware(self, request, handler):
+        route = self._route(request)
+        self.requests[route] = self.requests.get(route, 0) + 1
+
+        if request.path.startswith("/pipeline"):
+            return await handler(request)
+
+        delay = self._delay()
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.rate_limit_rate and self.rng.random() < self.rate_limit_rate:
+            return web.json_response(
+                {"error": {"message": "Rate limit exceeded", "status_code": 429}},
+                status=429, headers={"Retry-After": str(self.retry_after)})
+
+        if self.error_rate and self.rng.random() < self.error_rate:
+            status = self.rng.choice([500, 502, 503])
+            return web.json_response(
+                {"error": {"message": "Injected error", "status_code": status}},
+                status=status)
+
+        return await handler(request)
+
+    def _json(self, request, data, status=200):
+        body = json.dumps(data).encode()
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+
+        if status == 200 and request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+
+        return web.Response(
+            body=body, status=status, content_type="application/json",
+            headers={"ETag": etag})
+
+    def _error(self, request, status, message):
+        return self._json(request, {
+            "error": {"message": message, "status_code": status}}, status)
+
+    def _page(self, request, items, default_n=60):
+        offset = int(request.query.get("offset", 0))
+        n = int(request.query.get("n", default_n))
+        return items[offset:offset + n]
+
+    def _add_routes(self):
+        r = self.app.router
+        api = "/api/1"
+
+        r.add_get(api + "/config", self.config)
+        r.add_get(api + "/time", self.time)
+        r.add_get(api + "/visits", self.visits)
+        r.add_get(api + "/health", self.health)
+
+        r.add_get(api + "/auth", self.auth)
+        r.add_get(api + "/auth/user", self.auth_user)
+        r.add_post(api + "/auth/twofactorauth/{kind}/verify", self.verify)
+        r.add_put(api + "/logout", self.ok)
+        r.add_get(api + "/auth/permissions", self.permissions)
+
+        r.add_get(api + "/auth/user/friends", self.friends)
+        r.add_delete(api + "/auth/user/friends/{id}", self.ok)
+        r.add_get(api + "/users/{id}", self.user)
+        r.add_put(api + "/users/{id}", self.update_user)
+        r.add_get(api + "/users/{id}/avatar", self.user_avatar)
+        r.add_get(api + "/user/{id}/friendStatus", self.friend_status)
+        r.add_post(api + "/user/{id}/friendRequest", self.ok)
+
+        r.add_get(api + "/worlds/{id}", self.world)
+        r.add_get(api + "/worlds/{id}/{instance}", self.instance)
+        r.add_delete(api + "/worlds/{id}", self.ok)
+
+        r.add_get(api + "/avatars", self.avatar_list)
+        r.add_get(api + "/avatars/{id}", self.avatar)
+        r.add_put(api + "/avatars/{id}/select", self.ok)
+        r.add_delete(api + "/avatars/{id}", self.ok)
+
+        r.add_get(api + "/favorites", self.favorite_list)
+        r.add_post(api + "/favorites", self.add_favorite)
+        r.add_delete(api + "/favorites/{id}", self.ok)
+        r.add_get(api + "/favorite/groups", self.favorite_group_list)
+
+        r.add_get(api + "/files", self.file_list)
+
+        r.add_get(api + "/auth/user/notifications", self.notification_list)
+        r.add_put(api + "/auth/user/notifications/{id}/see", self.notification)
+        r.add_put(api + "/auth/user/notifications/{id}/hide", self.notification)
+
+        r.add_get(api + "/auth/user/playermoderated", self.moderation_list)
+        r.add_post(api + "/auth/user/playermoderations", self.add_moderation)
+        r.add_post(api + "/auth/user/blocks", self.add_moderation)
+        r.add_put(api + "/auth/user/unblocks", self.ok)
+        r.add_delete(api + "/user/{id}/moderations/{target}", self.ok)
+
+        r.add_get("/pipeline/", self.pipeline)
+
+    # -- Handlers
+
+    async def ok(self, request):
+        return self._json(request, {"success": {"message": "OK", "status_code": 200}})
+
+    async def config(self, request):
+        return self._json(request, {
+            "apiKey": self.api_key,
+            "clientApiKey": self.api_key,
+            "serverName": "fake"
+        })
+
+    async def time(self, request):
+        return self._json(request, time.strftime(
+            "%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()))
+
+    async def visits(self, request):
+        return self._json(request, len(self.users))
+
+    async def health(self, request):
+        return self._json(request, {
+            "ok": True, "serverName": "fake", "buildVersionTag": "fake"})
+
+    async def auth(self, request):
+        return self._json(request, {
+            "ok": True, "token": "authcookie_" + self.me["friendKey"]})
+
+    async def auth_user(self, request):
+        if self.require_mfa and not self.mfa_verified:
+            return self._json(request, {"requiresTwoFactorAuth": ["totp", "otp"]})
+
+        response = self._json(request, self.me)
+        response.set_cookie("auth", "authcookie_" + self.me["friendKey"])
+        return response
+
+    async def verify(self, request):
+        self.mfa_verified = True
+        return self._json(request, {"verified": True})
+
+    async def permissions(self, request):
+        perm = {
+            "id": "prms_" + self.me["friendKey"],
+            "name": "permission-supporter-tags",
+            "ownerId": self.me["id"],
+            "data": {}
+        }
+
+        if request.query.get("condensed") == "true":
+            return self._json(request, {perm["name"]: True})
+
+        return self._json(request, [perm])
+
+    async def friends(self, request):
+        offline = request.query.get("offline") == "true"
+        friends = [
+            self._limited(user) for user in self.users.values()
+            if (user["state"] == "offline") == offline
+        ]
+
+        return self._json(request, self._page(request, friends))
+
+    async def user(self, request):
+        user_id = request.match_info["id"]
+        if user_id == self.me["id"]:
+            return self._json(request, self.me)
+
+        if user_id not in self.users:
+            return self._error(request, 404, "User not found")
+
+        return self._json(request, self.users[user_id])
+
+    async def update_user(self, request):
+        return self._json(request, self.me)
+
+    async def user_avatar(self, request):
+        avatar = self.avatars.get(self.me["currentAvatar"]) \
+            or self._avatar(0)
+
+        return self._json(request, {
+            "success": {"message": json.dumps(avatar), "status_code": 200}})
+
+    async def friend_status(self, request):
+        return self._json(request, {
+            "isFriend": request.match_info["id"] in self.users,
+            "incomingRequest": False,
+            "outgoingRequest": False
+        })
+
+    async def world(self, request):
+        world_id = request.match_info["id"]
+        if world_id not in self.worlds:
+            return self._error(request, 404, "World not found")
+
+        return self._json(request, self.worlds[world_id])
+
+    async def instance(self, request):
+        world_id = request.match_info["id"]
+        if world_id not in self.worlds:
+            return self._error(request, 404, "World not found")
+
+        return self._json(request, self._instance(
+            self.worlds[world_id], request.match_info["instance"]))
+
+    async def avatar_list(self, request):
+        return self._json(request, self._page(
+            request, list(self.avatars.values())))
+
+    async def avatar(self, request):
+        avatar_id = request.match_info["id"]
+        if avatar_id not in self.avatars:
+            return self._error(request, 404, "Avatar not found")
+
+        return self._json(request, self.avatars[avatar_id])
+
+    async def favorite_list(self, request):
+        favorites = self.favorites
+        if "type" in request.query:
+            favorites = [f for f in favorites if f["type"] == request.query["type"]]
+
+        return self._json(request, self._page(request, favorites))
+
+    async def add_favorite(self, request):
+        favorite = {
+            "id": "fvrt_" + _uuid(self.rng),
+            "type": request.query.get("type", "world"),
+            "favoriteId": request.query.get("favoriteId", ""),
+            "tags": request.query.getall("tags", ["worlds1"])
+        }
+
+        self.favorites.append(favorite)
+        return self._json(request, favorite)
+
+    async def favorite_group_list(self, request):
+        return self._json(request, self._page(request, self.favorite_groups, 50))
+
+    async def file_list(self, request):
+        return self._json(request, self._page(request, self.files))
+
+    async def notification_list(self, request):
+        return self._json(request, self.notifications)
+
+    async def notification(self, request):
+        for notification in self.notifications:
+            if notification["id"] == request.match_info["id"]:
+                return self._json(request, notification)
+
+        return self._error(request, 404, "Notification not found")
+
+    async def moderation_list(self, request):
+        return self._json(request, self.moderations)
+
+    async def add_moderation(self, request):
+        target = request.query.get("moderated") or request.query.get("blocked", "")
+        moderation = {
+            "id": "pmod_" + _uuid(self.rng),
+            "type": request.query.get("type", "block"),
+            "created": _date(self.rng),
+            "sourceUserId": self.me["id"],
+            "sourceDisplayName": self.me["displayName"],
+            "targetUserId": target,
+            "targetDisplayName": target
+        }
+
+        return self._json(request, moderation)
+
+    # -- Websocket
+
+    def random_event(self):
+        """Returns a random ``(type, content)`` friend event"""
+
+        if not self.users:
+            return "notification", {"data": self.notifications[0]} \
+                if self.notifications else None
+
+        user = dict(self.users[self.rng.choice(list(self.users))])
+        t = self.rng.choice([
+            "friend-location", "friend-location", "friend-location",
+            "friend-update", "friend-online", "friend-active", "friend-offline"
+        ])
+
+        if t == "friend-offline":
+            return t, {"userId": user["id"]}
+
+        if t == "friend-location":
+            location = self._location("online")
+            return t, {
+                "userId": user["id"],
+                "user": user,
+                "location": location,
+                "instance": location.split(":")[-1],
+                "world": self.worlds.get(location.split(":")[0])
+            }
+
+        return t, {"userId": user["id"], "user": user}
+
+    async def push_event(self, t, content):
+        """
+        Sends an event to every connected pipeline websocket
+
+        Arguments
+        ----------
+        t: :class:`str`
+            Event type, like ``"friend-location"``
+        content: :class:`dict`
+            Event content, sent json encoded like VRChat does
+        """
+
+        message = json.dumps({"type": t, "content": json.dumps(content)})
+        for ws in list(self.sockets):
+            if not ws.closed:
+                await ws.send_str(message)
+
+    async def _events(self, ws):
+        interval = 1 / self.events_per_second
+        while not ws.closed:
+            await asyncio.sleep(interval)
+            event = self.random_event()
+            if event[1] is not None and not ws.closed:
+                await ws.send_str(json.dumps({
+                    "type": event[0], "content": json.dumps(event[1])}))
+
+    async def pipeline(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+
+        task = None
+        if self.events_per_second > 0:
+            task = asyncio.ensure_future(self._events(ws))
+            self._event_tasks.append(task)
+
+        try:
+            async for message in ws:
+                pass
+        finally:
+            self.sockets.remove(ws)
+            if task is not None:
+                task.cancel()
+                self._event_tasks.remove(task)
+
+        return ws
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the VRChat API")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--friends", type=int, default=100)
+    parser.add_argument("--worlds", type=int, default=50)
+    parser.add_argument("--avatars", type=int, default=50)
+    parser.add_argument("--favorites", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--latency-distribution", default="fixed",
+                        choices=["fixed", "uniform", "exponential"])
+    parser.add_argument("--rate-limit-rate", type=float, default=0)
+    parser.add_argument("--retry-after", type=float, default=1)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--events-per-second", type=float, default=0)
+    parser.add_argument("--require-mfa", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeServer(
+        host=args.host, port=args.port, friends=args.friends,
+        worlds=args.worlds, avatars=args.avatars, favorites=args.favorites,
+        latency=args.latency, latency_distribution=args.latency_distribution,
+        rate_limit_rate=args.rate_limit_rate, retry_after=args.retry_after,
+        error_rate=args.error_rate, events_per_second=args.events_per_second,
+        require_mfa=args.require_mfa, seed=args.seed)
+
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(server.start())
+    print("Fake VRChat API on %s (pipeline %s)" % (server.base, server.ws_url))
+
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(server.close())
+
+
+if __name__ == "__main__":
+    main()
@@ -6,20 +6,20 @@ import logging
 class BaseFavorite(BaseObject):
     """Base favorite class that all favorites objects are built on top of"""
 
+    required = {
+        "id": {
+            "dict_key": "id",
+            "type": str
+        },
+        "type": {
+            "dict_key": "type",
+            "type": FavoriteType
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, loop)
 
-        self.required.update({
-            "id": {
-                "dict_key": "id",
-                "type": str
-            },
-            "type": {
-                "dict_key": "type",
-                "type": FavoriteType
-            }
-        })
-
         if obj is not None:
             self.favorite_group = obj["tags"][0]
 
@@ -33,47 +33,49 @@ class BaseFavorite(BaseObject):
 
         logging.debug("Building favorite of type " + obj["type"])
 
-        return switch[FavoriteType[obj["type"].upper()]](client, obj, loop)
+        cls = switch[FavoriteType[obj["type"].upper()]]
+        return client.model_class(cls)(client, obj, loop)
 
     async def unfavorite(self):
         """Unfavorites the favorite object"""
 
-        await self.client.request.delete("/favorites/"+self.id)
+        await self.client.request.delete(
+            "/favorites/"+self.id, mode="none")
         logging.debug("Unfavorited %s %s" % (self.type, self.id))
 
 class FavoriteGroup(BaseFavorite):
     """Base favorite class that all favorite group objects are built on top of"""
 
+    required = {
+        "display_name": {
+            "dict_key": "displayName",
+            "type": str
+        },
+        "name": {
+            "dict_key": "name",
+            "type": str
+        },
+        "owner_display_name": {
+            "dict_key": "ownerDisplayName",
+            "type": str
+        },
+        "owner_id": {
+            "dict_key": "ownerId",
+            "type": str
+        },
+        "tags": {
+            "dict_key": "tags",
+            "type": list
+        },
+        "visibility": {
+            "dict_key": "visibility",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, None, loop)
 
-        self.required.update({
-            "display_name": {
-                "dict_key": "displayName",
-                "type": str
-            },
-            "name": {
-                "dict_key": "name",
-                "type": str
-            },
-            "owner_display_name": {
-                "dict_key": "ownerDisplayName",
-                "type": str
-            },
-            "owner_id": {
-                "dict_key": "ownerId",
-                "type": str
-            },
-            "tags": {
-                "dict_key": "tags",
-                "type": list
-            },
-            "visibility": {
-                "dict_key": "visibility",
-                "type": str
-            }
-        })
-
         #del self.unfavorite
         self._assign(obj)
         self.favorites = []
@@ -88,21 +90,22 @@ class FavoriteGroup(BaseFavorite):
 
         logging.debug("Building favorite group of type " + obj["type"])
 
-        return switch[FavoriteType(obj["type"])](client, obj, loop)
+        cls = switch[FavoriteType(obj["type"])]
+        return client.model_class(cls)(client, obj, loop)
 
 class WorldFavorite(BaseFavorite):
     """Represents a favorite world"""
 
+    required = {
+        "world_id": {
+            "dict_key": "favoriteId",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, obj, loop)
 
-        self.required.update({
-            "world_id": {
-                "dict_key": "favoriteId",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
 class WorldFavoriteGroup(FavoriteGroup):
@@ -112,16 +115,16 @@ class WorldFavoriteGroup(FavoriteGroup):
 class AvatarFavorite(BaseFavorite):
     """Represents a favorite avatar"""
 
+    required = {
+        "avatar_id": {
+            "dict_key": "favoriteId",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, obj, loop)
 
-        self.required.update({
-            "avatar_id": {
-                "dict_key": "favoriteId",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
 class AvatarFavoriteGroup(FavoriteGroup):
@@ -131,16 +134,16 @@ class AvatarFavoriteGroup(FavoriteGroup):
 class FriendFavorite(BaseFavorite):
     """Represents a favorite (or grouped) friend"""
 
+    required = {
+        "user_id": {
+            "dict_key": "favoriteId",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, obj, loop)
 
-        self.required.update({
-            "user_id": {
-                "dict_key": "favoriteId",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
 class FriendFavoriteGroup(FavoriteGroup):
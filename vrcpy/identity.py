@@ -0,0 +1,124 @@
+from vrcpy.errors import ObjectErrors
+
+import weakref
+import logging
+
+
+class IdentityMap:
+    """
+    Keeps one live object per VRChat entity, so every fetch and websocket
+    event for an ID returns the same object, patched in place with the
+    new payload. Objects are held weakly and dropped once nothing else
+    references them
+
+    Entities are grouped by kind, ``"users"``, ``"worlds"``, ``"instances"``
+    and ``"avatars"``, and found by their ``id`` key
+    """
+
+    kinds = ("users", "worlds", "instances", "avatars")
+
+    def __init__(self):
+        self._objects = {kind: weakref.WeakValueDictionary()
+                         for kind in self.kinds}
+
+    def __len__(self):
+        return sum(len(objects) for objects in self._objects.values())
+
+    def get(self, kind, id):
+        """Live object of ``kind`` with ID ``id``, ``None`` if there isn't one"""
+
+        return self._objects[kind].get(id)
+
+    def add(self, kind, obj):
+        """Tracks ``obj`` as the live object for its ID"""
+
+        self._objects[kind][obj.id] = obj
+
+    def discard(self, kind, id):
+        """Stops tracking the object with ID ``id``"""
+
+        self._objects[kind].pop(id, None)
+
+    def build(self, kind, cls, client, obj, loop=None):
+        """
+        Returns the live object for ``obj["id"]`` patched with ``obj``,
+        or a new ``cls`` object built from it.
+        Takes the same arguments as :meth:`IdentityMap.update`
+        """
+
+        return self.update(kind, cls, client, obj, loop)[0]
+
+    def update(self, kind, cls, client, obj, loop=None):
+        """
+        Patches the live object for ``obj["id"]`` with ``obj``, or builds a
+        new ``cls`` object from it. Returns a ``(object, changes)`` tuple where
+        changes are the attributes that changed as ``{"location": (old, new)}``,
+        ``None`` when the object is new.
+        ``cls`` is resolved with :meth:`vrcpy.Client.model_class`
+
+        When the live object is of a base class of ``cls``, like
+        :class:`vrcpy.LimitedUser` for :class:`vrcpy.User`, it's upgraded in
+        place if their layouts match and replaced by a new object if not.
+        Caching done by ``__cinit__`` starts when an object is built or
+        upgraded, patches don't restart it
+
+        Arguments
+        ----------
+        kind: :class:`str`
+            Entity kind, one of ``IdentityMap.kinds``
+        cls: :class:`type`
+            Class to build new objects as
+        client: :class:`vrcpy.Client`
+            Client the object belongs to
+        obj: :class:`dict`
+            Payload of the object
+
+        Keyword Arguments
+        ------------------
+        loop: :class:`asyncio.AbstractEventLoop`
+            Event loop new objects create tasks in.
+            Defaults to ``None``
+        """
+
+        base, cls = cls, client.model_class(cls)
+        if "id" not in obj:
+            raise ObjectErrors.IntegretyError(
+                "{} object missing required key id".format(cls.__name__))
+
+        objects = self._objects[kind]
+        existing = objects.get(obj["id"])
+
+        upgraded = None
+        # Compact and lazy classes aren't subclasses of each other, so the
+        # standard class decides whether this would be a downgrade
+        if existing is not None and not isinstance(existing, base):
+            upgraded = type(existing)
+            try:
+                existing.__class__ = cls
+            except TypeError:
+                existing = None
+
+        if existing is None:
+            existing = cls(client, obj, loop)
+            objects[existing.id] = existing
+            return existing, None
+
+        logging.debug("Patching %s %s" % (cls.__name__, existing.id))
+
+        changes = existing._patch(obj)
+
+        if upgraded is not None:
+            # Fields the old class didn't have aren't changes
+            added = cls._schema.fields.keys() - upgraded._schema.fields.keys()
+            changes = {name: change for name, change in changes.items()
+                       if name not in added or change[0] is not None}
+
+            # Missing like on a new object, lazy ones decode from raw
+            for name in added:
+                if not hasattr(existing, name):
+                    setattr(existing, name, None)
+
+            # Caching like __cinit__ runs once per class, not on every patch
+            existing._start_cache()
+
+        return existing, changes
@@ -0,0 +1,132 @@
+from vrcpy.baseobject import Schema
+from vrcpy.errors import ObjectErrors
+from vrcpy.user import LimitedUser, User
+from vrcpy.world import World, Instance
+from vrcpy.avatar import Avatar
+from vrcpy.favorite import WorldFavorite, AvatarFavorite, FriendFavorite, \
+    WorldFavoriteGroup, AvatarFavoriteGroup, FriendFavoriteGroup
+from vrcpy.compact import compact_models
+
+
+class LazyField:
+    """
+    Descriptor decoding a field from ``raw`` the first time it's read on
+    lazy objects. The value is cached in the instance ``__dict__``, which
+    takes precedence over this descriptor after that
+    """
+
+    def __init__(self, name, key, t):
+        self.name = name
+        self.key = key
+        self.t = t
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+
+        try:
+            raw = obj.__dict__["raw"]
+        except KeyError:
+            raise AttributeError("'%s' object has no attribute '%s'" % (
+                owner.__name__, self.name))
+
+        value = Schema.decode(raw, self.key, self.t) if raw is not None else None
+        obj.__dict__[self.name] = value
+        return value
+
+
+class LazyObject:
+    """
+    Mixin for the lazy versions of VRChat objects made by :func:`lazy_class`
+
+    Lazy objects only keep ``raw`` when built, after checking it has the
+    required keys. Fields are decoded from it the first time they're read,
+    by :class:`LazyField` descriptors or, for slots of compact classes,
+    by ``__getattr__``, which also resolves keys outside the schema
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        # Only reached when normal lookup fails
+        if name.startswith("__") or name == "raw":
+            raise AttributeError(name)
+
+        fallback = getattr(super(), "__getattr__", None)
+        if fallback is not None:
+            try:
+                return fallback(name)
+            except AttributeError:
+                pass
+
+        try:
+            raw = object.__getattribute__(self, "raw")
+        except AttributeError:
+            # Not built from a payload yet
+            raise AttributeError("'%s' object has no attribute '%s'" % (
+                self.__class__.__name__, name))
+
+        field = self._schema.fields.get(name)
+        if field is not None:
+            value = Schema.decode(raw, field[0], field[1]) \
+                if raw is not None else None
+            setattr(self, name, value)
+            return value
+
+        if raw is not None:
+            for key in raw:
+                if key not in self._schema.keys and self._attr_name(key) == name:
+                    self._set_extra(key, raw[key])
+                    return raw[key]
+
+        raise AttributeError("'%s' object has no attribute '%s'" % (
+            self.__class__.__name__, name))
+
+    def _apply(self, obj, schema):
+        # Fields are decoded on access, only check the payload is complete
+        for name, key, t in schema.required:
+            if key not in obj:
+                raise ObjectErrors.IntegretyError(
+                    "{} object missing required key {}".format(
+                        self.__class__.__name__, key))
+
+
+def lazy_class(cls):
+    """
+    Creates a lazy subclass of a VRChat object class, returns :class:`type`
+
+    The subclass has the same fields and methods, and ``isinstance``
+    checks against ``cls`` still pass
+
+    Arguments
+    ----------
+    cls: :class:`type`
+        :class:`vrcpy.baseobject.BaseObject` subclass, or a compact class
+        from :mod:`vrcpy.compact`
+    """
+
+    lazy = type("Lazy" + cls.__name__, (LazyObject, cls), {
+        "__slots__": (),
+        "__doc__": "Lazy :class:`%s`" % cls.__name__,
+        "__module__": __name__
+    })
+
+    for name, (key, t, _) in lazy._schema.fields.items():
+        # Slots of compact classes decode through __getattr__ instead
+        if not hasattr(cls, name):
+            setattr(lazy, name, LazyField(name, key, t))
+
+    return lazy
+
+
+# Classes :class:`vrcpy.Client` builds in place of the standard ones
+# when created with ``lazy=True``
+lazy_models = {cls: lazy_class(cls) for cls in (
+    LimitedUser, User, World, Instance, Avatar, WorldFavorite,
+    AvatarFavorite, FriendFavorite, WorldFavoriteGroup, AvatarFavoriteGroup,
+    FriendFavoriteGroup)}
+
+# And when created with ``lazy=True``, ``compact=True`` and ``keep_raw=True``
+lazy_compact_models = dict(lazy_models)
+lazy_compact_models.update({
+    cls: lazy_class(compact) for cls, compact in compact_models.items()})
@@ -5,40 +5,40 @@ import logging
 class PlayerModeration(BaseObject):
     """Base moderation class that all moderations inherit from"""
 
+    required = {
+        "created_at": {
+            "dict_key": "created",
+            "type": str
+        },
+        "id": {
+            "dict_key": "id",
+            "type": str
+        },
+        "source_display_name": {
+            "dict_key": "sourceDisplayName",
+            "type": str
+        },
+        "source_user_id": {
+            "dict_key": "sourceUserId",
+            "type": str
+        },
+        "target_display_name": {
+            "dict_key": "targetDisplayName",
+            "type": str
+        },
+        "target_user_id": {
+            "dict_key": "targetUserId",
+            "type": str
+        },
+        "type": {
+            "dict_key": "type",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, loop)
 
-        self.required.update({
-            "created_at": {
-                "dict_key": "created",
-                "type": str
-            },
-            "id": {
-                "dict_key": "id",
-                "type": str
-            },
-            "source_display_name": {
-                "dict_key": "sourceDisplayName",
-                "type": str
-            },
-            "source_user_id": {
-                "dict_key": "sourceUserId",
-                "type": str
-            },
-            "target_display_name": {
-                "dict_key": "targetDisplayName",
-                "type": str
-            },
-            "target_user_id": {
-                "dict_key": "targetUserId",
-                "type": str
-            },
-            "type": {
-                "dict_key": "type",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
     async def fetch_source_user(self):
@@ -58,7 +58,7 @@ class PlayerModeration(BaseObject):
 
         await self.client.request.delete(
             "/user/%s/moderations/%s" % (
-                self.source_user_id, self.target_user_id))
+                self.source_user_id, self.target_user_id), mode="none")
         logging.debug("Cleared moderations for " + self.source_user_id)
 
     @staticmethod
@@ -115,7 +115,7 @@ class BlockPlayerModeration(PlayerModeration):
 
         await self.client.request.put(
             "/auth/user/unblocks", params={
-                "blocked": self.target_user_id})
+                "blocked": self.target_user_id}, mode="none")
 
         logging.debug("Unblocked user %s" % self.target_user_id)
 
@@ -143,32 +143,32 @@ class UnmutePlayerModeration(PlayerModeration):
 # Don't know if these still exist but including them just incase
 
 class Moderation(BaseObject):
+    required = {
+        "created_at": {
+            "dict_key": "created",
+            "type": str
+        },
+        "reason": {
+            "dict_key": "reason",
+            "type": str
+        },
+        "world_id": {
+            "dict_key": "worldId",
+            "type": str
+        },
+        "instance_id": {
+            "dict_key": "instanceId",
+            "type": str
+        },
+        "type": {
+            "dict_key": "type",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, loop)
 
-        self.required.update({
-            "created_at": {
-                "dict_key": "created",
-                "type": str
-            },
-            "reason": {
-                "dict_key": "reason",
-                "type": str
-            },
-            "world_id": {
-                "dict_key": "worldId",
-                "type": str
-            },
-            "instance_id": {
-                "dict_key": "instanceId",
-                "type": str
-            },
-            "type": {
-                "dict_key": "type",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
     async def fetch_instance(self):
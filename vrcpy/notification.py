@@ -1,4 +1,4 @@
-from vrcpy.baseobject import BaseObject
+from vrcpy.baseobject import BaseObject, Schema
 import logging
 
 
@@ -16,59 +16,55 @@ class Notification:
 
 
 class BaseNotification(BaseObject):
-    def __init__(self, client, loop=None):
-        super().__init__(client, loop)
+    required = {
+        "id": {
+            "dict_key": "id",
+            "type": str
+        },
+        "sender_username": {
+            "dict_key": "senderUsername",
+            "type": str
+        },
+        "sender_user_id": {
+            "dict_key": "sendUserId",
+            "type": str
+        },
+        "type": {
+            "dict_key": "type",
+            "type": str
+        },
+        "created_at": {
+            "dict_key": "created_at",
+            "type": str
+        }
+    }
+
+    optional = {
+        "details": {
+            "dict_key": "details",
+            "type": dict
+        },
+        "message": {
+            "dict_key": "message",
+            "type": str
+        },
+        "seen": {
+            "dict_key": "seen",
+            "type": bool
+        }
+    }
+
+    detail_required = {}
 
-        self.required.update({
-            "id": {
-                "dict_key": "id",
-                "type": str
-            },
-            "sender_username": {
-                "dict_key": "senderUsername",
-                "type": str
-            },
-            "sender_user_id": {
-                "dict_key": "sendUserId",
-                "type": str
-            },
-            "type": {
-                "dict_key": "type",
-                "type": str
-            },
-            "created_at": {
-                "dict_key": "created_at",
-                "type": str
-            }
-        })
-
-        self.optional.update({
-            "details": {
-                "dict_key": "details",
-                "type": dict
-            },
-            "message": {
-                "dict_key": "message",
-                "type": str
-            },
-            "seen": {
-                "dict_key": "seen",
-                "type": bool
-            }
-        })
-
-        self.detail_required = {}
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._detail_schema = Schema(cls.detail_required, {})
 
     def _assign(self, obj):
         super()._assign(obj)
 
         if "details" in obj and obj["details"] is not None:
-            self.required = self.detail_required
-            self.optional = {}
-
-            super()._assign(obj["details"])
-
-        del self.detail_required
+            self._apply(obj["details"], self._detail_schema)
 
     @staticmethod
     def build_notification(client, obj, loop=None):
@@ -102,52 +98,52 @@ class BaseNotification(BaseObject):
 class InviteNotification(BaseNotification):
     """Represents a VRChat world invite"""
 
+    detail_required = {
+        "world_id": {
+            "dict_key": "worldId",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, loop)
 
-        self.detail_required.update({
-            "world_id": {
-                "dict_key": "worldId",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
 
 class RequestInviteNotification(BaseNotification):
     """Represents a VRChat world invite request"""
 
+    detail_required = {
+        "platform": {
+            "dict_key": "platform",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, loop)
 
-        self.detail_required.update({
-            "platform": {
-                "dict_key": "platform",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
 
 class RequestInviteResponseNotification(BaseNotification):
     """Represents a VRChat world-invite-request response"""
 
+    detail_required = {
+        "in_response_to": {
+            "dict_key": "inResponseTo",
+            "type": str
+        },
+        "response_message": {
+            "dict_key": "responseMessage",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, loop)
 
-        self.detail_required.update({
-            "in_response_to": {
-                "dict_key": "inResponseTo",
-                "type": str
-            },
-            "response_message": {
-                "dict_key": "responseMessage",
-                "type": str
-            }
-        })
-
 
 class FriendRequestNotification(BaseNotification):
     """Represents a VRChat friend request"""
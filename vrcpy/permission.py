@@ -2,28 +2,28 @@ from vrcpy.baseobject import BaseObject
 
 
 class BasePermission(BaseObject):
+    required = {
+        "id": {
+            "dict_key": "id",
+            "type": str
+        },
+        "data": {
+            "dict_key": "data",
+            "type": dict
+        },
+        "owner_id": {
+            "dict_key": "ownerId",
+            "type": str
+        },
+        "name": {
+            "dict_key": "name",
+            "type": str
+        }
+    }
+
     def __init__(self, client, loop=None):
         super().__init__(client, loop=loop)
 
-        self.required.update({
-            "id": {
-                "dict_key": "id",
-                "type": str
-            },
-            "data": {
-                "dict_key": "data",
-                "type": dict
-            },
-            "owner_id": {
-                "dict_key": "ownerId",
-                "type": str
-            },
-            "name": {
-                "dict_key": "name",
-                "type": str
-            }
-        })
-
     @staticmethod
     def build_permission(client, obj, loop=None):
         switch = {
@@ -0,0 +1,217 @@
+from vrcpy.client import Client
+from vrcpy.cache import ResponseCache
+from vrcpy.request import Transport, RateLimiter, Scheduler
+
+import logging
+import asyncio
+
+
+class ClientPool:
+    """
+    Several VRChat accounts in one process, sharing a connection pool, rate
+    limiter, scheduler, circuit breaker and a cache of public objects.
+    Each :class:`vrcpy.Client` keeps its own session and cookie jar,
+    so ``me``, ``friends`` and ``favorites`` stay per account
+
+    Keyword Arguments
+    ------------------
+    loop: :class:`asyncio.AbstractEventLoop`
+        Event loop clients will create new asyncio tasks in.
+        Defaults to ``None``
+    transport: :class:`vrcpy.request.Transport`
+        Transport every client uses, it should be ``shared``.
+        Defaults to ``None`` (``Transport(limit=0, shared=True)``, every
+        websocket holds a connection, so http concurrency is bounded
+        by ``scheduler`` instead)
+    ratelimiter: :class:`vrcpy.request.RateLimiter`
+        Rate budget shared by every account.
+        Defaults to ``None`` (a new unconfigured limiter)
+    scheduler: :class:`vrcpy.request.Scheduler`
+        Concurrency limits shared by every account.
+        Defaults to ``None`` (default :class:`vrcpy.request.Scheduler`)
+    breaker: :class:`vrcpy.request.CircuitBreaker`
+        Circuit breaker shared by every account.
+        Defaults to ``None`` (requests are never failed fast)
+    cache: :class:`vrcpy.cache.ResponseCache`
+        Cache shared by every account.
+        Defaults to ``None`` (worlds, instances and avatars, see ``ClientPool.public_ttls``).
+        User profiles aren't shared by default since fields like location
+        depend on the account fetching them
+    **kwargs: :class:`Any`
+        Passed to every :class:`vrcpy.Client`, like ``codec`` or ``tracer``
+
+    Attributes
+    -----------
+    clients: :class:`dict`
+        Clients by the name they were added with
+    """
+
+    public_ttls = {
+        "/worlds/{id}": 300,
+        "/worlds/{id}/{id}": 30,
+        "/avatars/{id}": 300
+    }
+
+    def __init__(self, loop=None, transport=None, ratelimiter=None,
+                 scheduler=None, breaker=None, cache=None, **kwargs):
+        self.loop = loop or asyncio.get_event_loop()
+        self.transport = transport or Transport(limit=0, shared=True)
+        self.ratelimiter = ratelimiter or RateLimiter()
+        self.scheduler = scheduler or Scheduler()
+        self.breaker = breaker
+        self.cache = cache or ResponseCache(ttls=dict(self.public_ttls))
+        self.kwargs = kwargs
+
+        self.clients = {}
+        self.api_key = None
+        self._api_key_task = None
+
+    def __getitem__(self, name):
+        return self.clients[name]
+
+    def __contains__(self, name):
+        return name in self.clients
+
+    def __iter__(self):
+        return iter(self.clients.values())
+
+    def __len__(self):
+        return len(self.clients)
+
+    def add(self, name, **kwargs):
+        """
+        Creates a client using the pools shared resources, returns :class:`vrcpy.Client`
+
+        Arguments
+        ----------
+        name: :class:`str`
+            Name to find the client by in ``ClientPool.clients``
+        **kwargs: :class:`Any`
+            Passed to :class:`vrcpy.Client`, over the pools own kwargs
+        """
+
+        if name in self.clients:
+            raise ValueError("Client %s already in pool" % name)
+
+        options = dict(self.kwargs)
+        options.update(kwargs)
+
+        client = Client(
+            loop=self.loop, transport=self.transport,
+            ratelimiter=self.ratelimiter, scheduler=self.scheduler,
+            breaker=self.breaker, cache=self.cache, **options)
+
+        # The api key is the same for every account
+        client.request.api_key = self.api_key
+
+        self.clients[name] = client
+        return client
+
+    async def _share_api_key(self, client):
+        # Accounts logging in at once wait on a single /config fetch
+        if self.api_key is None:
+            if self._api_key_task is None:
+                self._api_key_task = asyncio.ensure_future(
+                    client.request.fetch_api_key())
+
+            task = self._api_key_task
+            try:
+                self.api_key = await asyncio.shield(task)
+            finally:
+                if self._api_key_task is task and self.api_key is None:
+                    self._api_key_task = None
+
+        client.request.api_key = self.api_key
+
+    async def login(self, name, username, password, mfa=None, **kwargs):
+        """
+        Logs in an account, adding a client for it if needed, returns :class:`vrcpy.Client`
+
+        Arguments
+        ----------
+        name: :class:`str`
+            Name of the client
+        username: :class:`str`
+            Username/email of VRChat account
+        password: :class:`str`
+            Password of VRChat account
+
+        Keyword Arguments
+        ------------------
+        mfa: :class:`str`
+            One Time Password (OTP, recovery code) or Temporary One Time Password (TOTP, MFA code) to verify auth cookie
+        **kwargs: :class:`Any`
+            Passed to :class:`vrcpy.Client` if it's created
+        """
+
+        client = self.clients.get(name) or self.add(name, **kwargs)
+        await self._share_api_key(client)
+
+        await client.login(username, password, mfa)
+        return client
+
+    async def login_auth_token(self, name, token, **kwargs):
+        """
+        Logs in an account with a pre-existing auth token, adding a client
+        for it if needed, returns :class:`vrcpy.Client`
+
+        Arguments
+        ----------
+        name: :class:`str`
+            Name of the client
+        token: :class:`str`
+            Pre-existing auth token to login with
+
+        Keyword Arguments
+        ------------------
+        **kwargs: :class:`Any`
+            Passed to :class:`vrcpy.Client` if it's created
+        """
+
+        client = self.clients.get(name) or self.add(name, **kwargs)
+        await self._share_api_key(client)
+
+        await client.login_auth_token(token)
+        return client
+
+    async def remove(self, name, unauth=True):
+        """
+        Logs out a client and removes it from the pool
+
+        Arguments
+        ----------
+        name: :class:`str`
+            Name of the client
+
+        Keyword Arguments
+        ------------------
+        unauth: :class:`bool`
+            If the auth cookie should be un-authenticated/destroyed.
+            Defaults to ``True``
+        """
+
+        client = self.clients.pop(name)
+        logging.debug("Removing client %s from pool" % name)
+
+        if self.breaker:
+            self.breaker.listeners.remove(client._on_circuit_change)
+
+        if client.me is not None:
+            await client.logout(unauth)
+        else:
+            await client.request.close_session()
+
+    async def close(self, unauth=False):
+        """
+        Logs out every client and closes the shared connection pool
+
+        Keyword Arguments
+        ------------------
+        unauth: :class:`bool`
+            If auth cookies should be un-authenticated/destroyed.
+            Defaults to ``False``
+        """
+
+        await asyncio.gather(*[
+            self.remove(name, unauth) for name in list(self.clients)])
+        await self.transport.close()
@@ -0,0 +1,211 @@
+import gzip
+import json
+import time
+import base64
+import asyncio
+import logging
+
+from collections import deque
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from vrcpy.errors import RequestErrors
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+def _key(method, path, params=None):
+    params = tuple(sorted(
+        (k, str(v)) for k, v in (params or {}).items() if k != "apiKey"))
+
+    return (method, path, params)
+
+
+class Recorder:
+    """
+    Records every request/response pair made by :class:`vrcpy.request.Request`
+    to a JSON lines file, one object per exchange, gzipped if ``path`` ends
+    in ``.gz``
+
+    Recordings hold response bodies as-is, including auth tokens and
+    the apiKey from ``/config``, treat them like credentials.
+    ``"stream"`` mode bodies aren't read by vrcpy, so they're recorded empty
+
+    Keyword Arguments
+    ------------------
+    headers: :class:`tuple`
+        Response headers kept in the recording.
+        Defaults to the ones vrcpy reads
+    """
+
+    headers = ("Content-Type", "ETag", "Last-Modified", "Retry-After",
+               "X-RateLimit-Remaining", "X-RateLimit-Reset")
+
+    def __init__(self, path, headers=None):
+        self.path = path
+        self.headers = headers or self.headers
+        self.start = time.monotonic()
+        self.count = 0
+
+        self._file = _open(path, "w")
+
+    def record(self, method, path, params, status, headers, body,
+               headers_time=0, total_time=0):
+        """
+        Writes one exchange, ``body`` is the raw response ``bytes``
+        or ``None`` when it wasn't read
+        """
+
+        entry = {
+            "method": method,
+            "path": path,
+            "params": {k: str(v) for k, v in (params or {}).items()
+                       if k != "apiKey"},
+            "status": status,
+            "headers": {h: headers[h] for h in self.headers if h in headers},
+            "at": round(time.monotonic() - self.start, 6),
+            "headers_time": round(headers_time, 6),
+            "total_time": round(total_time, 6)
+        }
+
+        if body is not None:
+            try:
+                entry["body"] = body.decode("utf-8")
+            except UnicodeDecodeError:
+                entry["body64"] = base64.b64encode(body).decode()
+
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class _Content:
+    """Minimal stand-in for :class:`aiohttp.StreamReader` over a recorded body"""
+
+    def __init__(self, body):
+        self._body = body
+        self._offset = 0
+
+    async def read(self, n=-1):
+        if n < 0:
+            n = len(self._body) - self._offset
+
+        data = self._body[self._offset:self._offset + n]
+        self._offset += len(data)
+        return data
+
+    async def iter_chunked(self, n):
+        while True:
+            chunk = await self.read(n)
+            if not chunk:
+                break
+
+            yield chunk
+
+
+class RecordedResponse:
+    """Recorded response with the parts of :class:`aiohttp.ClientResponse` vrcpy uses"""
+
+    def __init__(self, entry):
+        self.method = entry["method"]
+        self.status = entry["status"]
+        self.headers = CIMultiDictProxy(CIMultiDict(entry["headers"]))
+
+        if "body64" in entry:
+            self._body = base64.b64decode(entry["body64"])
+        else:
+            self._body = entry.get("body", "").encode("utf-8")
+
+        self.content = _Content(self._body)
+
+    async def read(self):
+        return self._body
+
+    async def text(self, encoding="utf-8"):
+        return self._body.decode(encoding)
+
+    async def json(self, loads=json.loads, **kwargs):
+        return loads(self._body)
+
+    def release(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+class Replayer:
+    """
+    Serves responses from a :class:`Recorder` file instead of the network
+
+    Requests are matched by method, path and params (ignoring apiKey), in
+    recorded order. When a request is made more often than it was recorded
+    the last recorded response is served again
+
+    Keyword Arguments
+    ------------------
+    latency: :class:`str`
+        ``"original"`` to wait as long as the recorded request took,
+        ``"none"`` to answer immediately.
+        Defaults to ``"original"``
+    """
+
+    def __init__(self, path, latency="original"):
+        if latency not in ("original", "none"):
+            raise ValueError("latency must be 'original' or 'none'")
+
+        self.path = path
+        self.latency = latency
+        self.count = 0
+
+        self._entries = {}
+        self._last = {}
+
+        with _open(path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                entry = json.loads(line)
+                key = _key(entry["method"], entry["path"], entry["params"])
+                self._entries.setdefault(key, deque()).append(entry)
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    async def replay(self, method, path, params=None):
+        """Returns the next :class:`RecordedResponse` for this request"""
+
+        key = _key(method, path, params)
+        entries = self._entries.get(key)
+
+        if entries:
+            entry = entries.popleft()
+            self._last[key] = entry
+        elif key in self._last:
+            entry = self._last[key]
+        else:
+            raise RequestErrors.NotRecorded(
+                "No recorded response for %s %s %s" % (method, path, dict(key[2])))
+
+        logging.debug("Replaying %s %s" % (method, path))
+
+        if self.latency == "original" and entry["total_time"] > 0:
+            await asyncio.sleep(entry["total_time"])
+
+        self.count += 1
+        return RecordedResponse(entry)
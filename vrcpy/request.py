@@ -1,100 +1,1256 @@
+import os
+import re
 import json
+import time
+import random
 import asyncio
 import aiohttp
 import logging
 
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit
+from email.utils import parsedate_to_datetime
+
+from vrcpy.codec import get_codec
+from vrcpy.stats import RequestStats
+from vrcpy.tracing import no_operation
 from vrcpy.errors import RequestErrors, ClientErrors, VRChatErrors
 
 
+_id_segment = re.compile(r"^([a-z]+_[0-9A-Za-z-]+|[0-9]+(~.*)?|.*[~:].*)$")
+
+
+def route_of(path):
+    """
+    Normalizes a request path into its route template,
+    ``/users/usr_xxx`` becomes ``/users/{id}``
+
+    Arguments
+    ----------
+    path: :class:`str`
+        Request path, without query string
+    """
+
+    return "/".join(
+        "{id}" if _id_segment.match(segment) else segment
+        for segment in path.split("?")[0].split("/")
+    )
+
+
+def request_key(path, params=None):
+    """Returns a hashable ``(path, params)`` key identifying a GET request"""
+
+    params = params or {}
+    return (path, tuple(sorted(
+        (param, str(params[param])) for param in params
+        if param != "apiKey")))
+
+
+def copy_data(data):
+    """
+    Returns a copy of decoded JSON that can be changed without affecting
+    the original, only dicts and lists are copied
+    """
+
+    if type(data) is dict:
+        return {key: copy_data(value) for key, value in data.items()}
+    if type(data) is list:
+        return [copy_data(value) for value in data]
+
+    return data
+
+
+def copy_response(resp):
+    """Returns a copy of a response dict with its own copy of ``data``"""
+
+    return dict(resp, data=copy_data(resp["data"]))
+
+
+class TokenBucket:
+    """
+    Token bucket used to pace requests
+
+    Keyword Arguments
+    ------------------
+    rate: :class:`int`
+        Number of requests allowed every ``per`` seconds.
+        ``None`` means the bucket never runs out, but can still be blocked by a 429.
+        Defaults to ``None``
+    per: :class:`float`
+        Length of the bucket window in seconds.
+        Defaults to ``1.0``
+    """
+
+    def __init__(self, rate=None, per=1.0):
+        self.rate = rate
+        self.per = per
+
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+        self._lock = None
+
+    def _refill(self, now):
+        if self.rate is not None:
+            self.tokens = min(
+                self.rate,
+                self.tokens + (now - self.updated) * self.rate / self.per
+            )
+
+        self.updated = now
+
+    def delay(self, now=None):
+        """Returns seconds until a token is available"""
+
+        now = now or time.monotonic()
+        self._refill(now)
+
+        wait = max(self.blocked_until - now, 0)
+        if self.rate is not None and self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) * self.per / self.rate)
+
+        return wait
+
+    def block(self, seconds):
+        """Stops the bucket handing out tokens for ``seconds``"""
+
+        self.blocked_until = max(
+            self.blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        """Waits for and takes a token, callers are served in order"""
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            wait = self.delay()
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self.delay()
+
+            if self.rate is not None:
+                self.tokens -= 1
+
+
+class RateLimiter:
+    """
+    Per-route and global request rate limiter used by :class:`Request`
+
+    Keyword Arguments
+    ------------------
+    global_limit: :class:`tuple`
+        ``(requests, seconds)`` shared by every route.
+        Defaults to ``None`` (no pacing, only 429 backoff)
+    route_limits: :class:`dict`
+        Maps route templates (see :func:`route_of`) to ``(requests, seconds)``,
+        for example ``{"/users/{id}": (10, 1)}``.
+        Defaults to ``None``
+    default_retry_after: :class:`float`
+        Seconds to wait after a 429 which didn't say how long to wait.
+        Defaults to ``5``
+    """
+
+    def __init__(self, global_limit=None, route_limits=None,
+                 default_retry_after=5):
+        self.default_retry_after = default_retry_after
+
+        self.global_bucket = TokenBucket(*(global_limit or ()))
+        self.route_buckets = {}
+
+        for route in route_limits or {}:
+            self.route_buckets[route] = TokenBucket(*route_limits[route])
+
+    def _buckets(self, path):
+        route = route_of(path)
+        if route in self.route_buckets:
+            return [self.route_buckets[route], self.global_bucket]
+
+        return [self.global_bucket]
+
+    async def acquire(self, path):
+        """Waits until a request to ``path`` is allowed to be sent"""
+
+        for bucket in self._buckets(path):
+            await bucket.acquire()
+
+    def _retry_after(self, headers):
+        if "Retry-After" in headers:
+            value = headers["Retry-After"]
+
+            try:
+                return float(value)
+            except ValueError:
+                try:
+                    return parsedate_to_datetime(value).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+
+        if headers.get("X-RateLimit-Remaining") == "0" \
+                and "X-RateLimit-Reset" in headers:
+            try:
+                reset = float(headers["X-RateLimit-Reset"])
+            except ValueError:
+                return None
+
+            # Either an epoch timestamp or seconds from now
+            return reset - time.time() if reset > 1e9 else reset
+
+        return None
+
+    def _is_global(self, headers):
+        return headers.get("X-RateLimit-Global", "").lower() == "true" \
+            or headers.get("X-RateLimit-Scope", "").lower() == "global"
+
+    def update(self, path, status, headers):
+        """
+        Updates buckets from a response, returns seconds the route is blocked for
+
+        Only the route of ``path`` is blocked, unless the response has a
+        ``X-RateLimit-Global: true`` or ``X-RateLimit-Scope: global`` header
+        in which case every route is
+
+        Arguments
+        ----------
+        path: :class:`str`
+            Request path the response is for
+        status: :class:`int`
+            Response status code
+        headers: :class:`dict`
+            Response headers
+        """
+
+        wait = self._retry_after(headers)
+        if wait is None:
+            if status != 429:
+                return 0
+
+            wait = self.default_retry_after
+
+        wait = max(wait, 0)
+        if self._is_global(headers):
+            self.global_bucket.block(wait)
+
+            logging.debug("All routes blocked for %ss" % wait)
+            return wait
+
+        route = route_of(path)
+        if route not in self.route_buckets:
+            # Unpaced bucket that only exists to be blocked
+            self.route_buckets[route] = TokenBucket()
+
+        self.route_buckets[route].block(wait)
+
+        logging.debug("Route %s blocked for %ss" % (route, wait))
+        return wait
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests :class:`Request` replays, and how long it waits between them
+
+    Keyword Arguments
+    ------------------
+    retries: :class:`int`
+        Max number of retries per request.
+        Defaults to ``1``
+    rules: :class:`dict`
+        Maps http methods to the status codes they are retried on.
+        Methods not in ``rules`` are only retried if the request never left the client.
+        Defaults to retrying ``GET``, ``HEAD``, ``PUT`` and ``DELETE`` on 500, 502, 503 and 504
+    never_retry: :class:`tuple`
+        Route templates (see :func:`route_of`) that are never replayed whatever the method
+    backoff: :class:`float`
+        Base delay in seconds, attempt ``n`` waits a random time up to ``backoff * 2 ** n``.
+        Defaults to ``0.5``
+    max_backoff: :class:`float`
+        Upper bound of a single retry delay in seconds.
+        Defaults to ``30``
+    budget_ratio: :class:`float`
+        Retries allowed per normal request, retries stop once the budget is spent.
+        Defaults to ``0.1``
+    budget_max: :class:`float`
+        Most retries that can be banked, also the budget a new client starts with.
+        Defaults to ``10``
+    """
+
+    idempotent_statuses = (500, 502, 503, 504)
+    exceptions = (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        aiohttp.ContentTypeError,
+        asyncio.TimeoutError,
+        ConnectionResetError
+    )
+
+    def __init__(self, retries=1, rules=None, never_retry=None, backoff=0.5,
+                 max_backoff=30, budget_ratio=0.1, budget_max=10):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.rules = rules if rules is not None else {
+            "GET": self.idempotent_statuses,
+            "HEAD": self.idempotent_statuses,
+            "PUT": self.idempotent_statuses,
+            "DELETE": self.idempotent_statuses
+        }
+
+        self.never_retry = never_retry if never_retry is not None else (
+            "/favorites",
+            "/user/{id}/friendRequest",
+            "/auth/user/friendRequest",
+            "/auth/user/playermoderations",
+            "/auth/user/blocks"
+        )
+
+        self.budget_ratio = budget_ratio
+        self.budget_max = budget_max
+        self.budget = budget_max
+
+    def record_request(self):
+        """Adds to the retry budget, called once per non-retried request"""
+
+        self.budget = min(self.budget + self.budget_ratio, self.budget_max)
+
+    def should_retry(self, method, path, attempt, status=None, error=None):
+        """
+        Returns if a request should be sent again, spending retry budget if so
+
+        Arguments
+        ----------
+        method: :class:`str`
+            Http method of the request
+        path: :class:`str`
+            Request path
+        attempt: :class:`int`
+            Number of retries already done for this request
+
+        Keyword Arguments
+        ------------------
+        status: :class:`int`
+            Response status code, if a response was received
+        error: :class:`Exception`
+            Exception raised while sending, if no response was received
+        """
+
+        if attempt >= self.retries or route_of(path) in self.never_retry:
+            return False
+
+        if error is not None:
+            # Couldn't connect, so the request was never sent
+            if isinstance(error, aiohttp.ClientConnectorError):
+                retry = True
+            else:
+                retry = method in self.rules and isinstance(
+                    error, self.exceptions)
+        else:
+            retry = status in self.rules.get(method, ())
+
+        if not retry:
+            return False
+
+        if self.budget < 1:
+            logging.debug("Retry budget spent, not retrying %s %s" % (
+                method, path))
+            return False
+
+        self.budget -= 1
+        return True
+
+    def delay(self, attempt):
+        """Returns seconds to wait before retry ``attempt`` (full jitter)"""
+
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Per-host and per-route circuit breaker used by :class:`Request`,
+    off unless one is passed as ``breaker``
+
+    A circuit opens once enough of its recent requests failed, then every
+    request to it fails fast with :class:`vrcpy.errors.VRChatErrors.CircuitOpen`
+    until ``cooldown`` passes. It then goes half-open, letting ``probes``
+    trial requests through, closing if they succeed or opening again if not
+
+    Keyword Arguments
+    ------------------
+    threshold: :class:`float`
+        Failed share of requests in ``window`` that opens a circuit.
+        Defaults to ``0.5``
+    min_requests: :class:`int`
+        Requests needed in ``window`` before a circuit can open.
+        Defaults to ``20``
+    window: :class:`float`
+        Seconds of request outcomes considered.
+        Defaults to ``30``
+    cooldown: :class:`float`
+        Seconds a circuit stays open before probing.
+        Defaults to ``30``
+    probes: :class:`int`
+        Trial requests allowed at once while half-open.
+        Defaults to ``1``
+    statuses: :class:`tuple`
+        Response status codes counted as failures, besides connection errors.
+        Defaults to 500, 502, 503 and 504
+
+    Attributes
+    -----------
+    listeners: :class:`list`
+        Functions called with ``(circuit, old_state, new_state)`` when a
+        circuit changes state, ``circuit`` is a host or route template
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, threshold=0.5, min_requests=20, window=30, cooldown=30,
+                 probes=1, statuses=(500, 502, 503, 504)):
+        self.threshold = threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.cooldown = cooldown
+        self.probes = probes
+        self.statuses = statuses
+
+        self.listeners = []
+
+        # circuit: {"state", "outcomes", "opened", "probing"}
+        self.circuits = {}
+
+    def _circuit(self, name):
+        if name not in self.circuits:
+            self.circuits[name] = {"state": self.CLOSED, "outcomes": deque(),
+                                   "opened": 0, "probing": 0}
+
+        return self.circuits[name]
+
+    def _set_state(self, name, circuit, state):
+        old = circuit["state"]
+        circuit["state"] = state
+
+        if state == self.OPEN:
+            circuit["opened"] = time.monotonic()
+        circuit["outcomes"].clear()
+
+        if old == state:
+            return
+
+        logging.debug("Circuit %s %s -> %s" % (name, old, state))
+        for listener in self.listeners:
+            try:
+                listener(name, old, state)
+            except Exception as e:
+                logging.error("Circuit listener failed: %s" % repr(e))
+
+    def state(self, name):
+        """Returns the state of the circuit for a host or route template"""
+
+        if name not in self.circuits:
+            return self.CLOSED
+
+        return self.circuits[name]["state"]
+
+    def before(self, host, path):
+        """
+        Raises :class:`vrcpy.errors.VRChatErrors.CircuitOpen` if a request to
+        ``path`` on ``host`` can't be sent now, else reserves a probe if needed
+        """
+
+        now = time.monotonic()
+        names = (host, route_of(path))
+        circuits = [self._circuit(name) for name in names]
+
+        for name, circuit in zip(names, circuits):
+            if circuit["state"] == self.OPEN \
+                    and now - circuit["opened"] >= self.cooldown:
+                self._set_state(name, circuit, self.HALF_OPEN)
+
+            if circuit["state"] == self.OPEN or (
+                    circuit["state"] == self.HALF_OPEN
+                    and circuit["probing"] >= self.probes):
+                raise VRChatErrors.CircuitOpen(
+                    "Circuit for %s is open, not sending request" % name)
+
+        for circuit in circuits:
+            if circuit["state"] == self.HALF_OPEN:
+                circuit["probing"] += 1
+
+    def record(self, host, path, failed=None):
+        """
+        Records the outcome of a request allowed by :meth:`before`,
+        ``failed=None`` only releases a reserved probe
+        """
+
+        now = time.monotonic()
+
+        for name in (host, route_of(path)):
+            circuit = self._circuit(name)
+
+            if circuit["state"] == self.HALF_OPEN:
+                circuit["probing"] = max(circuit["probing"] - 1, 0)
+
+                if failed is not None:
+                    self._set_state(
+                        name, circuit, self.OPEN if failed else self.CLOSED)
+                continue
+
+            if failed is None or circuit["state"] != self.CLOSED:
+                continue
+
+            outcomes = circuit["outcomes"]
+            outcomes.append((now, failed))
+            while outcomes and now - outcomes[0][0] > self.window:
+                outcomes.popleft()
+
+            if len(outcomes) >= self.min_requests:
+                failures = sum(1 for outcome in outcomes if outcome[1])
+                if failures / len(outcomes) >= self.threshold:
+                    self._set_state(name, circuit, self.OPEN)
+
+
+class Transport:
+    """
+    Connection pool and timeout settings for the aiohttp session used by :class:`Request`
+
+    Keyword Arguments
+    ------------------
+    limit: :class:`int`
+        Max number of open connections, ``0`` for no limit.
+        Defaults to ``100``
+    limit_per_host: :class:`int`
+        Max number of open connections to one host, ``0`` for no limit.
+        Defaults to ``0``
+    keepalive_timeout: :class:`float`
+        Seconds an idle connection is kept open for reuse.
+        Defaults to ``15``
+    ttl_dns_cache: :class:`float`
+        Seconds resolved hosts are cached for, ``None`` caches forever.
+        Defaults to ``10``
+    aiodns: :class:`bool`
+        Resolve hosts with aiodns (``vrcpy[aquick]``), falls back to
+        the default resolver if it isn't installed.
+        Defaults to ``False``
+    total_timeout: :class:`float`
+        Seconds a whole request may take, including reading the body.
+        Defaults to ``60``
+    connect_timeout: :class:`float`
+        Seconds to wait for a pooled connection, including connecting.
+        Defaults to ``None``
+    sock_connect_timeout: :class:`float`
+        Seconds to wait for a new socket to connect.
+        Defaults to ``10``
+    sock_read_timeout: :class:`float`
+        Seconds to wait between reads from a socket.
+        Defaults to ``30``
+    connector: :class:`aiohttp.BaseConnector`
+        Existing connector to use, so several clients share one pool.
+        It isn't closed with the client.
+        Defaults to ``None``
+    session: :class:`aiohttp.ClientSession`
+        Existing session to use, it isn't closed with the client.
+        Clients sharing a session also share cookies, so only one can be logged in.
+        Defaults to ``None``
+    shared: :class:`bool`
+        Create one connector on first use and give it to every session this
+        transport creates, so clients using it share a pool but not cookies.
+        Close it with :meth:`close`.
+        Defaults to ``False``
+    """
+
+    def __init__(self, limit=100, limit_per_host=0, keepalive_timeout=15,
+                 ttl_dns_cache=10, aiodns=False, total_timeout=60,
+                 connect_timeout=None, sock_connect_timeout=10,
+                 sock_read_timeout=30, connector=None, session=None,
+                 shared=False):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.aiodns = aiodns
+
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout,
+            connect=connect_timeout,
+            sock_connect=sock_connect_timeout,
+            sock_read=sock_read_timeout
+        )
+
+        self.connector = connector
+        self.session = session
+        self.shared = shared
+        self._owns_connector = False
+
+    def _resolver(self):
+        if not self.aiodns:
+            return None
+
+        try:
+            import aiodns  # noqa: F401
+        except ImportError:
+            logging.debug("aiodns not installed, using default resolver")
+            return None
+
+        return aiohttp.AsyncResolver()
+
+    def create_connector(self):
+        """Creates a new connector with this transports pool settings"""
+
+        kwargs = {}
+        resolver = self._resolver()
+        if resolver is not None:
+            kwargs["resolver"] = resolver
+
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            **kwargs
+        )
+
+    def create_session(self, headers=None, trace_configs=None):
+        """
+        Returns ``(session, owned)``, where ``owned`` is if
+        the session should be closed with the client.
+        ``trace_configs`` can't be added to a passed in session
+        """
+
+        if self.session is not None:
+            return self.session, False
+
+        if self.shared and self.connector is None:
+            self.connector = self.create_connector()
+            self._owns_connector = True
+
+        if self.connector is not None:
+            return aiohttp.ClientSession(
+                connector=self.connector,
+                connector_owner=False,
+                timeout=self.timeout,
+                headers=headers,
+                trace_configs=trace_configs
+            ), True
+
+        return aiohttp.ClientSession(
+            connector=self.create_connector(),
+            timeout=self.timeout,
+            headers=headers,
+            trace_configs=trace_configs
+        ), True
+
+    async def close(self):
+        """Closes the connector created by a ``shared`` transport"""
+
+        if self._owns_connector and self.connector is not None:
+            await self.connector.close()
+            self.connector = None
+            self._owns_connector = False
+
+
+class Scheduler:
+    """
+    Bounds how many requests of each priority class :class:`Request` sends at once,
+    so bulk work can't use up every connection
+
+    Keyword Arguments
+    ------------------
+    limits: :class:`dict`
+        Maps priority class names to max concurrent requests.
+        Defaults to ``Scheduler.default_limits``
+    default: :class:`str`
+        Priority class of requests that don't pass one.
+        Defaults to ``"normal"``
+    """
+
+    default_limits = {
+        "interactive": 32,
+        "normal": 16,
+        "bulk": 8
+    }
+
+    def __init__(self, limits=None, default="normal"):
+        self.limits = limits if limits is not None else dict(self.default_limits)
+        self.default = default
+
+        self._semaphores = {}
+
+    def slot(self, priority=None):
+        """
+        Returns the semaphore for ``priority``, to be used with ``async with``
+
+        Arguments
+        ----------
+        priority: :class:`str`
+            Priority class name, ``None`` for the default class
+        """
+
+        priority = priority or self.default
+        if priority not in self.limits:
+            raise ValueError("Unknown request priority " + priority)
+
+        if priority not in self._semaphores:
+            self._semaphores[priority] = asyncio.Semaphore(self.limits[priority])
+
+        return self._semaphores[priority]
+
+
 class Request:
     request_retries = 1
+    rate_limit_retries = 3
+    max_validators = 1024
 
-    def __init__(self, loop=None, user_agent=None, verify=True):
+    def __init__(self, loop=None, user_agent=None, verify=True,
+                 ratelimiter=None, retry_policy=None, config_cache=None,
+                 config_ttl=3600, transport=None, coalesce=True, cache=None,
+                 conditional=True, codec=None, scheduler=None,
+                 stats_hook=None, tracer=None, recorder=None, replayer=None,
+                 breaker=None):
         self.verify = verify
         self.loop = loop or asyncio.get_event_loop()
         self.user_agent = user_agent or "AIOHTTP/%s (VRCPy)" % aiohttp.__version__
+        self.ratelimiter = ratelimiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy(self.request_retries)
+        self.breaker = breaker
+
+        self.config_cache = config_cache
+        self.config_ttl = config_ttl
+        self.transport = transport or Transport()
+        self.coalesce = coalesce
+        self.cache = cache
+        self.conditional = conditional
+        self.codec = get_codec(codec)
+        self.scheduler = scheduler or Scheduler()
+
+        self.tracer = tracer
+        self.recorder = recorder
+        self.replayer = replayer
+        self.metrics = RequestStats()
+        if stats_hook is not None:
+            self.metrics.hooks.append(stats_hook)
 
         self.session = None
+        self._owns_session = True
         self.api_key = None
+        self.config = None
         self.base = "https://api.vrchat.cloud/api/1"
 
-    async def _caller(self, method, path, *args, **kwargs):
-        if self.api_key is None:
-            async with self.session.get(self.base + "/config") as resp:
-                assert resp.status == 200
+        self._config_task = None
+        self._inflight = {}
+
+        # key: (etag, last_modified, data)
+        self._validators = OrderedDict()
+
+    def _read_config_cache(self):
+        if self.config_cache is None or not os.path.isfile(self.config_cache):
+            return None
+
+        try:
+            with open(self.config_cache) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cached.get("base") != self.base \
+                or time.time() - cached.get("fetched", 0) > self.config_ttl:
+            return None
+
+        logging.debug("Using cached config from " + self.config_cache)
+        return cached["config"]
+
+    def _write_config_cache(self, config):
+        if self.config_cache is None:
+            return
+
+        temp = self.config_cache + ".tmp"
+        try:
+            with open(temp, "w") as f:
+                json.dump({
+                    "base": self.base,
+                    "fetched": time.time(),
+                    "config": config
+                }, f)
+
+            os.replace(temp, self.config_cache)
+        except OSError as e:
+            logging.debug("Couldn't write config cache (%s)" % e)
+
+    async def _load_config(self):
+        config = self._read_config_cache()
+
+        if config is None:
+            logging.debug("Fetching config")
 
-                j = await resp.json()
-                self.api_key = j["apiKey"]
+            resp = await self._call(
+                "GET", "/config", api_key=False, priority="interactive")
+            if resp["status"] != 200:
+                raise RequestErrors.RequestError(
+                    "Couldn't fetch config ({})".format(resp["status"]))
+
+            config = resp["data"]
+            if "apiKey" not in config:
+                raise ClientErrors.OutOfDate("apiKey not found in config")
+
+            self._write_config_cache(config)
+
+        self.config = config
+        self.api_key = config["apiKey"]
+
+    async def fetch_api_key(self):
+        """
+        Makes sure ``api_key`` is set, from the config cache or ``/config``.
+        Concurrent callers share a single fetch
+        """
+
+        if self.api_key is not None:
+            return self.api_key
+
+        if self._config_task is None:
+            self._config_task = asyncio.ensure_future(self._load_config())
+
+        task = self._config_task
+        try:
+            await asyncio.shield(task)
+        except Exception:
+            # Let the next caller try again
+            if self._config_task is task:
+                self._config_task = None
+            raise
+
+        return self.api_key
+
+    async def _caller(self, method, path, *args, mode="json", api_key=True,
+                      **kwargs):
+        # api_key is False for /config, which is where the key comes from
+        if api_key and self.api_key is None:
+            await self.fetch_api_key()
 
         if "params" in kwargs:
             for param in kwargs["params"]:
                 if type(kwargs["params"][param]) == bool:
                     kwargs["params"][param] = str(kwargs["params"][param]).lower()
 
+        key = None
+        validator = None
+        if method == "GET" and self.conditional and mode == "json":
+            key = request_key(path, kwargs.get("params"))
+            validator = self._validators.get(key)
+
+        if not api_key:
+            kwargs.setdefault("params", {})
+        elif "params" in kwargs:
             kwargs["params"]["apiKey"] = self.api_key
         else:
             kwargs["params"] = {"apiKey": self.api_key}
 
-        async with self.session.request(method, self.base + path, *args, ssl=self.verify, **kwargs) as resp:
-            resp = {"status": resp.status, "response": resp, "data": await resp.json()}
+        body = "json" in kwargs
+        if body:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+
+        if not self._owns_session or validator is not None or body:
+            headers = dict(kwargs.get("headers") or {})
+            headers.setdefault("user-agent", self.user_agent)
+
+            if body:
+                headers.setdefault("Content-Type", "application/json")
+
+            if validator is not None:
+                if validator[0] is not None:
+                    headers.setdefault("If-None-Match", validator[0])
+                if validator[1] is not None:
+                    headers.setdefault("If-Modified-Since", validator[1])
+
+            kwargs["headers"] = headers
+
+        route = route_of(path)
+        start = time.monotonic()
+
+        span = None
+        if self.tracer is not None:
+            span = self.tracer.start_request(method, route)
+            kwargs["trace_request_ctx"] = span
+
+        try:
+            if self.replayer is not None:
+                response = await self.replayer.replay(
+                    method, path, kwargs["params"])
+            else:
+                response = await self.session.request(
+                    method, self.base + path, *args, ssl=self.verify, **kwargs)
+        except Exception as e:
+            self.metrics.record_error(
+                method, route, e, time.monotonic() - start)
+
+            if span is not None:
+                span.finish(error=repr(e))
+            raise
+
+        headers_time = time.monotonic() - start
+        not_modified = False
+        size = 0
+        body = None
+
+        try:
+            if mode == "stream":
+                data = response.content
+            elif response.status == 304 and validator is not None:
+                logging.debug("GET %s not modified" % path)
+
+                self._validators.move_to_end(key)
+                data = copy_data(validator[2])
+                not_modified = True
+            else:
+                body = await response.read()
+                size = len(body)
+
+                if mode == "json":
+                    decode = span.child("decode") if span is not None else None
+                    try:
+                        data = self.codec.loads(body)
+                    except ValueError:
+                        # Error pages from proxies aren't JSON, their
+                        # status decides if the request is retried
+                        if response.status < 400:
+                            raise
+                        data = None
+
+                    if decode is not None:
+                        decode.finish()
+                elif mode == "bytes":
+                    data = body
+                else:
+                    data = None
+        except Exception as e:
+            self.metrics.record_error(
+                method, route, e, time.monotonic() - start)
+
+            if span is not None:
+                span.finish(status=response.status, error=repr(e))
+            raise
+        finally:
+            if mode != "stream":
+                response.release()
+
+        if self.recorder is not None:
+            self.recorder.record(
+                method, path, kwargs["params"], response.status,
+                response.headers, body, headers_time,
+                time.monotonic() - start)
+
+        self.metrics.record_response(
+            method, route, response.status, size, headers_time,
+            None if mode == "stream" else time.monotonic() - start)
+
+        if span is not None:
+            span.finish(status=response.status, bytes=size,
+                        not_modified=not_modified)
+
+        resp = {"status": response.status, "response": response,
+                "data": data, "not_modified": not_modified}
+        if not_modified:
             return resp
 
-    async def _call(self, method, path, *args, **kwargs):
-        if self.session is None:
-            self.session = aiohttp.ClientSession(headers={"user-agent": self.user_agent})
+        if key is not None and resp["status"] == 200:
+            self._store_validator(key, resp)
+
+        return resp
+
+    def _store_validator(self, key, resp):
+        headers = resp["response"].headers
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        if etag is None and last_modified is None:
+            self._validators.pop(key, None)
+            return
+
+        # Kept by reference, the data is read-only and copied on a 304
+        self._validators[key] = (etag, last_modified, resp["data"])
+        self._validators.move_to_end(key)
+
+        while len(self._validators) > self.max_validators:
+            self._validators.popitem(last=False)
+
+    async def _send(self, method, path, *args, **kwargs):
+        self.retry_policy.record_request()
+
+        attempt = 0
+        limited = 0
+        while True:
+            host = None
+            if self.breaker is not None:
+                host = urlsplit(self.base).netloc
+                self.breaker.before(host, path)
+
+            failed = None
+            start = time.monotonic()
 
-        resp = None
-        for attempt in range(self.request_retries + 1):
             try:
+                await self.ratelimiter.acquire(path)
+
+                waited = time.monotonic() - start
+                if waited > 0.001:
+                    self.metrics.record_rate_limit(
+                        method, route_of(path), waited)
+
                 resp = await self._caller(method, path, *args, **kwargs)
-                break
             except Exception as e:
                 if type(e) in RequestErrors.errors + ClientErrors.errors:
-                    raise e.__class__(str(e))
+                    raise
 
-                if attempt == self.request_retries:
+                failed = True
+                if not self.retry_policy.should_retry(
+                        method, path, attempt, error=e):
                     raise RequestErrors.RequestError(
-                        "{} ({} retries)".format(e, self.request_retries)
-                    )
+                        "{} ({} retries)".format(e, attempt)) from e
+            else:
+                if self.breaker is not None:
+                    failed = resp["status"] in self.breaker.statuses
+
+                wait = self.ratelimiter.update(
+                    path, resp["status"], resp["response"].headers)
+
+                if resp["status"] == 429 and limited < self.rate_limit_retries:
+                    logging.debug("Rate limited on %s %s, retrying in %ss" % (
+                        method, path, wait))
+
+                    resp["response"].release()
+                    limited += 1
+                    continue
+
+                if not self.retry_policy.should_retry(
+                        method, path, attempt, status=resp["status"]):
+                    break
+
+                resp["response"].release()
+            finally:
+                if host is not None:
+                    self.breaker.record(host, path, failed)
+
+            delay = self.retry_policy.delay(attempt)
+            logging.debug("Retrying %s %s in %.2fs (attempt %s)" % (
+                method, path, delay, attempt + 1))
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+            self.metrics.record_retry(method, route_of(path), attempt)
 
-        self.raise_for_errors(resp)
         return resp
 
+    async def _call(self, method, path, *args, mode="json", priority=None,
+                    cache_key=None, **kwargs):
+        """
+        Sends a request, returning ``{"status", "response", "data", "not_modified"}``
+
+        ``mode`` decides what ``data`` is:
+            - ``"json"``, the decoded JSON body
+            - ``"bytes"``, the raw body
+            - ``"stream"``, the unread :class:`aiohttp.StreamReader` body,
+              call ``resp["response"].release()`` when done with it
+            - ``"none"``, ``None``, the body is skipped
+
+        ``priority`` is the :class:`Scheduler` class the request waits in,
+        ``"interactive"``, ``"normal"`` or ``"bulk"``
+
+        ``cache_key`` is the :func:`request_key` to store the response under
+        in ``cache``, before errors like a 404 are raised
+        """
+
+        self.ensure_session()
+
+        async with self.scheduler.slot(priority):
+            resp = await self._send(method, path, *args, mode=mode, **kwargs)
+
+        if cache_key is not None and self.cache is not None:
+            self.cache.set(cache_key, resp)
+
+        try:
+            self.raise_for_errors(resp)
+        except Exception:
+            # Nobody gets to release an unread body once we raise
+            if mode == "stream":
+                resp["response"].release()
+            raise
+
+        return resp
+
+    def ensure_session(self):
+        """Creates ``session`` from ``transport`` if there isn't one yet, returns it"""
+
+        if self.session is None:
+            self.session, self._owns_session = self.transport.create_session(
+                headers={"user-agent": self.user_agent},
+                trace_configs=None if self.tracer is None else [
+                    self.tracer.trace_config()])
+
+        return self.session
+
+    def operation(self, name, **attributes):
+        """
+        Returns a context manager linking requests made in it to a
+        parent span named ``name``, does nothing without a tracer
+        """
+
+        if self.tracer is None:
+            return no_operation
+
+        return self.tracer.operation(name, **attributes)
+
+    def stats(self):
+        """Returns request metrics per method and route, see :class:`vrcpy.stats.RequestStats`"""
+
+        return self.metrics.snapshot()
+
     async def close_session(self):
-        await self.session.close()
+        if self.session is not None and self._owns_session:
+            await self.session.close()
+
+        self.session = None
+
+    async def _get(self, key, path, priority=None, **kwargs):
+        return await self._call(
+            "GET", path, priority=priority, cache_key=key, **kwargs)
+
+    def _shared_get(self, key, path, priority=None, **kwargs):
+        # Returns the in-flight task for key and the list counting its waiters
+        shared = self._inflight.get(key)
+        if shared is not None:
+            logging.debug("Joining in-flight GET " + path)
+            return shared
+
+        task = asyncio.ensure_future(
+            self._get(key, path, priority=priority, **kwargs))
+        shared = self._inflight[key] = (task, [0])
+
+        def done(task):
+            if self._inflight.get(key) is shared:
+                del self._inflight[key]
+
+            # Don't log unretrieved exceptions if every caller was cancelled
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(done)
+        return shared
+
+    async def get(self, path, *args, coalesce=None, cached=True,
+                  priority=None, **kwargs):
+        """
+        Sends a GET request. Identical concurrent GETs share one request
+        and one response, unless ``coalesce`` is ``False``.
+        If a :class:`vrcpy.cache.ResponseCache` is set, cacheable routes are
+        served from it unless ``cached`` is ``False``.
+        Requests with anything other than ``params`` (including a non-json ``mode``)
+        are never shared or cached.
+
+        Response data is shared with the ETag validators and the response
+        cache and must be treated as read-only, use :func:`copy_data` to get
+        a copy that can be changed. Data served from a validator or the
+        cache, or shared by several callers, is already a copy
+        """
+
+        if coalesce is None:
+            coalesce = self.coalesce
+
+        if kwargs.get("mode") == "json":
+            del kwargs["mode"]
+
+        if args or set(kwargs) - {"params"}:
+            resp = await self._call(
+                "GET", path, *args, priority=priority, **kwargs)
+            return resp
+
+        key = request_key(path, kwargs.get("params"))
+
+        if cached and self.cache is not None:
+            entry = self.cache.get(key)
+
+            if entry is not None:
+                resp, fresh = entry
+                if not fresh:
+                    logging.debug("Revalidating stale GET " + path)
+                    self._shared_get(key, path, priority="bulk", **kwargs)
+
+                # Cached 404s raise like the request did
+                self.raise_for_errors(resp)
+                return copy_response(resp)
+
+        if not coalesce:
+            resp = await self._get(key, path, priority=priority, **kwargs)
+            return resp
+
+        task, waiters = self._shared_get(
+            key, path, priority=priority, **kwargs)
+        waiters[0] += 1
+        resp = await asyncio.shield(task)
+
+        # Callers sharing a request each get their own copy of the data
+        if waiters[0] > 1:
+            return copy_response(resp)
 
-    async def get(self, path, *args, **kwargs):
-        resp = await self._call("GET", path, *args, **kwargs)
         return resp
 
     async def post(self, path, *args, **kwargs):
         resp = await self._call("POST", path, *args, **kwargs)
+        if self.cache is not None:
+            self.cache.invalidate(path)
+
         return resp
 
     async def put(self, path, *args, **kwargs):
         resp = await self._call("PUT", path, *args, **kwargs)
+        if self.cache is not None:
+            self.cache.invalidate(path)
+
         return resp
 
     async def delete(self, path, *args, **kwargs):
         resp = await self._call("DELETE", path, *args, **kwargs)
+        if self.cache is not None:
+            self.cache.invalidate(path)
+
         return resp
 
     async def patch(self, path, *args, **kwargs):
         resp = await self._call("PATCH", path, *args, **kwargs)
+        if self.cache is not None:
+            self.cache.invalidate(path)
+
         return resp
 
     def raise_for_errors(self, resp):
         def on_200():
-            if "requiresTwoFactorAuth" in resp["data"]:
+            if isinstance(resp["data"], dict) \
+                    and "requiresTwoFactorAuth" in resp["data"]:
                 raise ClientErrors.MfaRequired("Account login requires mfa")
 
+        def on_404():
+            message = "Not found"
+            if isinstance(resp["data"], dict) \
+                    and isinstance(resp["data"].get("error"), dict):
+                message = resp["data"]["error"].get("message", message)
+
+            raise RequestErrors.NotFound(message)
+
         def on_429():
             raise RequestErrors.RateLimit("You are being rate limited")
 
+        def on_503():
+            raise VRChatErrors.ServiceUnavailable("VRChat is unavailable")
+
         switch = {
             200: on_200,
-            429: on_429
+            404: on_404,
+            429: on_429,
+            503: on_503
         }
 
-        if resp["status"] in switch:
-            switch[resp["status"]]()
\ No newline at end of file
+        # A 304 carries the data of an earlier 200
+        status = 200 if resp["not_modified"] else resp["status"]
+        if status in switch:
+            switch[status]()
\ No newline at end of file
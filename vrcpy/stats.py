@@ -0,0 +1,191 @@
+import logging
+
+
+class Histogram:
+    """Latency histogram with fixed buckets, values are in seconds"""
+
+    bounds = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        """Records a value"""
+
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p):
+        """
+        Returns the upper bound of the bucket the ``p`` percentile falls in,
+        or the max value if it's past the last bucket
+
+        Arguments
+        ----------
+        p: :class:`float`
+            Percentile, from 0 to 100
+        """
+
+        if self.count == 0:
+            return None
+
+        rank = self.count * p / 100
+        seen = 0
+        for i, count in enumerate(self.counts[:-1]):
+            seen += count
+            if seen >= rank:
+                return min(self.bounds[i], self.max)
+
+        return self.max
+
+    def to_dict(self):
+        """Returns the histogram as a dict"""
+
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(
+                [str(bound) for bound in self.bounds] + ["inf"], self.counts))
+        }
+
+
+class RouteStats:
+    """Request counters for one method and route template"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.statuses = {}
+        self.retries = 0
+        self.rate_limit_waits = 0
+        self.rate_limit_wait_time = 0.0
+        self.bytes_received = 0
+
+        self.headers_latency = Histogram()
+        self.total_latency = Histogram()
+
+    def to_dict(self):
+        """Returns the stats as a dict"""
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "retries": self.retries,
+            "rate_limit_waits": self.rate_limit_waits,
+            "rate_limit_wait_time": self.rate_limit_wait_time,
+            "bytes_received": self.bytes_received,
+            "headers_latency": self.headers_latency.to_dict(),
+            "total_latency": self.total_latency.to_dict()
+        }
+
+
+class RequestStats:
+    """
+    Per-route request metrics collected by :class:`vrcpy.request.Request`
+
+    Routes are keyed as ``"METHOD /route/{id}"``. Every recorded event is also
+    passed to each function in ``hooks`` as a dict with an ``"event"`` key of
+    ``"response"``, ``"error"``, ``"retry"`` or ``"rate_limit"``.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.hooks = []
+
+    def _route(self, method, route):
+        name = method + " " + route
+        if name not in self.routes:
+            self.routes[name] = RouteStats()
+
+        return self.routes[name]
+
+    def _emit(self, event):
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logging.error("Request stats hook %s failed (%s)" % (hook, e))
+
+    def record_response(self, method, route, status, size=0,
+                        headers_time=None, total_time=None):
+        """Records a received response"""
+
+        stats = self._route(method, route)
+        stats.requests += 1
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        stats.bytes_received += size
+
+        if headers_time is not None:
+            stats.headers_latency.add(headers_time)
+        if total_time is not None:
+            stats.total_latency.add(total_time)
+
+        if self.hooks:
+            self._emit({
+                "event": "response", "method": method, "route": route,
+                "status": status, "bytes": size,
+                "headers_time": headers_time, "total_time": total_time
+            })
+
+    def record_error(self, method, route, error, total_time=None):
+        """Records a request that failed without a usable response"""
+
+        stats = self._route(method, route)
+        stats.requests += 1
+        stats.errors += 1
+
+        if self.hooks:
+            self._emit({
+                "event": "error", "method": method, "route": route,
+                "error": error, "total_time": total_time
+            })
+
+    def record_retry(self, method, route, attempt):
+        """Records a retried request"""
+
+        self._route(method, route).retries += 1
+
+        if self.hooks:
+            self._emit({
+                "event": "retry", "method": method, "route": route,
+                "attempt": attempt
+            })
+
+    def record_rate_limit(self, method, route, wait):
+        """Records time spent waiting on the rate limiter"""
+
+        stats = self._route(method, route)
+        stats.rate_limit_waits += 1
+        stats.rate_limit_wait_time += wait
+
+        if self.hooks:
+            self._emit({
+                "event": "rate_limit", "method": method, "route": route,
+                "wait": wait
+            })
+
+    def snapshot(self):
+        """Returns all route stats as a dict"""
+
+        return {name: self.routes[name].to_dict() for name in self.routes}
+
+    def reset(self):
+        """Clears all recorded stats, hooks are kept"""
+
+        self.routes = {}
@@ -0,0 +1,269 @@
+import os
+import json
+import time
+import logging
+import aiohttp
+
+try:
+    import contextvars
+except ImportError:
+    # Python < 3.7, spans won't be linked to operations
+    contextvars = None
+
+
+if contextvars is not None:
+    _current_span = contextvars.ContextVar("vrcpy_span", default=None)
+else:
+    _current_span = None
+
+
+def _new_id():
+    return os.urandom(8).hex()
+
+
+class Span:
+    """
+    A timed operation, exported to the tracer sink when finished
+
+    Arguments
+    ----------
+    tracer: :class:`Tracer`
+        Tracer the span is exported through
+    name: :class:`str`
+        Name of the span
+
+    Keyword Arguments
+    ------------------
+    parent: :class:`Span`
+        Span this is part of.
+        Defaults to ``None``
+    attributes: :class:`dict`
+        Extra data exported with the span.
+        Defaults to ``None``
+    """
+
+    def __init__(self, tracer, name, parent=None, attributes=None):
+        self.tracer = tracer
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes or {}
+
+        self.trace_id = parent.trace_id if parent is not None else _new_id()
+        self.span_id = _new_id()
+
+        self.start = time.time()
+        self._start = time.monotonic()
+        self.duration = None
+
+    def child(self, name, **attributes):
+        """Starts a span that is part of this span"""
+
+        return Span(self.tracer, name, self, attributes)
+
+    def finish(self, **attributes):
+        """Ends the span and exports it, extra ``attributes`` are added to it"""
+
+        if self.duration is not None:
+            return
+
+        self.duration = time.monotonic() - self._start
+        self.attributes.update(attributes)
+        self.tracer.export(self)
+
+    def to_dict(self):
+        """Returns the span as a dict"""
+
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent is not None else None,
+            "name": self.name,
+            "start": self.start,
+            "duration": self.duration,
+            "attributes": self.attributes
+        }
+
+
+class _Operation:
+    def __init__(self, tracer, name, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+        self.span = None
+        self._token = None
+
+    def __enter__(self):
+        self.span = Span(
+            self.tracer, self.name, self.tracer.current(), self.attributes)
+
+        if _current_span is not None:
+            self._token = _current_span.set(self.span)
+
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is not None:
+            _current_span.reset(self._token)
+
+        if exc is not None:
+            self.span.finish(error=repr(exc))
+        else:
+            self.span.finish()
+
+
+class _NoOperation:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+no_operation = _NoOperation()
+
+
+class JSONLinesSink:
+    """
+    Span sink appending each span as a line of JSON to a file
+
+    Arguments
+    ----------
+    path: :class:`str`
+        File to append spans to
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def __call__(self, span):
+        if self.file is None:
+            self.file = open(self.path, "a")
+
+        self.file.write(json.dumps(span) + "\n")
+        self.file.flush()
+
+    def close(self):
+        """Closes the file"""
+
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class Tracer:
+    """
+    Emits spans for requests made by :class:`vrcpy.request.Request`, with
+    child spans for dns, connecting, waiting for the response and decoding.
+    Requests made inside :meth:`Tracer.operation` (including tasks started in it)
+    are linked to the operation span.
+
+    Arguments
+    ----------
+    sink: ``Callable``
+        Called with each finished span as a dict, for example a :class:`JSONLinesSink`
+    """
+
+    def __init__(self, sink):
+        self.sink = sink
+
+    def export(self, span):
+        """Passes a finished span to the sink"""
+
+        try:
+            self.sink(span.to_dict())
+        except Exception as e:
+            logging.error("Span sink %s failed (%s)" % (self.sink, e))
+
+    def current(self):
+        """Returns the span of the current operation, or ``None``"""
+
+        if _current_span is None:
+            return None
+
+        return _current_span.get()
+
+    def operation(self, name, **attributes):
+        """
+        Returns a context manager timing a logical operation, like ``"login"``
+
+        Arguments
+        ----------
+        name: :class:`str`
+            Name of the operation
+        """
+
+        return _Operation(self, name, attributes)
+
+    def start_request(self, method, route):
+        """Starts the span of an http request"""
+
+        return Span(self, "http %s %s" % (method, route), self.current(), {
+            "method": method,
+            "route": route
+        })
+
+    def trace_config(self):
+        """Returns an :class:`aiohttp.TraceConfig` adding phase spans to request spans"""
+
+        config = aiohttp.TraceConfig()
+
+        def phase(start, end, name):
+            async def on_start(session, ctx, params):
+                if ctx.trace_request_ctx is not None:
+                    setattr(ctx, name, ctx.trace_request_ctx.child(name))
+
+            async def on_end(session, ctx, params):
+                span = getattr(ctx, name, None)
+                if span is not None:
+                    span.finish()
+
+            start.append(on_start)
+            end.append(on_end)
+
+        phase(config.on_dns_resolvehost_start, config.on_dns_resolvehost_end, "dns")
+        phase(config.on_connection_queued_start, config.on_connection_queued_end, "connection queued")
+        phase(config.on_connection_create_start, config.on_connection_create_end, "connection create")
+
+        async def on_event(name, session, ctx, params):
+            if ctx.trace_request_ctx is not None:
+                ctx.trace_request_ctx.child(name).finish()
+
+        async def on_dns_cache_hit(session, ctx, params):
+            await on_event("dns cache hit", session, ctx, params)
+
+        async def on_reuseconn(session, ctx, params):
+            await on_event("connection reuse", session, ctx, params)
+
+        async def on_request_start(session, ctx, params):
+            if ctx.trace_request_ctx is not None:
+                ctx.response_span = ctx.trace_request_ctx.child(
+                    "response", host=params.url.host)
+
+        async def on_request_sent(session, ctx, params):
+            if ctx.trace_request_ctx is not None \
+                    and not hasattr(ctx, "request_sent"):
+                ctx.request_sent = True
+                ctx.trace_request_ctx.child("request sent").finish()
+
+        async def on_request_end(session, ctx, params):
+            span = getattr(ctx, "response_span", None)
+            if span is not None:
+                span.finish(status=params.response.status)
+
+        async def on_request_exception(session, ctx, params):
+            span = getattr(ctx, "response_span", None)
+            if span is not None:
+                span.finish(error=repr(params.exception))
+
+        config.on_dns_cache_hit.append(on_dns_cache_hit)
+        config.on_connection_reuseconn.append(on_reuseconn)
+        config.on_request_start.append(on_request_start)
+        config.on_request_chunk_sent.append(on_request_sent)
+        if hasattr(config, "on_request_headers_sent"):
+            config.on_request_headers_sent.append(on_request_sent)
+        config.on_request_end.append(on_request_end)
+        config.on_request_exception.append(on_request_exception)
+
+        return config
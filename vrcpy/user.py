@@ -10,30 +10,29 @@ from vrcpy.enum import FavoriteType, SortOrder, SortType, ReleaseStatus
 import vrcpy.util
 
 import logging
-import json
 
 
 class FriendStatus(BaseObject):
     """Represents a VRChat friend status"""
 
+    required = {
+        "incoming_request": {
+            "dict_key": "incomingRequest",
+            "type": bool
+        },
+        "is_friend": {
+            "dict_key": "isFriend",
+            "type": bool
+        },
+        "outgoing_request": {
+            "dict_key": "outgoingRequest",
+            "type": bool
+        }
+    }
+
     def __init__(self, obj, user_id):
         super(None, None)
 
-        self.required.update({
-            "incoming_request": {
-                "dict_key": "incomingRequest",
-                "type": bool
-            },
-            "is_friend": {
-                "dict_key": "isFriend",
-                "type": bool
-            },
-            "outgoing_request": {
-                "dict_key": "outgoingRequest",
-                "type": bool
-            }
-        })
-
         self.user_id = user_id
         self._assign(obj)
 
@@ -41,96 +40,102 @@ class FriendStatus(BaseObject):
 class LimitedUser(BaseObject):
     """Represents a VRChat Limited-User object"""
 
+    required = {
+        "username": {
+            "dict_key": "username",
+            "type": str
+        },
+        "display_name": {
+            "dict_key": "displayName",
+            "type": str
+        },
+        "id": {
+            "dict_key": "id",
+            "type": str
+        },
+        "avatar_image_url": {
+            "dict_key": "currentAvatarImageUrl",
+            "type": str
+        },
+        "avatar_thumbnail_url": {
+            "dict_key": "currentAvatarThumbnailImageUrl",
+            "type": str
+        },
+        "last_platform": {
+            "dict_key": "last_platform",
+            "type": str
+        },
+        "tags": {
+            "dict_key": "tags",
+            "type": list
+        },
+        "developer_type": {
+            "dict_key": "developerType",
+            "type": str
+        },
+        "is_friend": {
+            "dict_key": "isFriend",
+            "type": bool
+        },
+        "last_login": {
+            "dict_key": "last_login",
+            "type": str
+        },
+        "fallback_avatar": {
+            "dict_key": "fallbackAvatar",
+            "type": str
+        },
+        "user_icon": {
+            "dict_key": "userIcon",
+            "type": str
+        },
+        "profile_picture_override": {
+            "dict_key": "profilePicOverride",
+            "type": str
+        },
+        "friend_key": {
+            "dict_key": "friendKey",
+            "type": str
+        }
+    }
+
+    optional = {
+        "status": {
+            "dict_key": "status",
+            "type": str
+        },
+        "bio": {
+            "dict_key": "bio",
+            "type": str
+        },
+        "location": {
+            "dict_key": "location",
+            "type": str
+        },
+        "status_description": {
+            "dict_key": "statusDescription",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj=None, loop=None):
         super().__init__(client, loop=loop)
 
-        self.required.update({
-            "username": {
-                "dict_key": "username",
-                "type": str
-            },
-            "display_name": {
-                "dict_key": "displayName",
-                "type": str
-            },
-            "id": {
-                "dict_key": "id",
-                "type": str
-            },
-            "avatar_image_url": {
-                "dict_key": "currentAvatarImageUrl",
-                "type": str
-            },
-            "avatar_thumbnail_url": {
-                "dict_key": "currentAvatarThumbnailImageUrl",
-                "type": str
-            },
-            "last_platform": {
-                "dict_key": "last_platform",
-                "type": str
-            },
-            "tags": {
-                "dict_key": "tags",
-                "type": list
-            },
-            "developer_type": {
-                "dict_key": "developerType",
-                "type": str
-            },
-            "is_friend": {
-                "dict_key": "isFriend",
-                "type": bool
-            },
-            "last_login": {
-                "dict_key": "last_login",
-                "type": str
-            },
-            "fallback_avatar": {
-                "dict_key": "fallbackAvatar",
-                "type": str
-            },
-            "user_icon": {
-                "dict_key": "userIcon",
-                "type": str
-            },
-            "profile_picture_override": {
-                "dict_key": "profilePicOverride",
-                "type": str
-            },
-            "friend_key": {
-                "dict_key": "friendKey",
-                "type": str
-            }
-        })
-
-        self.optional.update({
-            "status": {
-                "dict_key": "status",
-                "type": str
-            },
-            "bio": {
-                "dict_key": "bio",
-                "type": str
-            },
-            "location": {
-                "dict_key": "location",
-                "type": str
-            },
-            "status_description": {
-                "dict_key": "statusDescription",
-                "type": str
-            }
-        })
-
         if obj is not None:
             self._assign(obj)
 
-    async def fetch_full(self):
-        """Fetches this user as a :class:`vrcpy.User` object"""
+    async def fetch_full(self, priority=None):
+        """Fetches this user as a :class:`vrcpy.User` object
+
+        Keyword Arguments
+        ------------------
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`)
+        """
 
         logging.debug("Getting User object of user " + self.username)
 
-        return await self.client.fetch_user(self.id)
+        return await self.client.fetch_user(self.id, priority=priority)
 
     async def fetch_friend_status(self):
         """Fetches this friends :class:`vrcpy.FriendStatus`"""
@@ -151,7 +156,7 @@ class LimitedUser(BaseObject):
                 "You are already friends with " + self.display_name)
 
         await self.client.request.post(
-            "/user/%s/friendRequest" % self.id)
+            "/user/%s/friendRequest" % self.id, mode="none")
 
     async def unfriend(self):
         """Unfriends this user"""
@@ -163,7 +168,7 @@ class LimitedUser(BaseObject):
                 "You are not friends with " + self.display_name)
 
         await self.client.request.delete(
-            "/auth/user/friends/" + self.id)
+            "/auth/user/friends/" + self.id, mode="none")
 
     async def favorite(self, group):
         """
@@ -226,40 +231,40 @@ class LimitedUser(BaseObject):
 class User(LimitedUser):
     """Represents a User object"""
 
-    def __init__(self, client, obj=None, loop=None):
-        super().__init__(client, loop=loop)
+    removed = ("fallback_avatar",)
 
-        self.required.update({
-            "date_joined": {
-                "dict_key": "date_joined",
-                "type": str
-            }
-        })
-
-        self.optional.update({
-            "bio_links": {
-                "dict_key": "bioLinks",
-                "type": list
-            },
-            "state": {
-                "dict_key": "state",
-                "type": str
-            },
-            "world_id": {
-                "dict_key": "worldId",
-                "type": str
-            },
-            "instance_id": {
-                "dict_key": "instanceId",
-                "type": str
-            },
-            "allow_avatar_copying": {
-                "dict_key": "allowAvatarCopying",
-                "type": bool
-            }
-        })
+    required = {
+        "date_joined": {
+            "dict_key": "date_joined",
+            "type": str
+        }
+    }
+
+    optional = {
+        "bio_links": {
+            "dict_key": "bioLinks",
+            "type": list
+        },
+        "state": {
+            "dict_key": "state",
+            "type": str
+        },
+        "world_id": {
+            "dict_key": "worldId",
+            "type": str
+        },
+        "instance_id": {
+            "dict_key": "instanceId",
+            "type": str
+        },
+        "allow_avatar_copying": {
+            "dict_key": "allowAvatarCopying",
+            "type": bool
+        }
+    }
 
-        del self.required["fallback_avatar"]
+    def __init__(self, client, obj=None, loop=None):
+        super().__init__(client, loop=loop)
 
         if obj is not None:
             self._assign(obj)
@@ -268,127 +273,134 @@ class User(LimitedUser):
 class CurrentUser(User):
     """Represents a Current User object"""
 
+    required = {
+        "past_display_names": {
+            "dict_key": "pastDisplayNames",
+            "type": list
+        },
+        "email_verified": {
+            "dict_key": "emailVerified",
+            "type": bool
+        },
+        "has_email": {
+            "dict_key": "hasEmail",
+            "type": bool
+        },
+        "has_pending_email": {
+            "dict_key": "hasPendingEmail",
+            "type": bool
+        },
+        "accepted_tos_version": {
+            "dict_key": "acceptedTOSVersion",
+            "type": int
+        },
+        "has_birthday": {
+            "dict_key": "hasBirthday",
+            "type": bool
+        },
+        "friends": {
+            "dict_key": "friends",
+            "type": list
+        },
+        "fallback_avatar": {
+            "dict_key": "fallbackAvatar",
+            "type": str
+        },
+        "online_friends": {
+            "dict_key": "onlineFriends",
+            "type": list
+        },
+        "active_friends": {
+            "dict_key": "activeFriends",
+            "type": list
+        },
+        "offline_friends": {
+            "dict_key": "offlineFriends",
+            "type": list
+        },
+        "friend_group_names": {
+            "dict_key": "friendGroupNames",
+            "type": list
+        },
+        "avatar": {
+            "dict_key": "currentAvatar",
+            "type": dict
+        },
+        "avatar_asset_url": {
+            "dict_key": "currentAvatarAssetUrl",
+            "type": str
+        },
+        "home_location": {
+            "dict_key": "homeLocation",
+            "type": str
+        },
+        "has_logged_in_from_client": {
+            "dict_key": "hasLoggedInFromClient",
+            "type": bool
+        },
+        "mfa_enabled": {
+            "dict_key": "twoFactorAuthEnabled",
+            "type": bool
+        },
+        "unsubscribe": {
+            "dict_key": "unsubscribe",
+            "type": bool
+        },
+        "status_history": {
+            "dict_key": "statusHistory",
+            "type": list
+        },
+        "status_first_time": {
+            "dict_key": "statusFirstTime",
+            "type": bool
+        }
+    }
+
+    optional = {
+        "email": {
+            "dict_key": "email",
+            "type": str
+        },
+        "obfuscated_email": {
+            "dict_key": "obfuscatedEmail",
+            "type": str
+        },
+        "obfuscated_pending_email": {
+            "dict_key": "obfuscatedPendingEmail",
+            "type": str
+        },
+        "steam_id": {
+            "dict_key": "steamId",
+            "type": str
+        },
+        "steam_details": {
+            "dict_key": "steamDetails",
+            "type": dict
+        },
+        "oculus_id": {
+            "dict_key": "oculusId",
+            "type": str
+        },
+        "account_deletion_date": {
+            "dict_key": "accountDeletionDate",
+            "type": str
+        }
+    }
+
     def __init__(self, client, obj, loop=None):
         super().__init__(client, loop=loop)
 
-        self.required.update({
-            "past_display_names": {
-                "dict_key": "pastDisplayNames",
-                "type": list
-            },
-            "email_verified": {
-                "dict_key": "emailVerified",
-                "type": bool
-            },
-            "has_email": {
-                "dict_key": "hasEmail",
-                "type": bool
-            },
-            "has_pending_email": {
-                "dict_key": "hasPendingEmail",
-                "type": bool
-            },
-            "accepted_tos_version": {
-                "dict_key": "acceptedTOSVersion",
-                "type": int
-            },
-            "has_birthday": {
-                "dict_key": "hasBirthday",
-                "type": bool
-            },
-            "friends": {
-                "dict_key": "friends",
-                "type": list
-            },
-            "fallback_avatar": {
-                "dict_key": "fallbackAvatar",
-                "type": str
-            },
-            "online_friends": {
-                "dict_key": "onlineFriends",
-                "type": list
-            },
-            "active_friends": {
-                "dict_key": "activeFriends",
-                "type": list
-            },
-            "offline_friends": {
-                "dict_key": "offlineFriends",
-                "type": list
-            },
-            "friend_group_names": {
-                "dict_key": "friendGroupNames",
-                "type": list
-            },
-            "avatar": {
-                "dict_key": "currentAvatar",
-                "type": dict
-            },
-            "avatar_asset_url": {
-                "dict_key": "currentAvatarAssetUrl",
-                "type": str
-            },
-            "home_location": {
-                "dict_key": "homeLocation",
-                "type": str
-            },
-            "has_logged_in_from_client": {
-                "dict_key": "hasLoggedInFromClient",
-                "type": bool
-            },
-            "mfa_enabled": {
-                "dict_key": "twoFactorAuthEnabled",
-                "type": bool
-            },
-            "unsubscribe": {
-                "dict_key": "unsubscribe",
-                "type": bool
-            },
-            "status_history": {
-                "dict_key": "statusHistory",
-                "type": list
-            },
-            "status_first_time": {
-                "dict_key": "statusFirstTime",
-                "type": bool
-            }
-        })
-
-        self.optional.update({
-            "email": {
-                "dict_key": "email",
-                "type": str
-            },
-            "obfuscated_email": {
-                "dict_key": "obfuscatedEmail",
-                "type": str
-            },
-            "obfuscated_pending_email": {
-                "dict_key": "obfuscatedPendingEmail",
-                "type": str
-            },
-            "steam_id": {
-                "dict_key": "steamId",
-                "type": str
-            },
-            "steam_details": {
-                "dict_key": "steamDetails",
-                "type": dict
-            },
-            "oculus_id": {
-                "dict_key": "oculusId",
-                "type": str
-            },
-            "account_deletion_date": {
-                "dict_key": "accountDeletionDate",
-                "type": str
-            }
-        })
-
         self._assign(obj)
 
-    async def fetch_friends(self, offline=False, n=100, offset=0):
-        """Fetches logged in users friends, returns list of :class:`vrcpy.LimitedUser` objects"""
+    async def fetch_friends(self, offline=False, n=100, offset=0,
+                            priority=None):
+        """Fetches logged in users friends, returns list of :class:`vrcpy.LimitedUser` objects
+
+        Keyword Arguments
+        ------------------
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`)
+        """
 
         logging.debug(
             "Fetching %s friends" % "offline" if offline else "online")
@@ -397,10 +409,11 @@ class CurrentUser(User):
             "/auth/user/friends", params={
                 "offset": offset,
                 "n": n,
-                "offline": offline})
+                "offline": offline}, priority=priority)
 
-        return [LimitedUser(
-            self.client, user, self.loop) for user in resp["data"]]
+        return [self.client.identities.build(
+            "users", LimitedUser, self.client, user, self.loop)
+            for user in resp["data"]]
 
     async def fetch_permissions(self, condensed=False):
         """Fetches users permissions, returns list of permission objects
@@ -424,7 +437,8 @@ class CurrentUser(User):
             return [BasePermission.build_permission(
                 self.client, perm, self.loop) for perm in perms["data"]]
 
-    async def fetch_favorites(self, favorite_type=None, n=100, offset=0):
+    async def fetch_favorites(self, favorite_type=None, n=100, offset=0,
+                              priority=None):
         """Fetches user favorites, returning ``favorite_type`` or a mix of all the favorite types
 
         Keyword Arguments
@@ -435,6 +449,8 @@ class CurrentUser(User):
             Number of favorites to return, max 100
         offset: :class:`int`
             Offset from start of favorites to return from
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`)
         """
 
         if n > 100:
@@ -448,13 +464,14 @@ class CurrentUser(User):
         if favorite_type is not None:
             params["type"] = favorite_type
 
-        favorites = await self.client.request.get("/favorites", params=params)
+        favorites = await self.client.request.get(
+            "/favorites", params=params, priority=priority)
         logging.debug("Fetching favorites")
 
         return [BaseFavorite.build_favorite(
             self.client, favorite, self.loop) for favorite in favorites["data"]]
 
-    async def fetch_all_favorites(self, favorite_type=None):
+    async def fetch_all_favorites(self, favorite_type=None, priority=None):
         """
         Fetches all favorites by auto-paging, returning dict with keys of :class:`vrcpy.enum.FavoriteType`.
         Using this also updates favorite cache
@@ -463,10 +480,13 @@ class CurrentUser(User):
         ------------------
         favorite_type: :class:`str`
             Type of enum.FavoriteType
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`)
         """
 
         favorites = await vrcpy.util.full_paginate(
-            self.fetch_favorites, favorite_type=favorite_type)
+            self.fetch_favorites, favorite_type=favorite_type,
+            priority=priority)
 
         favorites_dict = {
             FavoriteType.WORLD: [],
@@ -558,15 +578,17 @@ class CurrentUser(User):
             "order": order.value,
             "releaseStatus": release_status.value
         })
-        return [Avatar(
-            self.client, avatar, self.loop) for avatar in avatars["data"]]
+        return [self.client.identities.build(
+            "avatars", Avatar, self.client, avatar, self.loop)
+            for avatar in avatars["data"]]
 
     async def fetch_current_avatar(self):
         """Fetches current avatar as :class:`vrcpy.Avatar`"""
 
         avatar = await self.client.request.get("/users/%s/avatar" % self.id)
-        return Avatar(
-            self.client, json.loads(avatar["data"]["success"]["message"]),
+        return self.client.identities.build(
+            "avatars", Avatar, self.client,
+            self.client.request.codec.loads(avatar["data"]["success"]["message"]),
             self.loop)
 
     async def _update(self, **kwargs):
@@ -574,7 +596,8 @@ class CurrentUser(User):
             if kwargs[kwarg] is None:
                 kwargs[kwarg] = getattr(self, kwarg)
 
-        self.raw.update({
+        # raw may be shared with the request cache, don't change it in place
+        self.raw = dict(self.raw, **{
             "email": kwargs["email"],
             "birthday": kwargs["birthday"],
             "tags": kwargs["tags"],
@@ -600,7 +623,7 @@ class CurrentUser(User):
                            accepted_tos_version=accepted_tos_version,
                            allow_avatar_copying=allow_avatar_copying)
 
-    async def fetch_favorite_groups(self, n: int = 50):
+    async def fetch_favorite_groups(self, n: int = 50, priority=None):
         """
         Fetches favorite groups for worlds, avatars and users, returning list
 
@@ -608,9 +631,12 @@ class CurrentUser(User):
         ------------------
         n: :class:`int`
             Max number of favorites groups to fetch
+        priority: :class:`str`
+            Request priority class (see :class:`vrcpy.request.Scheduler`)
         """
 
-        resp = await self.client.request.get("/favorite/groups", params={"n": str(n)})
+        resp = await self.client.request.get(
+            "/favorite/groups", params={"n": str(n)}, priority=priority)
         groups = []
 
         for group in resp["data"]:
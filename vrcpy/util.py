@@ -1,4 +1,7 @@
-async def full_paginate(coro, *args, **kwargs):
+import asyncio
+
+
+async def full_paginate(coro, *args, concurrency=1, total=None, **kwargs):
     """
     Auto-pages coroutines that return a list
 
@@ -11,21 +14,34 @@ async def full_paginate(coro, *args, **kwargs):
         Args to pass to coro
     **kwargs: :class:`Any`
         Kwargs to pass to coro
+
+    Keyword Arguments
+    ------------------
+    concurrency: :class:`int`
+        Most pages requested at once, only used with ``total``.
+        Defaults to ``1``
+    total: :class:`int`
+        Expected number of items. Pages it says exist are requested
+        together, later pages one at a time until a page isn't full.
+        Defaults to ``None`` (every page is requested one at a time)
     """
 
     objs = []
-    kwargs["offset"] = 0
-    kwargs["n"] = 100
-    while True:
-        response = await coro(*args, **kwargs)
+    offset = 0
+    known = -(-total // 100) if total else 0
 
-        objs += response
-        kwargs["offset"] += 100
+    while True:
+        count = max(1, min(concurrency, known - offset // 100))
+        pages = await asyncio.gather(*[
+            coro(*args, **dict(kwargs, offset=offset + 100 * i, n=100))
+            for i in range(count)])
 
-        if len(response) < 100:
-            break
+        for response in pages:
+            objs += response
+            offset += 100
 
-    return objs
+            if len(response) < 100:
+                return objs
 
 
 def find_in_list_via_attribute(self, objlist, attribute, equals):
@@ -66,3 +82,121 @@ class TaskWrapReturn:
 
     async def _do_coro(self):
         self.returns = await self.coro(*self.args, **self.kwargs)
+
+
+class BulkResult:
+    """
+    Results of a :class:`BulkFetch`, in the order IDs were given
+
+    Attributes
+    -----------
+    ids: :class:`list`
+        IDs as given, duplicates included
+    results: :class:`list`
+        Fetched object for every ID in ``ids``, ``None`` where it failed
+    errors: :class:`dict`
+        Exception raised for each failed ID, like
+        :class:`vrcpy.errors.RequestErrors.NotFound` for IDs that don't exist
+    """
+
+    def __init__(self, ids, found, errors):
+        self.ids = ids
+        self.results = [found.get(id) for id in ids]
+        self.errors = errors
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __getitem__(self, index):
+        return self.results[index]
+
+
+class BulkFetch:
+    """
+    Fetches many IDs with bounded concurrency, skipping duplicates.
+    Await it for a :class:`BulkResult`, or iterate it with ``async for``
+    to get ``(id, obj, error)`` tuples as fetches complete::
+
+        users = await client.fetch_users(ids)
+
+        async for id, user, error in client.fetch_users(ids):
+            ...
+
+    Arguments
+    ----------
+    fetch: ``Callable``
+        Coroutine method called with each ID
+    ids: ``Iterable``
+        IDs to fetch
+
+    Keyword Arguments
+    ------------------
+    limit: :class:`int`
+        Most fetches running at once.
+        Defaults to ``8``
+    """
+
+    def __init__(self, fetch, ids, limit=8):
+        self.fetch = fetch
+        self.ids = list(ids)
+        self.limit = max(1, limit)
+
+    async def _run(self, queue):
+        unique = list(dict.fromkeys(self.ids))
+        pending = asyncio.Queue()
+        for id in unique:
+            pending.put_nowait(id)
+
+        async def worker():
+            while not pending.empty():
+                id = pending.get_nowait()
+
+                try:
+                    obj = await self.fetch(id)
+                except Exception as e:
+                    await queue.put((id, None, e))
+                else:
+                    await queue.put((id, obj, None))
+
+        workers = [asyncio.ensure_future(worker())
+                   for _ in range(min(self.limit, len(unique)))]
+
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+            await queue.put(None)
+
+    async def __aiter__(self):
+        queue = asyncio.Queue()
+        runner = asyncio.ensure_future(self._run(queue))
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+
+                yield item
+        finally:
+            runner.cancel()
+
+    async def _collect(self):
+        found = {}
+        errors = {}
+
+        async for id, obj, error in self:
+            if error is not None:
+                errors[id] = error
+            else:
+                found[id] = obj
+
+        return BulkResult(self.ids, found, errors)
+
+    def __await__(self):
+        return self._collect().__await__()